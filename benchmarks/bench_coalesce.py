@@ -0,0 +1,52 @@
+"""
+Many clients requesting the same game at once from threads, against the
+local stub server with a simulated network latency: every client fetching
+and parsing the game itself against all of them sharing a RequestCoalescer.
+Reports the time until every client has its game and the upstream requests
+made. Run from the repository root:
+
+    python -m benchmarks.bench_coalesce
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mlb_statsapi import GameRequest, RequestCoalescer
+from mlb_statsapi.transport import RequestsTransport
+from tests.stub_server import StubServer
+
+CLIENTS = 32
+LATENCY = 0.05
+GAME_PK = 718096
+
+
+def run(label: str, coalescer: RequestCoalescer | None) -> None:
+    with StubServer(latency=LATENCY) as server, RequestsTransport(
+        pool_size=CLIENTS, host_overrides=server.host_overrides
+    ) as transport:
+        barrier = threading.Barrier(CLIENTS)
+
+        def request(_: int) -> None:
+            barrier.wait()
+            GameRequest(
+                GAME_PK, transport=transport, coalescer=coalescer
+            ).make_request()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(CLIENTS) as executor:
+            list(executor.map(request, range(CLIENTS)))
+        elapsed = time.perf_counter() - start
+        print(f"{label:<14}{elapsed:>10.2f}{sum(server.hits.values()):>10}")
+
+
+def main() -> None:
+    print(f"{CLIENTS} clients")
+    print(f"{'':<14}{'time (s)':>10}{'requests':>10}")
+    run("independent", None)
+    run("coalesced", RequestCoalescer())
+
+
+if __name__ == "__main__":
+    main()
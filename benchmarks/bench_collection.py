@@ -0,0 +1,61 @@
+"""
+Throughput of parsing a directory of recorded feeds into a GameCollection
+with 1 to os.cpu_count() worker processes. The fixture games are copied
+under new game pks to make a larger corpus. Run from the repository root:
+
+    python -m benchmarks.bench_collection
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from mlb_statsapi import GameCollection
+
+GAME_DATA = Path("tests/game_data")
+COPIES = 16
+
+
+def write_corpus(directory: Path) -> int:
+    count = 0
+    for path in sorted(GAME_DATA.glob("*.json")):
+        with open(path) as f:
+            data = json.load(f)
+        for copy in range(COPIES):
+            data["gamePk"] = int(f"{path.stem}{copy:03d}")
+            with open(directory / f"{data['gamePk']}.json", "w") as f:
+                json.dump(data, f)
+            count += 1
+    return count
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    process_counts = sorted({1, *(2**i for i in range(8) if 2**i <= cpus)})
+    with tempfile.TemporaryDirectory() as directory:
+        games = write_corpus(Path(directory))
+        print(f"{games} games, {cpus} CPUs")
+        print(
+            f"{'processes':<12}{'time (s)':>10}{'games/s':>10}"
+            f"{'speedup':>10}"
+        )
+        baseline = None
+        for processes in process_counts:
+            start = time.perf_counter()
+            collection = GameCollection.from_directory(
+                directory, processes=processes
+            )
+            elapsed = time.perf_counter() - start
+            assert len(collection) == games and not collection.failures
+            baseline = baseline or elapsed
+            print(
+                f"{processes:<12}{elapsed:>10.2f}{games / elapsed:>10.1f}"
+                f"{baseline / elapsed:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
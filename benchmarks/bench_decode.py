@@ -0,0 +1,51 @@
+"""
+Time of decoding each fixture game feed with the json module against
+transport.loads, which uses orjson when it is installed, and of decoding and
+parsing it into a Game with each. Run from the repository root:
+
+    python -m benchmarks.bench_decode
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from mlb_statsapi import Game
+from mlb_statsapi.transport import loads, orjson
+
+GAME_DATA = Path("tests/game_data")
+
+
+def best_time(f: Callable[[], Any], repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"loads backend: {'orjson' if orjson is not None else 'json'}")
+    print(f"{'':<10}{'decode (ms)':>20}{'decode + parse (ms)':>24}")
+    print(
+        f"{'game_pk':<10}{'json':>10}{'loads':>10}{'json':>12}{'loads':>12}"
+    )
+    for path in sorted(GAME_DATA.glob("*.json")):
+        content = path.read_bytes()
+        times = [
+            best_time(lambda: json.loads(content)),
+            best_time(lambda: loads(content)),
+            best_time(lambda: Game(json.loads(content))),
+            best_time(lambda: Game(loads(content))),
+        ]
+        print(
+            f"{path.stem:<10}{times[0] * 1e3:>10.1f}{times[1] * 1e3:>10.1f}"
+            f"{times[2] * 1e3:>12.1f}{times[3] * 1e3:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Time of loading the pitch, swing and play event tables of the fixture games
+by parsing the JSON feeds again against reading them back from a
+ColumnarStore, in Parquet and Arrow IPC, in full and with a projection of a
+few pitch columns and a filter. Requires pyarrow. Run from the repository
+root:
+
+    python -m benchmarks.bench_export
+"""
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pyarrow.dataset as ds
+
+from mlb_statsapi import ColumnarStore, Game
+from mlb_statsapi.export import TABLES, game_tables
+
+GAME_DATA = Path("tests/game_data")
+COLUMNS = ["start_speed", "spin_rate", "pitch_type"]
+FILTER = ds.field("start_speed") > 95
+
+
+def reparse() -> dict[str, list]:
+    tables: dict[str, list] = {name: [] for name in TABLES}
+    for path in sorted(GAME_DATA.glob("*.json")):
+        with open(path) as f:
+            game = Game(json.load(f))
+        for name, df in game_tables(game).items():
+            tables[name].append(df)
+    return tables
+
+
+def reparse_projected() -> list:
+    tables = []
+    for path in sorted(GAME_DATA.glob("*.json")):
+        with open(path) as f:
+            game = Game(json.load(f))
+        df = game.get_pitch_metrics_table(COLUMNS)
+        tables.append(df[df["start_speed"] > 95])
+    return tables
+
+
+def best_time(f: Callable[[], Any], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    full = best_time(reparse)
+    projected = best_time(reparse_projected)
+    print(f"{'':<10}{'all tables (ms)':>17}{'projected (ms)':>16}{'MiB':>8}")
+    print(f"{'json':<10}{full * 1e3:>17.1f}{projected * 1e3:>16.1f}")
+
+    for format in ("parquet", "ipc"):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ColumnarStore(directory, format=format)
+            for path in sorted(GAME_DATA.glob("*.json")):
+                with open(path) as f:
+                    store.write_game(Game(json.load(f)))
+            size = sum(
+                p.stat().st_size
+                for p in Path(directory).rglob("*")
+                if p.is_file()
+            )
+            full = best_time(lambda: [store.read(name) for name in TABLES])
+            projected = best_time(
+                lambda: store.read("pitches", columns=COLUMNS, filter=FILTER)
+            )
+            print(
+                f"{format:<10}{full * 1e3:>17.1f}{projected * 1e3:>16.1f}"
+                f"{size / 1024**2:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
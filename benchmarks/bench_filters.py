@@ -0,0 +1,151 @@
+"""
+Time of filtering the pitch metrics of a corpus made by concatenating the
+plays of every fixture game, under unique play ids. Compares the list based
+play id filter the metric APIs used to have against the set based one, and
+filtering by pitcher after extracting every pitch against pushing a
+PitchFilter down into the extraction. Run from the repository root:
+
+    python -m benchmarks.bench_filters
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from mlb_statsapi import Game, PitchFilter
+
+GAME_DATA = Path("tests/game_data")
+METRICS = ["start_speed", "spin_rate", "pitch_type"]
+# Share of the play ids looked up by the play id filter
+PLAY_ID_SHARE = 10
+
+
+def corpus_feed() -> dict:
+    feed = None
+    plays = []
+    for i, path in enumerate(sorted(GAME_DATA.glob("*.json"))):
+        with open(path) as f:
+            data = json.load(f)
+        feed = feed or data
+        for play in data["liveData"]["plays"]["allPlays"]:
+            for play_event in play["playEvents"]:
+                if "playId" in play_event:
+                    play_event["playId"] = f"{play_event['playId']}-{i}"
+            plays.append(play)
+    feed["liveData"]["plays"]["allPlays"] = plays
+    return feed
+
+
+def legacy_pitch_metrics(game: Game, play_ids: list[str]) -> dict:
+    """
+    get_filtered_pitch_metrics_by_play_id before filtering used sets,
+    checking every play id against the list
+    """
+    pitches_by_play_id = {
+        k: v for k, v in game.pitches_by_play_id.items() if k in play_ids
+    }
+    return {
+        play_id: {
+            **{metric: getattr(pitch, metric) for metric in METRICS},
+            **pitch.get_match_up_values(),
+        }
+        for play_id, pitch in pitches_by_play_id.items()
+    }
+
+
+def best_time(f: Callable[[], Any], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name: str, before: float, after: float) -> None:
+    print(
+        f"{name:<30}{before * 1e3:>12.1f}{after * 1e3:>12.1f}"
+        f"{before / after:>8.1f}x"
+    )
+
+
+def main() -> None:
+    feed = corpus_feed()
+    game = Game(feed)
+    play_ids = game.play_ids[::PLAY_ID_SHARE]
+    pitcher_id = max(
+        game.plays_by_pitcher_id,
+        key=lambda k: len(game.plays_by_pitcher_id[k]),
+    )
+    where = PitchFilter(pitcher_ids=[pitcher_id])
+    pitcher_play_ids = {
+        play_id
+        for play in game.plays_by_pitcher_id[pitcher_id]
+        for play_id in play.play_ids
+    }
+
+    def post_filtered_dicts() -> dict:
+        return {
+            k: v
+            for k, v in game.get_filtered_pitch_metrics_by_play_id(
+                METRICS
+            ).items()
+            if k in pitcher_play_ids
+        }
+
+    def post_filtered_table() -> Any:
+        table = game.get_pitch_metrics_table(METRICS)
+        return table[table.index.isin(pitcher_play_ids)]
+
+    def lazy_pushdown() -> dict:
+        return Game(feed, lazy=True).get_filtered_pitch_metrics_by_play_id(
+            METRICS, where=where
+        )
+
+    def lazy_post_filtered() -> dict:
+        metrics = Game(feed, lazy=True).get_filtered_pitch_metrics_by_play_id(
+            METRICS
+        )
+        return {k: v for k, v in metrics.items() if k in pitcher_play_ids}
+
+    new = game.get_filtered_pitch_metrics_by_play_id
+    assert legacy_pitch_metrics(game, play_ids) == new(METRICS, play_ids)
+    assert post_filtered_dicts() == new(METRICS, where=where)
+    assert list(post_filtered_table().index) == list(
+        game.get_pitch_metrics_table(METRICS, where=where).index
+    )
+
+    print(
+        f"{len(game.plays)} plays, {len(game.pitches_by_play_id)} pitches, "
+        f"{len(play_ids)} play ids, pitcher with {len(pitcher_play_ids)} "
+        "play ids"
+    )
+    print(f"{'':<30}{'before (ms)':>12}{'after (ms)':>12}")
+    report(
+        "play ids, list vs set",
+        best_time(lambda: legacy_pitch_metrics(game, play_ids), repeats=1),
+        best_time(lambda: new(METRICS, play_ids)),
+    )
+    report(
+        "pitcher, dicts",
+        best_time(post_filtered_dicts),
+        best_time(lambda: new(METRICS, where=where)),
+    )
+    report(
+        "pitcher, columnar",
+        best_time(post_filtered_table),
+        best_time(
+            lambda: game.get_pitch_metrics_table(METRICS, where=where)
+        ),
+    )
+    report(
+        "pitcher, lazy game",
+        best_time(lazy_post_filtered),
+        best_time(lazy_pushdown),
+    )
+
+
+if __name__ == "__main__":
+    main()
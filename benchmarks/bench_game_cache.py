@@ -0,0 +1,80 @@
+"""
+Time of polling games repeatedly with GameRequest, with and without a
+GameCache, against the local stub server: the final fixture games, and a game
+replayed live whose feed changes every CHANGE_EVERY polls. Reports the time
+per poll, the feed requests sent and the hit rate of the cache. Run from the
+repository root:
+
+    python -m benchmarks.bench_game_cache
+"""
+from __future__ import annotations
+
+import time
+
+from mlb_statsapi import GameCache, GameRequest, VideoDecoration
+from mlb_statsapi.transport import RequestsTransport
+from tests.stub_server import StubServer
+
+POLLS = 20
+CHANGE_EVERY = 5
+LIVE_STEPS = POLLS // CHANGE_EVERY
+
+
+def poll(
+    server: StubServer,
+    transport: RequestsTransport,
+    game_pks: list[int],
+    game_cache: GameCache | None,
+) -> float:
+    replays = [
+        server.live[str(game_pk)]
+        for game_pk in game_pks
+        if str(game_pk) in server.live
+    ]
+    start = time.perf_counter()
+    for i in range(POLLS):
+        for replay in replays:
+            replay.step = min(i // CHANGE_EVERY, LIVE_STEPS - 1)
+        for game_pk in game_pks:
+            GameRequest(
+                game_pk,
+                transport=transport,
+                videos=VideoDecoration.OFF,
+                game_cache=game_cache,
+            ).make_request()
+    return (time.perf_counter() - start) / (POLLS * len(game_pks))
+
+
+def main() -> None:
+    print(
+        f"{'':<22}{'poll (ms)':>10}{'feeds':>8}{'hit rate':>10}"
+        f"{'size (MB)':>11}"
+    )
+    with StubServer() as server, RequestsTransport(
+        host_overrides=server.host_overrides
+    ) as transport:
+        final_pks = server.game_pks[1:]
+        live_pk = server.game_pks[0]
+        server.replay_live(live_pk, steps=LIVE_STEPS)
+        for label, game_pks in (("final", final_pks), ("live", [live_pk])):
+            for game_cache in (None, GameCache()):
+                server.hits.clear()
+                elapsed = poll(server, transport, game_pks, game_cache)
+                feeds = sum(
+                    hits
+                    for request, hits in server.hits.items()
+                    if request.endswith("/feed/live")
+                )
+                hit_rate = size = ""
+                if game_cache is not None:
+                    hit_rate = f"{game_cache.stats.hit_rate:.0%}"
+                    size = f"{game_cache.stats.size_bytes / 1e6:.1f}"
+                name = f"{label}, {'cache' if game_cache else 'no cache'}"
+                print(
+                    f"{name:<22}{elapsed * 1e3:>10.1f}{feeds:>8}"
+                    f"{hit_rate:>10}{size:>11}"
+                )
+
+
+if __name__ == "__main__":
+    main()
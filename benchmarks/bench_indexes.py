@@ -0,0 +1,109 @@
+"""
+Time of Game.get_filtered_swing_metrics_by_play_id as games grow, as it was
+with the play id indexes rebuilt for every row, which made the call
+quadratic, against the cached indexes. Larger games are made by
+repeating the plays of a fixture game under new play ids. Run from the
+repository root:
+
+    python -m benchmarks.bench_indexes
+"""
+from __future__ import annotations
+
+import copy
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from mlb_statsapi import Game
+from mlb_statsapi.datatypes import compile_metrics
+
+GAME_PATH = Path("tests/game_data/718096.json")
+SCALES = (1, 2, 4, 8)
+METRICS = ["launch_speed", "launch_angle"]
+
+
+def legacy_pitches_by_play_id(game: Game) -> dict:
+    return {
+        k: v for p in game.plays for k, v in p.pitches_by_play_id.items()
+    }
+
+
+def legacy_swing_metrics(game: Game, metrics: list[str]) -> dict:
+    """
+    get_filtered_swing_metrics_by_play_id before the indexes were cached,
+    rebuilding pitches_by_play_id for every row
+    """
+    swings_by_play_id = {
+        k: v for p in game.plays for k, v in p.swings_by_play_id.items()
+    }
+    compiled_metrics = compile_metrics(metrics)
+    return {
+        play_id: {
+            **{
+                metric: (
+                    swing.get_flattened_value(metric, steps)
+                    if swing
+                    else None
+                )
+                for metric, steps in compiled_metrics.items()
+            },
+            **legacy_pitches_by_play_id(game)[play_id].get_match_up_values(),
+        }
+        for play_id, swing in swings_by_play_id.items()
+    }
+
+
+def scaled_feed(data: dict, scale: int) -> dict:
+    data = copy.deepcopy(data)
+    all_plays = data["liveData"]["plays"]["allPlays"]
+    plays = []
+    for i in range(scale):
+        for play in copy.deepcopy(all_plays):
+            for play_event in play["playEvents"]:
+                if "playId" in play_event:
+                    play_event["playId"] = f"{play_event['playId']}-{i}"
+            plays.append(play)
+    data["liveData"]["plays"]["allPlays"] = plays
+    return data
+
+
+def best_time(f: Callable[[], Any], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def cached_swing_metrics(game: Game) -> dict:
+    # Include building the indexes
+    game.invalidate_indexes()
+    return game.get_filtered_swing_metrics_by_play_id(METRICS)
+
+
+def main() -> None:
+    with open(GAME_PATH) as f:
+        data = json.load(f)
+    print(
+        f"{'plays':<8}{'pitches':>9}{'rebuilt (ms)':>14}{'cached (ms)':>13}"
+    )
+    for scale in SCALES:
+        feed = scaled_feed(data, scale)
+        game = Game(feed)
+        assert legacy_swing_metrics(game, METRICS) == cached_swing_metrics(
+            game
+        )
+        rebuilt = best_time(
+            lambda: legacy_swing_metrics(game, METRICS), repeats=1
+        )
+        cached = best_time(lambda: cached_swing_metrics(game))
+        print(
+            f"{len(game.plays):<8}{len(game.pitches_by_play_id):>9}"
+            f"{rebuilt * 1e3:>14.1f}{cached * 1e3:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
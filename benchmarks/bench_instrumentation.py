@@ -0,0 +1,61 @@
+"""
+Cost of instrumentation on parsing each fixture game and extracting its
+pitch and swing metrics, with no sink configured against an InMemorySink.
+Compare the time with no sink against benchmarks/baselines.json, through
+python -m benchmarks.suite, for the overhead of the disabled hooks. Run from
+the repository root:
+
+    python -m benchmarks.bench_instrumentation
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from mlb_statsapi import Game, InMemorySink, metrics_sink
+
+GAME_DATA = Path("tests/game_data")
+REPEATS = 5
+
+
+def parse_and_extract(data: dict) -> None:
+    game = Game(data)
+    game.get_filtered_pitch_metrics_by_play_id_as_df()
+    game.get_filtered_swing_metrics_by_play_id_as_df()
+    game.get_pitch_metrics_table()
+
+
+def best_time(data: dict) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        parse_and_extract(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(
+        f"{'game_pk':<10}{'off (ms)':>10}{'in memory (ms)':>16}"
+        f"{'overhead':>10}{'records':>9}"
+    )
+    for path in sorted(GAME_DATA.glob("*.json")):
+        with open(path) as f:
+            data = json.load(f)
+
+        off = best_time(data)
+        sink = InMemorySink()
+        with metrics_sink(sink):
+            on = best_time(data)
+        records = sum(s.count for s in sink.timings.values()) + sum(
+            sink.counters.values()
+        )
+        print(
+            f"{path.stem:<10}{off * 1e3:>10.1f}{on * 1e3:>16.1f}"
+            f"{on / off - 1:>10.0%}{records // REPEATS:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
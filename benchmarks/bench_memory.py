@@ -0,0 +1,91 @@
+"""
+Peak memory of extracting every pitch speed from each fixture game, loading
+the whole feed into a Game against streaming it one Play at a time with
+GameStream. Each run happens in a fresh process so peaks do not overlap.
+Reports the peak RSS of the process, which includes the interpreter and
+imports, and the peak of memory allocated while parsing. Run from the
+repository root:
+
+    python -m benchmarks.bench_memory
+"""
+from __future__ import annotations
+
+import json
+import resource
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+from mlb_statsapi import Game, GameStream
+
+GAME_DATA = Path("tests/game_data")
+MODES = ("full", "stream")
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def start_speeds(path: Path, mode: str) -> dict[str, float]:
+    if mode == "full":
+        game = Game(json.loads(path.read_bytes()))
+        return {
+            play_id: pitch.start_speed
+            for play_id, pitch in game.pitches_by_play_id.items()
+            if pitch is not None
+        }
+
+    speeds = {}
+    for play in GameStream.from_file(path):
+        for play_id, pitch in play.pitches_by_play_id.items():
+            if pitch is not None:
+                speeds[play_id] = pitch.start_speed
+    return speeds
+
+
+def run(path: Path, mode: str) -> None:
+    tracemalloc.start()
+    speeds = start_speeds(path, mode)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(json.dumps([peak_rss_mib(), traced_peak / 1024**2, len(speeds)]))
+
+
+def measure(path: Path, mode: str) -> tuple[float, float, int]:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_memory", mode, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    rss, traced, pitches = json.loads(output)
+    return rss, traced, pitches
+
+
+def main() -> None:
+    print(
+        f"{'':<10}{'':>8}{'peak RSS (MiB)':>20}{'peak allocated (MiB)':>24}"
+    )
+    print(
+        f"{'game_pk':<10}{'MiB':>8}{'full':>10}{'stream':>10}"
+        f"{'full':>10}{'stream':>10}{'ratio':>8}"
+    )
+    for path in sorted(GAME_DATA.glob("*.json")):
+        (full_rss, full, full_pitches), (stream_rss, stream, pitches) = (
+            measure(path, mode) for mode in MODES
+        )
+        assert full_pitches == pitches
+        print(
+            f"{path.stem:<10}{path.stat().st_size / 1024**2:>8.1f}"
+            f"{full_rss:>10.1f}{stream_rss:>10.1f}"
+            f"{full:>10.1f}{stream:>10.1f}{full / stream:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run(Path(sys.argv[2]), sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,66 @@
+"""
+Memory and construction time of the object graph of each fixture game,
+leaving out the raw json it is built from, with Decimal and float metrics.
+Run from the repository root:
+
+    python -m benchmarks.bench_objects
+"""
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from mlb_statsapi import Game, Numeric
+
+GAME_DATA = Path("tests/game_data")
+REPEATS = 5
+
+
+def build(data: dict, **kwargs) -> Game:
+    game = Game(data, **kwargs)
+    # Materialize the nested objects lazily created by __getattr__
+    for play in game.plays:
+        for play_event in play.play_events:
+            play_event.pitch, play_event.swing
+    return game
+
+
+def object_memory(data: dict, **kwargs) -> int:
+    tracemalloc.start()
+    game = build(data, **kwargs)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del game
+    return size
+
+
+def best_build_time(data: dict, **kwargs) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        build(data, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(
+        f"{'':<10}{'objects (KiB)':>20}{'build (ms)':>20}\n"
+        f"{'game_pk':<10}{'decimal':>10}{'float':>10}"
+        f"{'decimal':>10}{'float':>10}"
+    )
+    for path in sorted(GAME_DATA.glob("*.json")):
+        with open(path) as f:
+            data = json.load(f)
+        memory = [object_memory(data, numeric=n) / 1024 for n in Numeric]
+        times = [best_build_time(data, numeric=n) * 1e3 for n in Numeric]
+        print(
+            f"{path.stem:<10}{memory[0]:>10.0f}{memory[1]:>10.0f}"
+            f"{times[0]:>10.1f}{times[1]:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Per-game parse time for the fixture games.
+
+Compares the current field extraction against the old behaviour of
+re-reading .env on every field. Run from the repository root:
+
+    python -m benchmarks.bench_parse
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from dotenv import dotenv_values
+
+from mlb_statsapi import Game
+from mlb_statsapi.constants import MetaFields
+
+GAME_DATA = Path("tests/game_data")
+REPEATS = 5
+
+
+def legacy_t(f, *args, **kwargs):
+    config = dotenv_values(".env")
+
+    if "DEBUG" in config:
+        return f()
+
+    try:
+        return f()
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return MetaFields.NOT_FOUND
+
+
+def best_parse_time(data: dict) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        Game(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(
+        f"{'game_pk':<10}{'legacy (ms)':>14}{'current (ms)':>14}"
+        f"{'speedup':>10}"
+    )
+    for path in sorted(GAME_DATA.glob("*.json")):
+        with open(path) as f:
+            data = json.load(f)
+
+        with patch("mlb_statsapi.datatypes.t", legacy_t):
+            legacy = best_parse_time(data)
+        current = best_parse_time(data)
+
+        print(
+            f"{path.stem:<10}{legacy * 1e3:>14.1f}{current * 1e3:>14.1f}"
+            f"{legacy / current:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Extraction of every terminal metric of every pitch and swing in the fixture
+games, with explore_object against compiled paths. Run from the repository
+root:
+
+    python -m benchmarks.bench_paths
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from mlb_statsapi import Game
+from mlb_statsapi import utils as ut
+
+GAME_DATA = Path("tests/game_data")
+REPEATS = 5
+
+
+def explore_object_values(rows: list[tuple[dict, list[str]]]) -> list:
+    values = []
+    for raw, paths in rows:
+        for path in paths:
+            v = ut.explore_object(raw, path)
+            assert len(v) == 1
+            values.append([*v][0])
+    return values
+
+
+def compiled_path_values(rows: list[tuple[dict, list[str]]]) -> list:
+    values = []
+    for raw, paths in rows:
+        for path in paths:
+            values.append(ut.get_path_value(raw, path))
+    return values
+
+
+def best_time(f, rows) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        f(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    rows = []
+    for path in sorted(GAME_DATA.glob("*.json")):
+        with open(path) as f:
+            game = Game(json.load(f))
+        for obj in [
+            *game.pitches_by_play_id.values(),
+            *game.swings_by_play_id.values(),
+        ]:
+            if obj is None:
+                continue
+            paths = sorted(ut.all_attributes(ut.list_attributes(obj._raw)))
+            rows.append((obj._raw, paths))
+
+    n = sum(len(paths) for _, paths in rows)
+    assert explore_object_values(rows) == compiled_path_values(rows)
+
+    old = best_time(explore_object_values, rows)
+    new = best_time(compiled_path_values, rows)
+    print(f"{n} values from {len(rows)} pitches and swings")
+    for name, seconds in [("explore_object", old), ("compiled path", new)]:
+        print(
+            f"{name + ':':<16}{seconds * 1e3:8.1f} ms "
+            f"({seconds / n * 1e9:6.0f} ns/value)"
+        )
+    print(f"{'speedup:':<16}{old / new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
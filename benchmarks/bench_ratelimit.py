@@ -0,0 +1,81 @@
+"""
+Backfill of many requests from several threads against the local stub
+server enforcing a rate limit with 429 responses: every worker retrying with
+its own backoff, as the default urllib3 retries do, against all of them
+sharing a RateLimiter, starting below and above the limit. Reports the time
+taken, the 429 responses the server sent and the requests that still failed.
+Run from the repository root:
+
+    python -m benchmarks.bench_ratelimit
+"""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from requests.adapters import Retry
+
+from mlb_statsapi import RateLimitedTransport, RateLimiter
+from mlb_statsapi.transport import RequestsTransport, Transport
+from tests.stub_server import StubServer
+
+URI = "https://statsapi.mlb.com/api/v1/schedule?sportId=1&season=2023"
+RATE_LIMIT = 50
+BURST = 5
+REQUESTS = 200
+WORKERS = 16
+
+
+def backfill(transport: Transport) -> int:
+    """
+    :return: Number of requests that failed
+    """
+    with ThreadPoolExecutor(WORKERS) as executor:
+        statuses = executor.map(
+            lambda _: transport.request("GET", URI).status_code,
+            range(REQUESTS),
+        )
+        return sum(status != 200 for status in statuses)
+
+
+def run(label: str, create: Callable[[StubServer], Transport]) -> None:
+    with StubServer(rate_limit=RATE_LIMIT, burst=BURST) as server:
+        transport = create(server)
+        start = time.perf_counter()
+        failed = backfill(transport)
+        elapsed = time.perf_counter() - start
+        transport.close()
+        print(f"{label:<22}{elapsed:>10.2f}{server.throttled:>8}{failed:>8}")
+
+
+def main() -> None:
+    print(f"{'':<22}{'time (s)':>10}{'429s':>8}{'failed':>8}")
+    print(f"{'ideal':<22}{REQUESTS / RATE_LIMIT:>10.2f}")
+    run(
+        "independent backoff",
+        lambda server: RequestsTransport(
+            retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                raise_on_status=False,
+            ),
+            host_overrides=server.host_overrides,
+        ),
+    )
+    for rate in (10, 100):
+        run(
+            f"shared, from {rate}/s",
+            lambda server: RateLimitedTransport(
+                RequestsTransport(
+                    retries=Retry(0), host_overrides=server.host_overrides
+                ),
+                RateLimiter(host_rates={}, default_rate=rate),
+                owns_transport=True,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
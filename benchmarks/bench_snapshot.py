@@ -0,0 +1,81 @@
+"""
+Time of opening each fixture game from its JSON feed against from a
+GameSnapshot: opening the game, reading the named pitch metrics and building
+a single Play. Run from the repository root:
+
+    python -m benchmarks.bench_snapshot
+"""
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from mlb_statsapi import Game, GameSnapshot, write_snapshot
+from mlb_statsapi.snapshot import PITCH_COLUMNS
+
+GAME_DATA = Path("tests/game_data")
+
+
+def best_time(f: Callable[[], Any], repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_json(path: Path, lazy: bool = False) -> Game:
+    with open(path, "rb") as f:
+        return Game(json.load(f), lazy=lazy)
+
+
+def snapshot_pitch_table(path: Path) -> Any:
+    with GameSnapshot(path) as snapshot:
+        return snapshot.pitch_table()
+
+
+def snapshot_play(path: Path) -> Any:
+    with GameSnapshot(path) as snapshot:
+        return snapshot.play(len(snapshot) // 2).play_events
+
+
+def main() -> None:
+    print(f"{'':<24}{'open (ms)':>18}{'pitch table (ms)':>20}")
+    print(
+        f"{'game_pk':<10}{'MiB json/snap':>14}{'json':>9}{'snap':>9}"
+        f"{'json':>10}{'snap':>10}{'play (ms)':>11}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for path in sorted(GAME_DATA.glob("*.json")):
+            snapshot_path = write_snapshot(
+                load_json(path), Path(directory) / f"{path.stem}.snap"
+            )
+            json_open = best_time(lambda: load_json(path, lazy=True))
+            snapshot_open = best_time(lambda: GameSnapshot(snapshot_path))
+            json_table = best_time(
+                lambda: load_json(path, lazy=True).get_pitch_metrics_table(
+                    list(PITCH_COLUMNS)
+                )
+            )
+            snapshot_table = best_time(
+                lambda: snapshot_pitch_table(snapshot_path)
+            )
+            play = best_time(lambda: snapshot_play(snapshot_path))
+            sizes = (
+                f"{path.stat().st_size / 1024**2:.1f}/"
+                f"{snapshot_path.stat().st_size / 1024**2:.1f}"
+            )
+            print(
+                f"{path.stem:<10}{sizes:>14}"
+                f"{json_open * 1e3:>9.2f}{snapshot_open * 1e3:>9.2f}"
+                f"{json_table * 1e3:>10.2f}{snapshot_table * 1e3:>10.2f}"
+                f"{play * 1e3:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
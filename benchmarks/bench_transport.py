@@ -0,0 +1,71 @@
+"""
+Throughput of fetching game feeds and video lookups from a local stub server,
+with a new session per request (the old behaviour) against the pooled
+RequestsTransport. Run from the repository root:
+
+    python -m benchmarks.bench_transport
+"""
+from __future__ import annotations
+
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mlb_statsapi import GameRequest, PlayVideoRequest
+from mlb_statsapi.transport import (
+    DEFAULT_RETRIES,
+    RequestsTransport,
+    Response,
+    Transport,
+)
+from tests.stub_server import StubServer
+
+ROUNDS = 25
+
+
+class SessionPerRequestTransport(RequestsTransport):
+    def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(max_retries=DEFAULT_RETRIES))
+        session.mount("https://", HTTPAdapter(max_retries=DEFAULT_RETRIES))
+        response = session.request(method, self.rewrite_uri(uri), data=data)
+        return Response(
+            response.status_code, response.content, response.headers
+        )
+
+
+def fetch_all(transport: Transport, game_pks: list[int]) -> int:
+    n = 0
+    for _ in range(ROUNDS):
+        for game_pk in game_pks:
+            for request in [GameRequest(game_pk), PlayVideoRequest(game_pk)]:
+                data = (
+                    request.data_payload if request.METHOD == "POST" else None
+                )
+                transport.request(request.METHOD, request.request_uri, data)
+                n += 1
+    return n
+
+
+def main() -> None:
+    with StubServer() as server:
+        for name, transport_type in [
+            ("session per request", SessionPerRequestTransport),
+            ("pooled", RequestsTransport),
+        ]:
+            server.connections.clear()
+            with transport_type(host_overrides=server.host_overrides) as t:
+                start = time.perf_counter()
+                n = fetch_all(t, server.game_pks)
+                seconds = time.perf_counter() - start
+            print(
+                f"{name:<20}{n / seconds:8.0f} requests/s "
+                f"{len(server.connections):5d} connections"
+            )
+
+
+if __name__ == "__main__":
+    main()
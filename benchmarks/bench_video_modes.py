@@ -0,0 +1,53 @@
+"""
+End to end latency of GameRequest for each fixture game and VideoDecoration
+mode, against the local stub server with a simulated network latency. Reports
+the time until the game is returned, and until every play video has also been
+looked up. Run from the repository root:
+
+    python -m benchmarks.bench_video_modes
+"""
+from __future__ import annotations
+
+import time
+
+from mlb_statsapi import GameRequest, VideoDecoration
+from mlb_statsapi.transport import RequestsTransport
+from tests.stub_server import StubServer
+
+LATENCY = 0.05
+REPEATS = 3
+
+
+def best_times(
+    game_pk: int, transport: RequestsTransport, videos: VideoDecoration
+) -> tuple[float, float]:
+    best_game = best_videos = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        game = GameRequest(
+            game_pk, transport=transport, videos=videos
+        ).make_request()
+        returned = time.perf_counter()
+        game.play_video_by_play_id
+        done = time.perf_counter()
+        best_game = min(best_game, returned - start)
+        best_videos = min(best_videos, done - start)
+    return best_game, best_videos
+
+
+def main() -> None:
+    print(f"{'game_pk':<10}{'mode':<12}{'game (ms)':>12}{'videos (ms)':>14}")
+    with StubServer(latency=LATENCY) as server, RequestsTransport(
+        host_overrides=server.host_overrides
+    ) as transport:
+        for game_pk in server.game_pks:
+            for videos in VideoDecoration:
+                game, all_videos = best_times(game_pk, transport, videos)
+                print(
+                    f"{game_pk:<10}{videos.value:<12}"
+                    f"{game * 1e3:>12.1f}{all_videos * 1e3:>14.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Time of resolving the videos of many games against the local stub server,
+with a simulated network latency: one PlayVideoRequest per game against the
+batched VideoResolver, and the resolver again from its cache. The videos of
+the fixture games are served under GAMES game pks. Run from the repository
+root:
+
+    python -m benchmarks.bench_videos
+"""
+from __future__ import annotations
+
+import tempfile
+import time
+
+from mlb_statsapi import PlayVideoRequest, VideoResolver
+from mlb_statsapi.cache import ResponseCache
+from mlb_statsapi.transport import RequestsTransport
+from tests.stub_server import StubServer
+
+GAMES = 100
+LATENCY = 0.02
+FIRST_GAME_PK = 900000
+
+
+def main() -> None:
+    with StubServer(latency=LATENCY) as server, RequestsTransport(
+        host_overrides=server.host_overrides
+    ) as transport, tempfile.TemporaryDirectory() as directory:
+        fixtures = list(server.videos.values())
+        game_pks = list(range(FIRST_GAME_PK, FIRST_GAME_PK + GAMES))
+        for i, game_pk in enumerate(game_pks):
+            server.videos[str(game_pk)] = fixtures[i % len(fixtures)]
+
+        print(f"{'':<26}{'time (s)':>10}{'requests':>10}")
+
+        def report(label: str, f) -> None:
+            server.hits.clear()
+            start = time.perf_counter()
+            f()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<26}{elapsed:>10.2f}"
+                f"{server.hits['POST /graphql']:>10}"
+            )
+
+        report(
+            "per game",
+            lambda: [
+                PlayVideoRequest(game_pk, transport=transport).make_request()
+                for game_pk in game_pks
+            ],
+        )
+        resolver = VideoResolver(
+            transport=transport, cache=ResponseCache(directory)
+        )
+        report("resolver", lambda: resolver.resolve(game_pks))
+        report("resolver, cached", lambda: resolver.resolve(game_pks))
+
+
+if __name__ == "__main__":
+    main()
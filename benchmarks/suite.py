@@ -0,0 +1,358 @@
+"""
+Benchmark suite over the fixture games, for catching performance
+regressions. Covers parse time and memory per game, flattened_values,
+explore_object, list_attributes, metric extraction with and without
+explicit metrics, DataFrame creation and request throughput against the
+local stub server.
+
+Each time case reports the best time per call over several rounds, each
+round repeating the call for at least MIN_ROUND_SECONDS. Memory cases
+report the peak allocated bytes. Results are compared against the stored
+baselines and any case slower or larger by more than the threshold is a
+regression, which makes the run exit with status 1. Run from the
+repository root:
+
+    python -m benchmarks.suite                 # compare against baselines
+    python -m benchmarks.suite -k parse        # only cases matching parse
+    python -m benchmarks.suite --save          # store new baselines
+
+Baselines depend on the machine, store them again after changing it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from mlb_statsapi import Game, GameRequest, PlayVideoRequest
+from mlb_statsapi import utils as ut
+from mlb_statsapi.transport import RequestsTransport
+from tests.stub_server import StubServer
+
+GAME_DATA = Path("tests/game_data")
+BASELINES = Path(__file__).with_name("baselines.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_ROUNDS = 5
+MIN_ROUND_SECONDS = 0.05
+PITCH_METRICS = ["start_speed", "spin_rate", "pitch_type"]
+SWING_METRICS = ["launch_speed", "launch_angle", "trajectory"]
+EXPLORE_PATH = ".liveData.plays.allPlays.[].playEvents.[].pitchData.startSpeed"
+REQUESTS_PER_ROUND = 10
+
+
+@dataclass
+class Case:
+    name: str
+    # Called once with an ExitStack for cleanup, returns the measured call
+    setup: Callable[[ExitStack], Callable[[], Any]]
+    # "seconds" for time per call or "bytes" for peak allocated memory
+    unit: str = "seconds"
+
+
+@dataclass
+class Result:
+    name: str
+    value: float
+    unit: str
+
+
+def load_feed(path: Path) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def game_cases(path: Path) -> list[Case]:
+    game_pk = path.stem
+
+    def feed(stack: ExitStack) -> dict:
+        return load_feed(path)
+
+    def game(stack: ExitStack) -> Game:
+        return Game(load_feed(path))
+
+    def flattened_values(stack: ExitStack) -> Callable[[], Any]:
+        pitches = [p for p in game(stack).pitches_by_play_id.values() if p]
+        return lambda: [pitch.flattened_values for pitch in pitches]
+
+    return [
+        Case(f"parse/{game_pk}", lambda s: (lambda d=feed(s): Game(d))),
+        Case(
+            f"parse_lazy/{game_pk}",
+            lambda s: (lambda d=feed(s): Game(d, lazy=True)),
+        ),
+        Case(
+            f"memory/{game_pk}",
+            lambda s: (lambda d=feed(s): Game(d)),
+            unit="bytes",
+        ),
+        Case(f"flattened_values/{game_pk}", flattened_values),
+        Case(
+            f"explore_object/{game_pk}",
+            lambda s: (lambda d=feed(s): ut.explore_object(d, EXPLORE_PATH)),
+        ),
+        Case(
+            f"list_attributes/{game_pk}",
+            lambda s: (lambda d=feed(s): ut.list_attributes(d)),
+        ),
+        Case(
+            f"pitch_metrics/all/{game_pk}",
+            lambda s: game(s).get_filtered_pitch_metrics_by_play_id,
+        ),
+        Case(
+            f"pitch_metrics/explicit/{game_pk}",
+            lambda s: (
+                lambda g=game(s): g.get_filtered_pitch_metrics_by_play_id(
+                    PITCH_METRICS
+                )
+            ),
+        ),
+        Case(
+            f"swing_metrics/all/{game_pk}",
+            lambda s: game(s).get_filtered_swing_metrics_by_play_id,
+        ),
+        Case(
+            f"swing_metrics/explicit/{game_pk}",
+            lambda s: (
+                lambda g=game(s): g.get_filtered_swing_metrics_by_play_id(
+                    SWING_METRICS
+                )
+            ),
+        ),
+        Case(
+            f"dataframe/pitch/{game_pk}",
+            lambda s: game(s).get_filtered_pitch_metrics_by_play_id_as_df,
+        ),
+        Case(
+            f"dataframe/swing/{game_pk}",
+            lambda s: game(s).get_filtered_swing_metrics_by_play_id_as_df,
+        ),
+        Case(
+            f"dataframe/pitch_table/{game_pk}",
+            lambda s: game(s).get_pitch_metrics_table,
+        ),
+        Case(
+            f"dataframe/swing_table/{game_pk}",
+            lambda s: game(s).get_swing_metrics_table,
+        ),
+    ]
+
+
+def stub_transport(stack: ExitStack) -> tuple[StubServer, RequestsTransport]:
+    server = stack.enter_context(StubServer())
+    transport = stack.enter_context(
+        RequestsTransport(host_overrides=server.host_overrides)
+    )
+    return server, transport
+
+
+def request_cases() -> list[Case]:
+    def game_requests(stack: ExitStack) -> Callable[[], Any]:
+        server, transport = stub_transport(stack)
+
+        def run() -> None:
+            for _ in range(REQUESTS_PER_ROUND):
+                for game_pk in server.game_pks:
+                    GameRequest(game_pk, transport=transport).make_request()
+
+        return run
+
+    def video_requests(stack: ExitStack) -> Callable[[], Any]:
+        server, transport = stub_transport(stack)
+
+        def run() -> None:
+            for _ in range(REQUESTS_PER_ROUND):
+                for game_pk in server.game_pks:
+                    PlayVideoRequest(
+                        game_pk, transport=transport
+                    ).make_request()
+
+        return run
+
+    return [
+        Case("requests/game", game_requests),
+        Case("requests/video", video_requests),
+    ]
+
+
+def all_cases() -> list[Case]:
+    cases = []
+    for path in sorted(GAME_DATA.glob("*.json")):
+        cases.extend(game_cases(path))
+    return cases + request_cases()
+
+
+def time_per_call(f: Callable[[], Any], rounds: int) -> float:
+    f()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            f()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_ROUND_SECONDS:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            f()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_bytes(f: Callable[[], Any]) -> int:
+    # Warm up module level caches first, so the peak does not depend on
+    # which cases ran before
+    f()
+    tracemalloc.start()
+    try:
+        f()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(case: Case, rounds: int) -> Result:
+    with ExitStack() as stack:
+        f = case.setup(stack)
+        if case.unit == "bytes":
+            value = float(peak_bytes(f))
+        else:
+            value = time_per_call(f, rounds)
+    return Result(case.name, value, case.unit)
+
+
+def format_value(value: float, unit: str) -> str:
+    if unit == "bytes":
+        return f"{value / 1024**2:.2f} MiB"
+    return f"{value * 1e3:.3f} ms"
+
+
+def machine() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def load_baselines(path: Path) -> dict[str, dict[str, Any]]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_baselines(path: Path, results: list[Result]) -> None:
+    baselines = {
+        "machine": machine(),
+        "results": {
+            result.name: {"value": result.value, "unit": result.unit}
+            for result in results
+        },
+    }
+    with open(path, "w") as f:
+        json.dump(baselines, f, indent=2)
+        f.write("\n")
+
+
+def report(
+    results: list[Result],
+    baselines: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """
+    Prints every result against its baseline
+
+    :return: Names of the cases that regressed by more than threshold
+    """
+    regressions = []
+    width = max(len(result.name) for result in results) + 2
+    print(
+        f"{'case':<{width}}{'baseline':>14}{'current':>14}"
+        f"{'ratio':>8}  status"
+    )
+    for result in results:
+        baseline = baselines.get(result.name)
+        if baseline is None:
+            print(
+                f"{result.name:<{width}}{'':>14}"
+                f"{format_value(result.value, result.unit):>14}{'':>8}  new"
+            )
+            continue
+        ratio = result.value / baseline["value"]
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(result.name)
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        print(
+            f"{result.name:<{width}}"
+            f"{format_value(baseline['value'], result.unit):>14}"
+            f"{format_value(result.value, result.unit):>14}"
+            f"{ratio:>7.2f}x  {status}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-k", dest="pattern", help="only run cases whose name contains this"
+    )
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="fraction a case may be slower or larger than its baseline",
+    )
+    parser.add_argument("--baselines", type=Path, default=BASELINES)
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store the results as the new baselines of the cases run",
+    )
+    args = parser.parse_args(argv)
+
+    cases = [
+        case
+        for case in all_cases()
+        if args.pattern is None or args.pattern in case.name
+    ]
+    results = [run_case(case, args.rounds) for case in cases]
+    baselines = load_baselines(args.baselines)
+    regressions = report(results, baselines, args.threshold)
+
+    if args.save:
+        # Keep the baselines of the cases that were not run
+        stored = {
+            name: Result(name, baseline["value"], baseline["unit"])
+            for name, baseline in baselines.items()
+        }
+        stored.update((result.name, result) for result in results)
+        save_baselines(args.baselines, list(stored.values()))
+        print(f"Saved {len(results)} baselines to {args.baselines}")
+        return 0
+
+    if regressions:
+        print(
+            f"{len(regressions)} regressions above "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,25 @@
-from .constants import ROOT_KEY, PlayEventType, PlayResult, Trajectory
-from .datatypes import Game, Metadata, Pitch, Play, PlayEvent, Swing
-from .request_datatypes import GameRequest, PlayVideoRequest
+from .cache import GameCache, ResponseCache
+from .coalesce import RequestCoalescer
+from .collection import GameCollection, GameFailure
+from .columnar import PitchFilter
+from .constants import (ROOT_KEY, GameState, LiveEventType, Numeric,
+                        PlayEventType, PlayResult, Strictness, Trajectory,
+                        VideoDecoration)
+from .datatypes import (Game, Metadata, Pitch, Play, PlayEvent, Schedule,
+                        ScheduledGame, Swing)
+from .decorators import FieldError, configure, field_strictness
+from .export import ColumnarStore
+from .instrumentation import (InMemorySink, LoggingSink, MetricsSink, capture,
+                              configure_metrics, metrics_sink)
+from .live import LiveEvent, LiveGame
+from .ratelimit import (RateLimitedAsyncTransport, RateLimitedTransport,
+                        RateLimiter)
+from .request_datatypes import (GameDiffPatchRequest, GameRequest,
+                                PlayVideoRequest, ScheduleRequest,
+                                fetch_games, iter_games,
+                                iter_scheduled_games)
+from .snapshot import GameSnapshot, write_snapshot
+from .streaming import GameStream
+from .transport import (AiohttpTransport, AsyncTransport, RequestsTransport,
+                        Transport)
+from .videos import VideoResolver
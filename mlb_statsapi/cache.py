@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Hashable
+
+from . import instrumentation
+from .transport import Response
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "mlb-statsapi"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+# Evict down to this fraction of max_bytes so every put does not evict
+EVICTION_TARGET = 0.9
+ENTRY_SUFFIX = ".json.gz"
+COMPRESS_LEVEL = 6
+
+DEFAULT_GAME_CACHE_BYTES = 512 * 1024**2
+# Seconds a parsed live game is kept, final games are kept until evicted
+DEFAULT_LIVE_TTL = 60
+# Memory of a parsed Game per byte of its feed without whitespace, measured
+# with tracemalloc on the fixture games (4.4, lazy games start at 3.9)
+PARSED_BYTES_PER_FEED_BYTE = 4.5
+WHITESPACE = b" \n\r\t"
+# metaData comes before gameData and liveData in the game feed
+TIMESTAMP_PATTERN = re.compile(rb'"timeStamp"\s*:\s*"([^"]*)"')
+# gameData.status is the first object of gameData after game and datetime
+STATE_PATTERN = re.compile(rb'"abstractGameState"\s*:\s*"([^"]*)"')
+FEED_SEARCH_BYTES = 4096
+
+
+@dataclass
+class GameCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    # Estimated bytes of the games held
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class GameCacheEntry:
+    game: Any
+    size: int
+    # time.monotonic() after which the entry is stale, None for final games
+    expires_at: float | None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    # Uncompressed bytes served from the cache instead of downloaded
+    bytes_saved: int = 0
+
+
+class ResponseCache:
+    """
+    Persistent cache of raw responses, stored gzip compressed with one file per entry.
+    Entries are written atomically so several processes can share a directory.
+    Once the directory grows past max_bytes, the least recently used entries are evicted
+
+    :param directory: Where entries are stored
+    :param max_bytes: Maximum compressed size of all entries
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._size_estimate = self.size_bytes()
+        # Order of the entries used by this process, breaks ties between
+        # modification times on filesystems that only keep whole seconds
+        self._sequence = itertools.count()
+        self._used: dict[str, int] = {}
+
+    @staticmethod
+    def key(method: str, uri: str, data: str | None = None) -> str:
+        return hashlib.sha256(
+            f"{method} {uri}\n{data or ''}".encode()
+        ).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def entries(self) -> list[os.DirEntry]:
+        return [
+            entry
+            for subdirectory in os.scandir(self.directory)
+            if subdirectory.is_dir()
+            for entry in os.scandir(subdirectory.path)
+            if entry.name.endswith(ENTRY_SUFFIX)
+        ]
+
+    def size_bytes(self) -> int:
+        size = 0
+        for entry in self.entries():
+            try:
+                size += entry.stat().st_size
+            except FileNotFoundError:
+                pass
+        return size
+
+    def get(self, key: str) -> Response | None:
+        """
+        :return: The cached response, or None if it is missing or expired
+        """
+        entry = self.open_entry(key)
+        content = None
+        if entry is not None:
+            header, f = entry
+            try:
+                with f:
+                    content = f.read()
+            except (EOFError, OSError):
+                pass
+
+        self.record_lookup(content is not None, len(content or b""))
+        if content is None:
+            return None
+        return Response(header["status_code"], content)
+
+    def open(self, key: str) -> IO[bytes] | None:
+        """
+        :return: Binary file object to read the cached content incrementally, or None if it is missing or expired
+        """
+        entry = self.open_entry(key)
+        self.record_lookup(entry is not None)
+        return None if entry is None else entry[1]
+
+    def open_entry(
+        self, key: str
+    ) -> tuple[dict[str, Any], IO[bytes]] | None:
+        """
+        :return: Header of a fresh entry and the entry positioned at its content
+        """
+        path = self.path(key)
+        f = None
+        try:
+            f = gzip.open(path, "rb")
+            header = json.loads(f.readline())
+            expires_at = header["expires_at"]
+            fresh = expires_at is None or expires_at >= time.time()
+        except (FileNotFoundError, EOFError, OSError, ValueError):
+            fresh = False
+        if not fresh:
+            if f is not None:
+                f.close()
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.mark_used(path)
+        return header, f
+
+    def mark_used(self, path: Path) -> None:
+        with self._lock:
+            self._used[str(path)] = next(self._sequence)
+
+    def record_lookup(self, hit: bool, size: int = 0) -> None:
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+                self.stats.bytes_saved += size
+            else:
+                self.stats.misses += 1
+
+    def put(self, key: str, response: Response, ttl: float | None) -> None:
+        """
+        :param ttl: Seconds the entry stays fresh, None if it never expires
+        """
+        path = self.path(key)
+        path.parent.mkdir(exist_ok=True)
+        header = {
+            "status_code": response.status_code,
+            "expires_at": None if ttl is None else time.time() + ttl,
+        }
+
+        # Write to a temporary file first so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=COMPRESS_LEVEL
+            ) as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                f.write(response.content)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.mark_used(path)
+
+        with self._lock:
+            self.stats.stores += 1
+            self._size_estimate += size
+            over_limit = self._size_estimate > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache is below its size limit
+        """
+        sized_entries = []
+        for entry in self.entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            sized_entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        with self._lock:
+            used = dict(self._used)
+        # Entries not used by this process go first among equal times
+        sized_entries.sort(key=lambda e: (e[0], used.get(e[2], -1), e[2]))
+        size = sum(entry_size for _, entry_size, _ in sized_entries)
+        target = self.max_bytes * EVICTION_TARGET
+        evicted = []
+        for _, entry_size, entry_path in sized_entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(entry_path)
+                evicted.append(entry_path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+        with self._lock:
+            self.stats.evictions += len(evicted)
+            self._size_estimate = size
+            for entry_path in evicted:
+                self._used.pop(entry_path, None)
+
+    def clear(self) -> None:
+        for entry in self.entries():
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._size_estimate = 0
+            self._used.clear()
+
+
+def estimate_game_bytes(content: bytes) -> int:
+    """
+    :return: Estimated memory of the Game parsed from a feed, from the length of the feed without whitespace
+    """
+    length = len(content) - sum(content.count(c) for c in WHITESPACE)
+    return int(length * PARSED_BYTES_PER_FEED_BYTE)
+
+
+def feed_timestamp(content: bytes) -> str | None:
+    """
+    :return: metaData.timeStamp of a game feed, without decoding the whole feed. None if it is not near the start
+    """
+    match = TIMESTAMP_PATTERN.search(content, 0, FEED_SEARCH_BYTES)
+    return None if match is None else match.group(1).decode()
+
+
+def feed_state(content: bytes) -> str | None:
+    """
+    :return: gameData.status.abstractGameState of a game feed, without decoding the whole feed. None if it is not near the start
+    """
+    match = STATE_PATTERN.search(content, 0, FEED_SEARCH_BYTES)
+    return None if match is None else match.group(1).decode()
+
+
+class GameCache:
+    """
+    Thread safe in memory LRU of parsed games, bounded by their estimated
+    size in bytes. Live games expire after live_ttl and are evicted before
+    any final game, final games never change and are kept until evicted.
+    Games are shared between callers, who must not modify them
+
+    :param max_bytes: Maximum estimated size of all games held
+    :param live_ttl: Seconds a live game is served, None to keep it until evicted
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_GAME_CACHE_BYTES,
+        live_ttl: float | None = DEFAULT_LIVE_TTL,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self.stats = GameCacheStats()
+        # Least recently used first
+        self._live: OrderedDict[Hashable, GameCacheEntry] = OrderedDict()
+        self._final: OrderedDict[Hashable, GameCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._live) + len(self._final)
+
+    def get(self, key: Hashable, count_miss: bool = True) -> Any | None:
+        """
+        :param count_miss: Count a miss in the stats, False when another key is looked up next for the same game
+        :return: The cached game, or None if it is missing or expired
+        """
+        with self._lock:
+            game = self.lookup(key)
+            if game is not None:
+                self.stats.hits += 1
+            elif count_miss:
+                self.stats.misses += 1
+        if game is not None or count_miss:
+            instrumentation.count("game_cache.lookups", hit=game is not None)
+        return game
+
+    def lookup(self, key: Hashable) -> Any | None:
+        # Called with the lock held
+        for entries in (self._final, self._live):
+            entry = entries.get(key)
+            if entry is None:
+                continue
+            if entry.expires_at is not None and (
+                entry.expires_at < time.monotonic()
+            ):
+                self.remove(entries, key)
+                return None
+            entries.move_to_end(key)
+            return entry.game
+        return None
+
+    def put(
+        self, key: Hashable, game: Any, size: int, final: bool = False
+    ) -> None:
+        """
+        :param size: Estimated bytes of game, see estimate_game_bytes
+        :param final: The game is over and kept until evicted
+        """
+        if size > self.max_bytes:
+            return
+        expires_at = None
+        if not final and self.live_ttl is not None:
+            expires_at = time.monotonic() + self.live_ttl
+        entries = self._final if final else self._live
+        with self._lock:
+            for other in (self._live, self._final):
+                if key in other:
+                    self.remove(other, key)
+            entries[key] = GameCacheEntry(game, size, expires_at)
+            self.stats.size_bytes += size
+            self.evict()
+
+    def remove(
+        self, entries: OrderedDict[Hashable, GameCacheEntry], key: Hashable
+    ) -> None:
+        # Called with the lock held
+        self.stats.size_bytes -= entries.pop(key).size
+
+    def evict(self) -> None:
+        """
+        Removes expired live games, then the least recently used live games and then final games until under max_bytes
+        """
+        # Called with the lock held
+        now = time.monotonic()
+        for key in [
+            key
+            for key, entry in self._live.items()
+            if entry.expires_at is not None and entry.expires_at < now
+        ]:
+            self.remove(self._live, key)
+            self.stats.evictions += 1
+        for entries in (self._live, self._final):
+            while entries and self.stats.size_bytes > self.max_bytes:
+                self.remove(entries, next(iter(entries)))
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._live.clear()
+            self._final.clear()
+            self.stats.size_bytes = 0
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from . import instrumentation
+
+
+@dataclass
+class CoalescerStats:
+    # Requests that ran, and requests that got the result of another one
+    fetches: int = 0
+    shared: int = 0
+
+
+class FlightAbandoned(Exception):
+    """
+    Set on a flight whose leader was cancelled or interrupted, its followers
+    run the request again instead of failing with it
+    """
+
+
+@dataclass
+class Flight:
+    future: Future
+    # time.monotonic() when the result was set, None while in flight
+    finished: float | None = None
+
+
+class RequestCoalescer:
+    """
+    Single flight for identical requests: while one is running, threads and
+    async tasks making the same request wait for it and get the same result
+    instead of fetching and parsing it again. Results are shared, callers
+    must not modify them. Errors are passed to every waiter but not kept.
+    If the caller running a request is cancelled, a waiter runs it instead
+
+    :param window: Seconds a result is still handed out after it completes, e.g. 1 to serve live games polled by many clients. 0 only shares requests in flight
+    """
+
+    def __init__(self, window: float = 0.0) -> None:
+        self.window = window
+        self.stats = CoalescerStats()
+        self._flights: dict[Hashable, Flight] = {}
+        self._lock = threading.Lock()
+
+    def join(self, key: Hashable) -> tuple[Flight, bool]:
+        """
+        :return: The flight of key, and True if the caller has to run it
+        """
+        now = time.monotonic()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and (
+                flight.finished is None or now - flight.finished < self.window
+            ):
+                self.stats.shared += 1
+                leader = False
+            else:
+                self.drop_expired(now)
+                future: Future = Future()
+                # Running, so an async waiter that is cancelled cannot
+                # cancel the future shared with the others
+                future.set_running_or_notify_cancel()
+                flight = self._flights[key] = Flight(future)
+                self.stats.fetches += 1
+                leader = True
+        instrumentation.count("request.coalesced", shared=not leader)
+        return flight, leader
+
+    def land(
+        self,
+        key: Hashable,
+        flight: Flight,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            flight.finished = time.monotonic()
+            keep = error is None and self.window > 0
+            if not keep and self._flights.get(key) is flight:
+                del self._flights[key]
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(result)
+
+    def abandon(self, key: Hashable, flight: Flight) -> None:
+        """
+        Drops a flight whose leader stopped without a result, e.g. an async task cancelled because its client left
+        """
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.future.set_exception(FlightAbandoned())
+
+    def run(self, key: Hashable, f: Callable[[], Any]) -> Any:
+        """
+        :return: Result of f, or of the call of f already running for key
+        """
+        while True:
+            flight, leader = self.join(key)
+            if leader:
+                try:
+                    result = f()
+                except Exception as e:
+                    self.land(key, flight, error=e)
+                    raise
+                except BaseException:
+                    self.abandon(key, flight)
+                    raise
+                self.land(key, flight, result)
+                return result
+            try:
+                return flight.future.result()
+            except FlightAbandoned:
+                continue
+
+    async def run_async(
+        self, key: Hashable, f: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Async version of run, sharing flights with run
+        """
+        while True:
+            flight, leader = self.join(key)
+            if leader:
+                try:
+                    result = await f()
+                except Exception as e:
+                    self.land(key, flight, error=e)
+                    raise
+                except BaseException:
+                    self.abandon(key, flight)
+                    raise
+                self.land(key, flight, result)
+                return result
+            try:
+                return await asyncio.wrap_future(flight.future)
+            except FlightAbandoned:
+                continue
+
+    def drop_expired(self, now: float) -> None:
+        # Called with the lock held, so results do not pile up
+        for key in [
+            key
+            for key, flight in self._flights.items()
+            if flight.finished is not None
+            and now - flight.finished >= self.window
+        ]:
+            del self._flights[key]
+
+    def clear(self) -> None:
+        """
+        Forgets completed results, requests in flight still complete
+        """
+        with self._lock:
+            self._flights = {
+                key: flight
+                for key, flight in self._flights.items()
+                if flight.finished is None
+            }
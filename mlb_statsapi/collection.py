@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import gzip
+import math
+import os
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+import pandas as pd
+
+from .cache import ResponseCache
+from .columnar import INDEX_NAME
+from .constants import ROOT_KEY, Numeric
+from .datatypes import Game, Metadata, PlayEvent
+from .request_datatypes import GameRequest
+from .transport import loads
+
+# A feed file, a raw feed, or a game pk to request
+GameSource = Union[str, Path, dict, int]
+GAME_PK_INDEX_NAME = "game_pk"
+# Chunks handed to each worker, more evens out games of different sizes
+CHUNKS_PER_WORKER = 4
+# Games parsed again on demand that are kept, so that looking up several
+# play events of a game parses it once
+RECENT_GAMES = 8
+
+
+@dataclass
+class ParseOptions:
+    pitch_metrics: Sequence[str] | None = None
+    swing_metrics: Sequence[str] | None = None
+    keep_games: bool = False
+    lazy: bool = False
+    numeric: Numeric = Numeric.DECIMAL
+
+
+@dataclass
+class GameFailure:
+    """
+    A game that could not be loaded or parsed. The error is kept as text as
+    not every exception can be sent back from a worker process
+    """
+
+    index: int
+    error: str
+    traceback: str
+    # Filled in by the parent process, raw feeds are not sent back
+    source: Any = None
+
+    def __str__(self) -> str:
+        source = (
+            f"feed {self.index}"
+            if isinstance(self.source, dict)
+            else self.source
+        )
+        return f"{source}: {self.error}"
+
+
+@dataclass
+class ParsedGame:
+    """
+    Everything a worker sends back for one game. The Game itself is only sent
+    with keep_games, as pickling it costs about as much as parsing it
+    """
+
+    index: int
+    game_pk: int
+    play_ids: list[str]
+    pitch_table: pd.DataFrame
+    swing_table: pd.DataFrame
+    game: Game | None = None
+    # Filled in by the parent process, raw feeds are not sent back
+    source: Any = None
+
+
+# Cache of raw responses for game pk sources in worker processes
+_worker_cache: ResponseCache | None = None
+
+
+def init_worker(cache_directory: str | None, cache_max_bytes: int) -> None:
+    global _worker_cache
+    if cache_directory is not None:
+        _worker_cache = ResponseCache(cache_directory, cache_max_bytes)
+
+
+def load_game(
+    source: GameSource,
+    lazy: bool = False,
+    numeric: Numeric = Numeric.DECIMAL,
+    cache: ResponseCache | None = None,
+) -> Game:
+    """
+    :param source: Path of a feed file, optionally gzipped, a raw feed, or a game pk to request
+    """
+    if isinstance(source, int):
+        return GameRequest(
+            source, lazy=lazy, cache=cache, numeric=numeric
+        ).make_request()
+
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rb") as f:
+            source = loads(f.read())
+
+    return Game(
+        source, Metadata(keys=[ROOT_KEY]), lazy=lazy, numeric=numeric
+    )
+
+
+def parse_game(
+    index: int,
+    source: GameSource,
+    options: ParseOptions,
+    cache: ResponseCache | None = None,
+) -> ParsedGame | GameFailure:
+    try:
+        game = load_game(source, options.lazy, options.numeric, cache)
+        return ParsedGame(
+            index=index,
+            game_pk=game.game_pk,
+            play_ids=game.play_ids,
+            pitch_table=game.get_pitch_metrics_table(options.pitch_metrics),
+            swing_table=game.get_swing_metrics_table(options.swing_metrics),
+            game=game if options.keep_games else None,
+        )
+    except Exception as e:
+        return GameFailure(
+            index=index,
+            error=f"{type(e).__name__}: {e}",
+            traceback=traceback.format_exc(),
+        )
+
+
+def parse_chunk(
+    sources: list[tuple[int, GameSource]],
+    options: ParseOptions,
+    cache: ResponseCache | None = None,
+) -> list[ParsedGame | GameFailure]:
+    """
+    :param cache: Cache for game pk sources, defaults to the one of this worker process
+    """
+    cache = cache or _worker_cache
+    return [
+        parse_game(index, source, options, cache)
+        for index, source in sources
+    ]
+
+
+def chunk(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+@dataclass
+class GameCollection:
+    """
+    Many games parsed together, e.g. a season. Games are parsed in a process
+    pool and only their pitch and swing tables and play ids are sent back,
+    so the parent process does not repeat the work. Individual games are
+    parsed again on demand, unless they were kept with keep_games
+    """
+
+    results: dict[int, ParsedGame] = field(default_factory=dict)
+    failures: list[GameFailure] = field(default_factory=list)
+    options: ParseOptions = field(default_factory=ParseOptions)
+    # Cache of raw responses for game pk sources parsed again on demand
+    cache: ResponseCache | None = field(default=None, repr=False)
+
+    _game_pk_by_play_id: dict[str, int] | None = field(
+        default=None, init=False, repr=False
+    )
+    _pitch_table: pd.DataFrame | None = field(
+        default=None, init=False, repr=False
+    )
+    _swing_table: pd.DataFrame | None = field(
+        default=None, init=False, repr=False
+    )
+    _recent_games: OrderedDict[int, Game] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    @classmethod
+    def parse(
+        cls,
+        sources: Iterable[GameSource],
+        processes: int | None = None,
+        chunksize: int | None = None,
+        pitch_metrics: Sequence[str] | None = None,
+        swing_metrics: Sequence[str] | None = None,
+        keep_games: bool = False,
+        lazy: bool = False,
+        numeric: Numeric = Numeric.DECIMAL,
+        cache: ResponseCache | None = None,
+    ) -> "GameCollection":
+        """
+        :param sources: Paths of feed files, optionally gzipped, raw feeds or game pks to request
+        :param processes: Worker processes, defaults to the number of CPUs. 1 parses in this process
+        :param chunksize: Games per unit of work, defaults to spreading the games over 4 chunks per worker
+        :param pitch_metrics: Optional metrics of the pitch table, see Game.get_pitch_metrics_table
+        :param swing_metrics: Optional metrics of the swing table, see Game.get_swing_metrics_table
+        :param keep_games: Send the parsed Game objects back instead of parsing them again on demand
+        :param lazy: Parse games in lazy mode
+        :param numeric: Type of decimal metrics
+        :param cache: Cache of raw responses for game pk sources
+        """
+        options = ParseOptions(
+            pitch_metrics, swing_metrics, keep_games, lazy, numeric
+        )
+        sources = list(sources)
+        processes = processes or os.cpu_count() or 1
+        chunksize = chunksize or max(
+            1, math.ceil(len(sources) / (processes * CHUNKS_PER_WORKER))
+        )
+        chunks = chunk(list(enumerate(sources)), chunksize)
+
+        if processes == 1:
+            outputs = [parse_chunk(c, options, cache) for c in chunks]
+            return cls.from_outputs(sources, outputs, options, cache)
+
+        initargs = (
+            None if cache is None else str(cache.directory),
+            0 if cache is None else cache.max_bytes,
+        )
+        with ProcessPoolExecutor(
+            processes, initializer=init_worker, initargs=initargs
+        ) as pool:
+            outputs = pool.map(parse_chunk, chunks, [options] * len(chunks))
+            return cls.from_outputs(sources, outputs, options, cache)
+
+    @classmethod
+    def from_directory(
+        cls, directory: str | Path, pattern: str = "*.json", **kwargs: Any
+    ) -> "GameCollection":
+        """
+        Parses every feed file in directory matching pattern, see parse
+        """
+        return cls.parse(sorted(Path(directory).glob(pattern)), **kwargs)
+
+    @classmethod
+    def from_outputs(
+        cls,
+        sources: list[GameSource],
+        outputs: Iterable[list[ParsedGame | GameFailure]],
+        options: ParseOptions,
+        cache: ResponseCache | None = None,
+    ) -> "GameCollection":
+        collection = cls(options=options, cache=cache)
+        for output in outputs:
+            for result in output:
+                result.source = sources[result.index]
+                if isinstance(result, GameFailure):
+                    collection.failures.append(result)
+                elif result.game_pk in collection.results:
+                    first = collection.results[result.game_pk]
+                    collection.failures.append(
+                        GameFailure(
+                            index=result.index,
+                            error=f"Duplicate of game {result.game_pk}"
+                            f" parsed from source {first.index}",
+                            traceback="",
+                            source=result.source,
+                        )
+                    )
+                else:
+                    collection.results[result.game_pk] = result
+        return collection
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[Game]:
+        for game_pk in self.results:
+            yield self.game(game_pk)
+
+    @property
+    def game_pks(self) -> list[int]:
+        return list(self.results)
+
+    @property
+    def game_pk_by_play_id(self) -> dict[str, int]:
+        if self._game_pk_by_play_id is None:
+            self._game_pk_by_play_id = {
+                play_id: result.game_pk
+                for result in self.results.values()
+                for play_id in result.play_ids
+                if play_id is not None
+            }
+        return self._game_pk_by_play_id
+
+    def game(self, game_pk: int) -> Game:
+        """
+        :return: The kept Game, or the game parsed again from its source. The last RECENT_GAMES parsed again are kept too
+        """
+        result = self.results[game_pk]
+        if result.game is not None:
+            return result.game
+        game = self._recent_games.get(game_pk)
+        if game is not None:
+            self._recent_games.move_to_end(game_pk)
+            return game
+        game = load_game(
+            result.source, self.options.lazy, self.options.numeric, self.cache
+        )
+        self._recent_games[game_pk] = game
+        if len(self._recent_games) > RECENT_GAMES:
+            self._recent_games.popitem(last=False)
+        return game
+
+    def play_event(self, play_id: str) -> PlayEvent:
+        game = self.game(self.game_pk_by_play_id[play_id])
+        return game.play_event_by_play_id[play_id]
+
+    def concat_tables(self, tables: list[pd.DataFrame]) -> pd.DataFrame:
+        if not tables:
+            return pd.DataFrame(
+                index=pd.MultiIndex.from_tuples(
+                    [], names=[GAME_PK_INDEX_NAME, INDEX_NAME]
+                )
+            )
+        # Categories differ between games, unify them to stay categorical
+        categories: dict[str, set] = {}
+        for table in tables:
+            for name, dtype in table.dtypes.items():
+                if isinstance(dtype, pd.CategoricalDtype):
+                    categories.setdefault(name, set()).update(
+                        dtype.categories
+                    )
+        dtypes = {
+            name: pd.CategoricalDtype(sorted(values))
+            for name, values in categories.items()
+        }
+        tables = [
+            table.astype(
+                {k: v for k, v in dtypes.items() if k in table.columns}
+            )
+            for table in tables
+        ]
+        return pd.concat(
+            tables,
+            keys=self.game_pks,
+            names=[GAME_PK_INDEX_NAME, INDEX_NAME],
+        )
+
+    @property
+    def pitch_table(self) -> pd.DataFrame:
+        """
+        Pitch tables of all games, indexed by game pk and play id
+        """
+        if self._pitch_table is None:
+            self._pitch_table = self.concat_tables(
+                [result.pitch_table for result in self.results.values()]
+            )
+        return self._pitch_table
+
+    @property
+    def swing_table(self) -> pd.DataFrame:
+        """
+        Swing tables of all games, indexed by game pk and play id
+        """
+        if self._swing_table is None:
+            self._swing_table = self.concat_tables(
+                [result.swing_table for result in self.results.values()]
+            )
+        return self._swing_table
@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from . import utils as ut
+from .constants import PlayEventType
+
+# Dataclass fields of Pitch and Swing mapped to their location in the raw json
+PITCH_FIELD_PATHS: dict[str, tuple[str, ...]] = {
+    "start_speed": ("startSpeed",),
+    "end_speed": ("endSpeed",),
+    "spin_rate": ("breaks", "spinRate"),
+    "spin_direction": ("breaks", "spinDirection"),
+    "zone": ("zone",),
+}
+SWING_FIELD_PATHS: dict[str, tuple[str, ...]] = {
+    "launch_angle": ("launchAngle",),
+    "launch_speed": ("launchSpeed",),
+    "total_distance": ("totalDistance",),
+    "trajectory": ("trajectory",),
+}
+# Properties that are aliases of a dataclass field
+FIELD_ALIASES = {"velocity": "start_speed"}
+# Pitch.pitch_type comes from the play event rather than pitchData
+PITCH_TYPE_PATH = ("details", "type", "description")
+
+# Locations in the raw json of a play
+BATTER_ID_PATH = ("matchup", "batter", "id")
+PITCHER_ID_PATH = ("matchup", "pitcher", "id")
+INNING_PATH = ("about", "inning")
+AT_BAT_INDEX_PATH = ("about", "atBatIndex")
+
+# Columns of the play event table mapped to their location in the raw json
+# of a play event, or of its play for PLAY_COLUMN_PATHS
+PLAY_EVENT_COLUMN_PATHS: dict[str, tuple[str, ...]] = {
+    "index": ("index",),
+    "type": ("type",),
+    "is_pitch": ("isPitch",),
+    "event_type": ("details", "eventType"),
+    "description": ("details", "description"),
+    "code": ("details", "code"),
+    "pitch_type": PITCH_TYPE_PATH,
+    "balls": ("count", "balls"),
+    "strikes": ("count", "strikes"),
+    "outs": ("count", "outs"),
+    "start_time": ("startTime",),
+    "end_time": ("endTime",),
+}
+PLAY_COLUMN_PATHS: dict[str, tuple[str, ...]] = {
+    "at_bat_index": AT_BAT_INDEX_PATH,
+    "inning": INNING_PATH,
+    "is_top_inning": ("about", "isTopInning"),
+    "pitcher_id": PITCHER_ID_PATH,
+    "batter_id": BATTER_ID_PATH,
+}
+
+MATCH_UP_COLUMNS = ("pitchHand", "batSide")
+CATEGORICAL_COLUMNS = {
+    "pitch_type",
+    "type",
+    "event_type",
+    "trajectory",
+    ".trajectory",
+    *MATCH_UP_COLUMNS,
+}
+# Column used for swings without hit data, matching the dict based tables
+EMPTY_SWING_COLUMN = ""
+INDEX_NAME = "play_id"
+
+
+@dataclass
+class PitchFilter:
+    """
+    Selects pitch events by play id, player, inning or pitch type. Every
+    criterion that is set has to match. Collections are turned into sets, so
+    long lists of ids are cheap to check
+
+    :param play_ids: Play ids to keep
+    :param pitcher_ids: Player ids of pitchers to keep
+    :param batter_ids: Player ids of batters to keep
+    :param innings: Innings to keep
+    :param pitch_types: Pitch type descriptions to keep, e.g. PitchTypes.SLIDER
+    :param predicate: Called with the raw json of every play event that matches the other criteria, keeps it if it returns True
+    """
+
+    play_ids: Collection[str] | None = None
+    pitcher_ids: Collection[int] | None = None
+    batter_ids: Collection[int] | None = None
+    innings: Collection[int] | None = None
+    pitch_types: Collection[str] | None = None
+    predicate: Callable[[dict[str, Any]], bool] | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("play_ids", "pitcher_ids", "batter_ids", "innings"):
+            values = getattr(self, name)
+            if values is not None:
+                setattr(self, name, frozenset(values))
+        if self.pitch_types is not None:
+            # Hash enum members by their value
+            self.pitch_types = frozenset(
+                getattr(pitch_type, "value", pitch_type)
+                for pitch_type in self.pitch_types
+            )
+
+    @classmethod
+    def combine(
+        cls,
+        play_ids: Collection[str] | None,
+        where: PitchFilter | None,
+    ) -> PitchFilter | None:
+        """
+        :return: where restricted to play_ids
+        """
+        if not play_ids:
+            return where
+        if where is None:
+            return cls(play_ids=play_ids)
+        if where.play_ids is not None:
+            play_ids = where.play_ids & frozenset(play_ids)
+        return dataclasses.replace(where, play_ids=play_ids)
+
+    def matches_play(self, play: dict[str, Any]) -> bool:
+        """
+        :param play: Raw json of a play
+        :return: False if no pitch event of the play can match
+        """
+        return (
+            (
+                self.pitcher_ids is None
+                or ut.compiled_path_value(play, PITCHER_ID_PATH)
+                in self.pitcher_ids
+            )
+            and (
+                self.batter_ids is None
+                or ut.compiled_path_value(play, BATTER_ID_PATH)
+                in self.batter_ids
+            )
+            and (
+                self.innings is None
+                or ut.compiled_path_value(play, INNING_PATH) in self.innings
+            )
+        )
+
+    def matches_play_event(self, play_event: dict[str, Any]) -> bool:
+        """
+        :param play_event: Raw json of a pitch event of a play that matches
+        """
+        return (
+            (
+                self.play_ids is None
+                or play_event.get("playId") in self.play_ids
+            )
+            and (
+                self.pitch_types is None
+                or ut.compiled_path_value(play_event, PITCH_TYPE_PATH)
+                in self.pitch_types
+            )
+            and (self.predicate is None or self.predicate(play_event))
+        )
+
+
+class ColumnBuffers:
+    """
+    Collects rows into one list per column, padding columns that are missing
+    from a row with None
+    """
+
+    def __init__(self) -> None:
+        self.index: list[str] = []
+        self.columns: dict[str, list[Any]] = {}
+
+    def add_row(self, play_id: str) -> None:
+        self.index.append(play_id)
+
+    def set(self, name: str, value: Any) -> None:
+        row = len(self.index) - 1
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = []
+        if len(column) < row:
+            column.extend([None] * (row - len(column)))
+        column.append(value)
+
+    def set_flattened(self, data: dict[str, Any], prefix: str = "") -> None:
+        """
+        Adds every terminal field of data, keyed the same way as
+        Base.all_terminal_fields
+        """
+        for k, v in data.items():
+            key = f"{prefix}.{k}"
+            if type(v) == dict:
+                self.set_flattened(v, key)
+            elif type(v) == list:
+                self.set(key, "LIST")
+            else:
+                self.set(key, v)
+
+    def finish(self) -> dict[str, np.ndarray | pd.Categorical]:
+        n = len(self.index)
+        arrays = {}
+        for name, column in self.columns.items():
+            if len(column) < n:
+                column.extend([None] * (n - len(column)))
+            arrays[name] = to_typed_array(name, column)
+        return arrays
+
+
+def to_typed_array(
+    name: str, values: list[Any]
+) -> np.ndarray | pd.Categorical:
+    """
+    Numeric columns become float64 with NaN for missing values, known
+    categorical columns become pd.Categorical and anything else stays object
+    """
+    if name in CATEGORICAL_COLUMNS:
+        return pd.Categorical(values)
+
+    present = [v for v in values if v is not None]
+    if present and all(type(v) in (int, float) for v in present):
+        return np.array(
+            [np.nan if v is None else v for v in values], dtype=np.float64
+        )
+
+    return np.array(values, dtype=object)
+
+
+def metric_paths(
+    metrics: Sequence[str], field_paths: dict[str, tuple[str, ...]]
+) -> list[tuple[str, tuple[ut.PathStep, ...]]]:
+    paths = []
+    for metric in metrics:
+        name = FIELD_ALIASES.get(metric, metric)
+        if name in field_paths:
+            paths.append((metric, field_paths[name]))
+        elif metric[0] == ".":
+            paths.append((metric, ut.compile_path(metric)))
+        else:
+            # Same fallback as Base.__getattr__
+            paths.append((metric, (metric,)))
+    return paths
+
+
+def iter_pitch_events(
+    raw_game: dict[str, Any],
+    play_ids: Sequence[str] | None = None,
+    where: PitchFilter | None = None,
+) -> Iterator[tuple[str, dict[str, Any], dict[str, Any]]]:
+    """
+    :return: Iterator of play id, play event json and match up json for every
+        pitch event that matches play_ids and where, in game order
+    """
+    where = PitchFilter.combine(play_ids, where)
+    for play in raw_game["liveData"]["plays"]["allPlays"]:
+        if where is not None and not where.matches_play(play):
+            continue
+        matchup = play["matchup"]
+        for play_event in play["playEvents"]:
+            if play_event.get("type") != PlayEventType.PITCH.value:
+                continue
+            play_id = play_event.get("playId")
+            if play_id is None:
+                continue
+            if where is not None and not where.matches_play_event(play_event):
+                continue
+            yield play_id, play_event, matchup
+
+
+def set_match_up_values(
+    buffers: ColumnBuffers, matchup: dict[str, Any]
+) -> None:
+    buffers.set("pitchHand", matchup["pitchHand"]["code"])
+    buffers.set("batSide", matchup["batSide"]["code"])
+
+
+def build_table(
+    buffers: ColumnBuffers, as_arrays: bool
+) -> pd.DataFrame | dict[str, np.ndarray]:
+    columns = buffers.finish()
+    if as_arrays:
+        arrays = {
+            name: (
+                np.asarray(column, dtype=object)
+                if isinstance(column, pd.Categorical)
+                else column
+            )
+            for name, column in columns.items()
+        }
+        arrays[INDEX_NAME] = np.array(buffers.index, dtype=object)
+        return arrays
+
+    return pd.DataFrame(columns, index=pd.Index(buffers.index))
+
+
+def pitch_metrics_table(
+    raw_game: dict[str, Any],
+    metrics: Sequence[str] | None = None,
+    play_ids: Sequence[str] | None = None,
+    as_arrays: bool = False,
+    where: PitchFilter | None = None,
+) -> pd.DataFrame | dict[str, np.ndarray]:
+    """
+    Builds the same table as Game.get_filtered_pitch_metrics_by_play_id_as_df
+    in a single pass over the raw game json, without creating Pitch objects
+
+    :param raw_game: Raw game feed json
+    :param metrics: Optional list of metrics for the result. Omit to get all metrics
+    :param play_ids: Optional list of play ids to filter down the result
+    :param as_arrays: Return a dict of NumPy arrays, including the play ids, instead of a DataFrame
+    :param where: Optional filter of the pitches in the result
+
+    :result: DataFrame with plays and metrics
+    """
+    paths = metric_paths(metrics, PITCH_FIELD_PATHS) if metrics else None
+
+    buffers = ColumnBuffers()
+    for play_id, play_event, matchup in iter_pitch_events(
+        raw_game, play_ids, where
+    ):
+        if not play_event.get("isPitch"):
+            continue
+        pitch_data = play_event["pitchData"]
+        pitch_type = ut.compiled_path_value(play_event, PITCH_TYPE_PATH)
+
+        buffers.add_row(play_id)
+        if paths is None:
+            for name, keys in PITCH_FIELD_PATHS.items():
+                buffers.set(name, ut.compiled_path_value(pitch_data, keys))
+            buffers.set("pitch_type", pitch_type)
+            buffers.set_flattened(pitch_data)
+        else:
+            for metric, keys in paths:
+                if metric == "pitch_type":
+                    buffers.set(metric, pitch_type)
+                else:
+                    buffers.set(
+                        metric, ut.compiled_path_value(pitch_data, keys)
+                    )
+        set_match_up_values(buffers, matchup)
+
+    return build_table(buffers, as_arrays)
+
+
+def swing_metrics_table(
+    raw_game: dict[str, Any],
+    metrics: Sequence[str] | None = None,
+    play_ids: Sequence[str] | None = None,
+    as_arrays: bool = False,
+    where: PitchFilter | None = None,
+) -> pd.DataFrame | dict[str, np.ndarray]:
+    """
+    Builds the same table as Game.get_filtered_swing_metrics_by_play_id_as_df
+    in a single pass over the raw game json, without creating Swing objects
+
+    :param raw_game: Raw game feed json
+    :param metrics: Optional list of metrics for the result. Omit to get all metrics
+    :param play_ids: Optional list of play ids to filter down the result
+    :param as_arrays: Return a dict of NumPy arrays, including the play ids, instead of a DataFrame
+    :param where: Optional filter of the pitches in the result
+
+    :result: DataFrame with plays and metrics
+    """
+    paths = metric_paths(metrics, SWING_FIELD_PATHS) if metrics else None
+
+    buffers = ColumnBuffers()
+    for play_id, play_event, matchup in iter_pitch_events(
+        raw_game, play_ids, where
+    ):
+        hit_data = play_event.get("hitData")
+
+        buffers.add_row(play_id)
+        if paths is not None:
+            for metric, keys in paths:
+                buffers.set(
+                    metric,
+                    (
+                        ut.compiled_path_value(hit_data, keys)
+                        if hit_data
+                        else None
+                    ),
+                )
+        elif hit_data is None:
+            buffers.set(EMPTY_SWING_COLUMN, None)
+        else:
+            for name, keys in SWING_FIELD_PATHS.items():
+                buffers.set(name, ut.compiled_path_value(hit_data, keys))
+            buffers.set_flattened(hit_data)
+        set_match_up_values(buffers, matchup)
+
+    return build_table(buffers, as_arrays)
+
+
+def play_event_table(
+    raw_game: dict[str, Any], as_arrays: bool = False
+) -> pd.DataFrame | dict[str, np.ndarray]:
+    """
+    Builds a table with one row for every play event, indexed by play id,
+    which is missing for events that are not pitches or pickoffs
+
+    :param raw_game: Raw game feed json
+    :param as_arrays: Return a dict of NumPy arrays, including the play ids, instead of a DataFrame
+
+    :result: DataFrame with play events
+    """
+    buffers = ColumnBuffers()
+    for play in raw_game["liveData"]["plays"]["allPlays"]:
+        play_values = [
+            (name, ut.compiled_path_value(play, keys))
+            for name, keys in PLAY_COLUMN_PATHS.items()
+        ]
+        for play_event in play["playEvents"]:
+            buffers.add_row(play_event.get("playId"))
+            for name, value in play_values:
+                buffers.set(name, value)
+            for name, keys in PLAY_EVENT_COLUMN_PATHS.items():
+                buffers.set(name, ut.compiled_path_value(play_event, keys))
+
+    return build_table(buffers, as_arrays)
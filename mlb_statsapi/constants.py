@@ -19,12 +19,59 @@ OTHER_EVENT_TYPES = {
     "stepoff",
 }
 VIDEO_URL_ROOT = "https://www.mlb.com/video/"
+# Detailed states of scheduled games that have no feed to fetch on that date
+NOT_PLAYED_STATES = {"Postponed", "Cancelled"}
 
 
 class MetaFields(str, Enum):
     NOT_FOUND = "NOT_FOUND"
 
 
+class Numeric(str, Enum):
+    """
+    Type used for decimal metrics like speeds and distances
+    """
+
+    DECIMAL = "decimal"
+    FLOAT = "float"
+
+
+class Strictness(str, Enum):
+    """
+    How errors while extracting a field from the raw json are handled
+    """
+
+    # Record the error on the object and use MetaFields.NOT_FOUND as the value
+    TRAP = "trap"
+    # Let the error propagate
+    RAISE = "raise"
+
+
+class GameState(str, Enum):
+    """
+    Abstract state of a game in the schedule and the game feed
+    """
+
+    PREVIEW = "Preview"
+    LIVE = "Live"
+    FINAL = "Final"
+
+
+class VideoDecoration(str, Enum):
+    """
+    When GameRequest fetches the video urls of the plays of a game
+    """
+
+    # Never, play_video falls back to a url built from the play description
+    OFF = "off"
+    # Before the game is returned
+    EAGER = "eager"
+    # The first time a play video is looked up
+    DEFERRED = "deferred"
+    # In the background while the game is parsed, waited for on first lookup
+    BACKGROUND = "background"
+
+
 class PlayResult(str, Enum):
     IN_PLAY = "IN_PLAY"
     STRIKE = "STRIKE"
@@ -65,6 +112,11 @@ class PlayEventType(str, Enum):
     STEPOFF = "stepoff"
 
 
+class LiveEventType(str, Enum):
+    NEW_PLAY = "new_play"
+    NEW_PITCH = "new_pitch"
+
+
 class PitchTypes(str, Enum):
     FOUR_SEAM_FASTBALL = "Four-Seam Fastball"
     SINKER = "Sinker"
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import time
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Sequence
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Sequence
 
+import numpy as np
 import pandas as pd
 
+from . import columnar, instrumentation
+from .columnar import PitchFilter
 from . import utils as ut
-from .constants import (NULL_KEY, VIDEO_URL_ROOT, PlayEventType, PlayResult,
+from .constants import (NOT_PLAYED_STATES, NULL_KEY, VIDEO_URL_ROOT,
+                        GameState, Numeric, PlayEventType, PlayResult,
                         Trajectory, MetaFields)
-from .decorators import t
+from .decorators import FieldError, t
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +29,89 @@ def decimal_from_float(f: float) -> Decimal:
     return Decimal(str(f))
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def subclass_field_names(cls: type) -> frozenset[str]:
+    parent_fields = {f.name for f in dataclasses.fields(Base)}
+    return frozenset(
+        f.name
+        for f in dataclasses.fields(cls)
+        if f.name not in parent_fields
+    )
+
+
+def compile_metrics(
+    metrics: Sequence[str],
+) -> dict[str, tuple[ut.PathStep, ...] | None]:
+    """
+    Compiles the raw json paths in metrics once so they can be reused per row
+    """
+    return {
+        metric: ut.compile_path(metric) if metric[0] == "." else None
+        for metric in metrics
+    }
+
+
 class Metadata:
-    keys: list[str]
+    """
+    Location of an object in the raw json. Each level only stores the keys it
+    adds and a pointer to its parent, so nested objects share the path of
+    their parents instead of copying it
+    """
+
+    __slots__ = ("_keys", "parent")
+
+    def __init__(
+        self,
+        keys: Sequence[str | int] = (),
+        parent: Metadata | None = None,
+    ) -> None:
+        # Ints are list indices
+        self._keys = tuple(keys)
+        self.parent = parent
+
+    @property
+    def keys(self) -> list[str]:
+        nodes = []
+        node = self
+        while node is not None:
+            nodes.append(node)
+            node = node.parent
+        return [
+            f"[{key}]" if type(key) == int else key
+            for node in reversed(nodes)
+            for key in node._keys
+        ]
+
+    @property
+    def pattern(self) -> str:
+        """
+        :return: Path with every list index written as [], the same for all elements of a list
+        """
+        keys = []
+        node = self
+        while node is not None:
+            keys.extend(reversed(node._keys))
+            node = node.parent
+        return ".".join(
+            "[]" if type(key) == int else key for key in reversed(keys)
+        )
 
     def add_key(self, key: str) -> "Metadata":
-        return Metadata(keys=list(self.keys) + [key])
+        return Metadata((key,), self)
 
     def add_keys(self, keys: list[str]) -> "Metadata":
-        return Metadata(keys=list(self.keys) + keys)
+        return Metadata(keys, self)
 
     def add_key_i(self, i: int) -> "Metadata":
-        return self.add_key(f"[{i}]")
+        return Metadata((i,), self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Metadata):
+            return NotImplemented
+        return self.keys == other.keys
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.keys))
 
     def __str__(self) -> str:
         return ".".join(self.keys)
@@ -43,7 +120,7 @@ class Metadata:
         return str(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Base:
     _raw: dict[str, Any] = field(repr=False)
     _metadata: Metadata = field(
@@ -51,60 +128,178 @@ class Base:
     )  # TODO Verify this creates new copy of list
     # Used for passing optional extra data to decorate the object
     _extra_fields: dict[str, Any] = field(default_factory=dict)
+    # Fields that could not be extracted from the raw json
+    _errors: list[FieldError] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Defer the fields in _lazy_fields until they are first accessed
+    lazy: bool = field(
+        default=False, repr=False, compare=False, kw_only=True
+    )
+    # Type of decimal metrics, Decimal is exact but float is smaller and faster
+    numeric: Numeric = field(
+        default=Numeric.DECIMAL, repr=False, compare=False, kw_only=True
+    )
+
+    # Fields computed by a _load_<name> method, either in __post_init__ or
+    # on first access when lazy
+    _lazy_fields: ClassVar[tuple[str, ...]] = ()
 
     # TODO Add a post post init to check that no FAKE_DEFAULT are still there
     def init_helper(self) -> None:
-        logger.debug(f"{type(self)} {self._metadata}")
-        pass
+        # Formatted only if debug logging is on, building the path is not free
+        logger.debug("%s %s", type(self), self._metadata)
+        if instrumentation.sink is not None:
+            instrumentation.sink.count(
+                "datatype.constructed", 1, {"type": type(self).__name__}
+            )
+
+    def init_lazy_fields(self) -> None:
+        """
+        Computes the lazy fields now unless this object is lazy
+        """
+        if self.lazy:
+            return
+
+        for name in self._lazy_fields:
+            setattr(self, name, self.load_field(name))
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        :return: False if the lazy field name has not been computed yet
+        """
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def load_field(self, name: str) -> Any:
+        return self.trap(name, getattr(self, f"_load_{name}"))
+
+    def number(self, value: int | float) -> Decimal | float:
+        """
+        Converts a number from the raw json to the type set by numeric
+        """
+        if self.numeric == Numeric.FLOAT:
+            return float(value)
+        return decimal_from_float(value)
+
+    def trap(self, name: str, f: Callable[[], Any]) -> Any:
+        """
+        Extract a field with t, recording any error against this object
+        """
+        return t(f, self._errors, self._metadata, name)
+
+    @property
+    def field_errors(self) -> list[FieldError]:
+        """
+        :return: Errors hit while extracting fields of this object
+        """
+        return self._errors
 
     @classmethod
     def subclass_field_names(cls) -> set[str]:
         """
         Returns all explicitly defined fields in the subclass
         """
-        parent_fields = {f.name for f in dataclasses.fields(Base)}
-        field_names = {
-            f.name
-            for f in dataclasses.fields(cls)
-            if f.name not in parent_fields
-        }
-        return field_names
+        return set(subclass_field_names(cls))
+
+    @property
+    def terminal_field_schema(
+        self,
+    ) -> dict[str, tuple[ut.PathStep, ...] | None]:
+        """
+        Maps all terminal fields to their compiled path
+        """
+        paths = self.subclass_field_names()
+        ut.add_terminal_paths(self._raw, "", paths)
+        return compile_metrics(paths)
+
+    @classmethod
+    def union_field_schema(
+        cls, objects: Iterable[Base]
+    ) -> dict[str, tuple[ut.PathStep, ...] | None]:
+        """
+        Maps the terminal fields of any of objects to their compiled path, to flatten every row of a table with one schema
+        """
+        paths = cls.subclass_field_names()
+        for obj in objects:
+            ut.add_terminal_paths(obj._raw, "", paths)
+        return compile_metrics(paths)
 
     @property
     def all_terminal_fields(self) -> set[str]:
         """
         Returns all explicitly defined fields in the subclass plus all terminal fields in the raw json
         """
-        dataclass_fields = self.subclass_field_names()
-        raw_fields = ut.all_attributes(ut.list_attributes(self._raw))
-        return dataclass_fields | raw_fields
+        return set(self.terminal_field_schema)
 
     @property
     def flattened_values(self) -> dict[str, Any]:
         """
         Maps all terminal fields to their value
         """
-        res = {}
-        for k in self.all_terminal_fields:
-            res[k] = self.get_flattened_value(k)
-        return res
+        return self.get_flattened_values(self.terminal_field_schema)
 
-    def get_flattened_value(self, k: str) -> Any:
+    def get_flattened_values(
+        self, schema: dict[str, tuple[ut.PathStep, ...] | None]
+    ) -> dict[str, Any]:
+        """
+        :param schema: Fields and compiled paths, e.g. from union_field_schema. Paths missing from this object are None
+        """
+        return {
+            k: self.get_flattened_value(k, steps)
+            for k, steps in schema.items()
+        }
+
+    def get_flattened_value(
+        self, k: str, steps: tuple[ut.PathStep, ...] | None = None
+    ) -> Any:
         """
         Enables you to get values multiple layers deep in the raw json object
+
+        :param k: Field name, or path into the raw json with a leading .
+        :param steps: Optional path already compiled with utils.compile_path
         """
+        sink = instrumentation.sink
+        if sink is not None:
+            start = time.perf_counter()
+
+        if steps is not None:
+            value = ut.compiled_path_value(self._raw, steps)
         # Use leading . to denote in _raw
-        if k[0] == ".":
-            v = ut.explore_object(self._raw, k)
-            assert len(v) == 1
-            return [*v][0]
+        elif k[0] == ".":
+            value = ut.get_path_value(self._raw, k)
         else:
-            return getattr(self, k)
+            value = getattr(self, k)
+
+        if sink is not None:
+            sink.timing(
+                "flattened_value",
+                time.perf_counter() - start,
+                {"type": type(self).__name__},
+            )
+        return value
 
     # __getattr__ is only call if the attribute is not found by default (default call is to __getattribute__)
     # Override the fallback behavior so that it looks in the underlying object before raising an error
     # TODO also look for snake case names
     def __getattr__(self, __name: str) -> Any:
+        # Lazy fields are only missing until first access, then memoized
+        if __name in self._lazy_fields:
+            value = self.load_field(__name)
+            setattr(self, __name, value)
+            return value
+
+        # Private names are never raw json keys. This also stops recursion
+        # while _raw is unset, e.g. during unpickling
+        if __name[0] == "_":
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'{__name}'"
+            )
+
         if __name in self._raw:
             return self._raw[__name]
 
@@ -116,7 +311,7 @@ class Base:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayVideo(Base):
     id: str | None = None
     slug: str | None = None
@@ -127,8 +322,10 @@ class PlayVideo(Base):
         if "mediaPlayback" not in self._raw:
             return
 
-        self.id = t(lambda: self._raw["mediaPlayback"][0]["id"])
-        self.slug = t(lambda: self._raw["mediaPlayback"][0]["slug"])
+        self.id = self.trap("id", lambda: self._raw["mediaPlayback"][0]["id"])
+        self.slug = self.trap(
+            "slug", lambda: self._raw["mediaPlayback"][0]["slug"]
+        )
 
     @property
     def video_url(self) -> str:
@@ -137,19 +334,24 @@ class PlayVideo(Base):
         return f"{VIDEO_URL_ROOT}{self.slug}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayVideos(Base):
     play_videos: list[PlayVideo] = field(default=FAKE_DEFAULT, init=False)
+    # Built on first use, every play event of a game looks up its video here
+    _video_url_by_play_id: dict[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self.init_helper()
 
-        self.play_videos = t(
+        self.play_videos = self.trap(
+            "play_videos",
             lambda: [
                 PlayVideo(
                     play_video,
                     self._metadata.add_key("plays").add_key_i(i),
-                    {**self._extra_fields},
+                    self._extra_fields,
                 )
                 for i, play_video in enumerate(
                     self._raw["data"]["search"]["plays"]
@@ -159,73 +361,89 @@ class PlayVideos(Base):
 
     @property
     def video_url_by_play_id(self) -> dict[str, str]:
-        return {
-            play_video.id: play_video.video_url
-            for play_video in self.play_videos
-        }
+        """
+        :return: Map of play id to video url. Cached, do not modify
+        """
+        if self._video_url_by_play_id is None:
+            self._video_url_by_play_id = {
+                play_video.id: play_video.video_url
+                for play_video in self.play_videos
+            }
+        return self._video_url_by_play_id
 
 
-@dataclass
+@dataclass(slots=True)
 class Swing(Base):
-    launch_angle: Decimal | None = field(default=FAKE_DEFAULT, init=False)
-    launch_speed: Decimal | None = field(default=FAKE_DEFAULT, init=False)
-    total_distance: Decimal | None = field(default=FAKE_DEFAULT, init=False)
+    launch_angle: Decimal | float | None = field(init=False)
+    launch_speed: Decimal | float | None = field(init=False)
+    total_distance: Decimal | float | None = field(init=False)
     trajectory: Trajectory | None = field(default=FAKE_DEFAULT, init=False)
 
+    _lazy_fields = ("launch_angle", "launch_speed", "total_distance")
+
     def __post_init__(self):
         self.init_helper()
 
-        self.launch_angle = t(
-            lambda: (
-                decimal_from_float(self._raw["launchAngle"])
-                if "launchAngle" in self._raw
-                else None
-            )
-        )
-        self.launch_speed = t(
-            lambda: (
-                decimal_from_float(self._raw["launchSpeed"])
-                if "launchSpeed" in self._raw
-                else None
-            )
+        self.trajectory = self.trap(
+            "trajectory", lambda: Trajectory(self._raw["trajectory"])
         )
-        self.total_distance = t(
-            lambda: (
-                decimal_from_float(self._raw["totalDistance"])
-                if "totalDistance" in self._raw
-                else None
-            )
-        )
-        self.trajectory = t(lambda: Trajectory(self._raw["trajectory"]))
+        self.init_lazy_fields()
+
+    def _load_launch_angle(self) -> Decimal | float | None:
+        if "launchAngle" not in self._raw:
+            return None
+        return self.number(self._raw["launchAngle"])
+
+    def _load_launch_speed(self) -> Decimal | float | None:
+        if "launchSpeed" not in self._raw:
+            return None
+        return self.number(self._raw["launchSpeed"])
+
+    def _load_total_distance(self) -> Decimal | float | None:
+        if "totalDistance" not in self._raw:
+            return None
+        return self.number(self._raw["totalDistance"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Pitch(Base):
-    start_speed: Decimal = field(init=False)
-    end_speed: Decimal = field(init=False)
+    start_speed: Decimal | float = field(init=False)
+    end_speed: Decimal | float = field(init=False)
     spin_rate: int | None = field(init=False)
     spin_direction: int | None = field(init=False)
     zone: int = field(init=False)
     pitch_type: str | None = None
 
+    _lazy_fields = ("start_speed", "end_speed")
+
     def __post_init__(self):
         self.init_helper()
 
-        self.start_speed = t(
-            lambda: decimal_from_float(self._raw["startSpeed"])
+        self.spin_rate = self.trap(
+            "spin_rate", lambda: self._raw["breaks"].get("spinRate")
         )
-        self.end_speed = t(lambda: decimal_from_float(self._raw["endSpeed"]))
-        self.spin_rate = t(lambda: self._raw["breaks"].get("spinRate"))
-        self.spin_direction = t(
+        self.spin_direction = self.trap(
+            "spin_direction",
             lambda: self._raw["breaks"].get("spinDirection")
         )
-        self.zone = t(lambda: self._raw["zone"])
+        self.zone = self.trap("zone", lambda: self._raw["zone"])
+
+        # Given by the play event, or by callers in the extra fields
+        if self.pitch_type is None and "pitch_type" in self._extra_fields:
+            self.pitch_type = self.trap(
+                "pitch_type", lambda: self._extra_fields["pitch_type"]
+            )
+
+        self.init_lazy_fields()
 
-        if "pitch_type" in self._extra_fields:
-            self.pitch_type = t(lambda: self._extra_fields["pitch_type"])
+    def _load_start_speed(self) -> Decimal | float:
+        return self.number(self._raw["startSpeed"])
+
+    def _load_end_speed(self) -> Decimal | float:
+        return self.number(self._raw["endSpeed"])
 
     @property
-    def velocity(self) -> Decimal:
+    def velocity(self) -> Decimal | float:
         return self.start_speed
     
     def get_match_up_values(self) -> dict[str, str]:
@@ -235,12 +453,12 @@ class Pitch(Base):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayEvent(Base):
     play_event_type: PlayEventType = field(init=False)
     play_id: str | None = None
-    swing: Swing | None = None
-    pitch: Pitch | None = None
+    swing: Swing | None = field(init=False)
+    pitch: Pitch | None = field(init=False)
     play_result: PlayResult | None = None
     description: str | None = None
     pitch_description: str | None = None
@@ -249,48 +467,38 @@ class PlayEvent(Base):
 
     _play_video: str | None = None
 
+    _lazy_fields = ("swing", "pitch")
+
     def __post_init__(self):
         self.init_helper()
 
-        self.play_event_type = t(lambda: PlayEventType(self._raw["type"]))
+        self.play_event_type = self.trap(
+            "play_event_type", lambda: PlayEventType(self._raw["type"])
+        )
         # self.play_result = PlayResult.from_bools(self._raw['details']['isInPlay'], self._raw['details']['isStrike'], self._raw['details']['isBall'])
 
         if self.play_event_type != PlayEventType.PITCH:
+            self.init_lazy_fields()
             return
 
-        self.play_id = t(lambda: self._raw["playId"])
-        self.description = t(lambda: self._raw["details"]["description"])
-        self.pitch_description = t(lambda: self._raw["details"]["type"]["description"])
-
-        self.swing = t(
-            lambda: (
-                Swing(
-                    self._raw["hitData"],
-                    self._metadata.add_key("hitData"),
-                    {**self._extra_fields},
-                )
-                if "hitData" in self._raw
-                else None
-            )
+        self.play_id = self.trap("play_id", lambda: self._raw["playId"])
+        self.description = self.trap(
+            "description", lambda: self._raw["details"]["description"]
         )
-        self.pitch = t(
-            lambda: (
-                Pitch(
-                    self._raw["pitchData"],
-                    self._metadata.add_key("pitchData"),
-                    {**self._extra_fields, "pitch_type": self.pitch_description},
-                )
-                if self._raw["isPitch"]
-                else None
-            )
+        self.pitch_description = self.trap(
+            "pitch_description",
+            lambda: self._raw["details"]["type"]["description"],
         )
 
+        self.init_lazy_fields()
 
         if "matchup" in self._extra_fields:
-            self.batter_name = t(
+            self.batter_name = self.trap(
+                "batter_name",
                 lambda: self._extra_fields["matchup"]["batter"]["fullName"]
             )
-            self.pitcher_name = t(
+            self.pitcher_name = self.trap(
+                "pitcher_name",
                 lambda: self._extra_fields["matchup"]["pitcher"]["fullName"]
             )
 
@@ -330,28 +538,94 @@ class PlayEvent(Base):
 
         return url
 
+    def _load_swing(self) -> Swing | None:
+        if self.play_event_type != PlayEventType.PITCH:
+            return None
+        if "hitData" not in self._raw:
+            return None
+        return Swing(
+            self._raw["hitData"],
+            self._metadata.add_key("hitData"),
+            self._extra_fields,
+            lazy=self.lazy,
+            numeric=self.numeric,
+        )
 
-@dataclass
+    def _load_pitch(self) -> Pitch | None:
+        if self.play_event_type != PlayEventType.PITCH:
+            return None
+        if not self._raw["isPitch"]:
+            return None
+        return Pitch(
+            self._raw["pitchData"],
+            self._metadata.add_key("pitchData"),
+            self._extra_fields,
+            pitch_type=self.pitch_description,
+            lazy=self.lazy,
+            numeric=self.numeric,
+        )
+
+
+@dataclass(slots=True)
 class Play(Base):
     play_events: list[PlayEvent] = field(init=False)
+    # Extra fields shared by all play events of this play
+    _play_event_fields: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    _lazy_fields = ("play_events",)
 
     def __post_init__(self):
         self.init_helper()
+        self.init_lazy_fields()
 
-        self.play_events = t(
-            lambda: [
-                PlayEvent(
-                    play_event,
-                    _metadata=self._metadata.add_key("playEvents").add_key_i(i),
-                    _extra_fields={
-                        **self._extra_fields,
-                        "matchup": self._raw["matchup"],
-                    },
-                )
-                for i, play_event in enumerate(self._raw["playEvents"])
-            ]
+    def _load_play_events(self) -> list[PlayEvent]:
+        return [
+            self.build_play_event(i)
+            for i in range(len(self._raw["playEvents"]))
+        ]
+
+    @property
+    def play_event_fields(self) -> dict[str, Any]:
+        if (
+            self._play_event_fields is None
+            or self._play_event_fields["matchup"] is not self._raw["matchup"]
+        ):
+            self._play_event_fields = {
+                **self._extra_fields,
+                "matchup": self._raw["matchup"],
+            }
+        return self._play_event_fields
+
+    def build_play_event(self, i: int) -> PlayEvent:
+        """
+        :return: New PlayEvent for the i-th play event in the raw json
+        """
+        return PlayEvent(
+            self._raw["playEvents"][i],
+            _metadata=self._metadata.add_key("playEvents").add_key_i(i),
+            _extra_fields=self.play_event_fields,
+            lazy=self.lazy,
+            numeric=self.numeric,
         )
 
+    @property
+    def batter_id(self) -> int | None:
+        return ut.compiled_path_value(self._raw, columnar.BATTER_ID_PATH)
+
+    @property
+    def pitcher_id(self) -> int | None:
+        return ut.compiled_path_value(self._raw, columnar.PITCHER_ID_PATH)
+
+    @property
+    def inning(self) -> int | None:
+        return ut.compiled_path_value(self._raw, columnar.INNING_PATH)
+
+    @property
+    def at_bat_index(self) -> int | None:
+        return ut.compiled_path_value(self._raw, columnar.AT_BAT_INDEX_PATH)
+
     @property
     def play_ids(self) -> list[str]:
         parent_attr = "play_events"
@@ -399,24 +673,41 @@ class Play(Base):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Game(Base):
     game_pk: int = field(init=False)
-    plays: list[Play] = field(init=False)
+    # Left out of repr as it would print the entire game
+    plays: list[Play] = field(init=False, repr=False)
+    # Derived lookups, see cached_index
+    _indexes: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    _lazy_fields = ("plays",)
 
     def __post_init__(self):
         self.init_helper()
-        base_metadata = t(
-            lambda: self._metadata.add_keys(["liveData", "plays", "allPlays"])
-        )
         self.game_pk = self._raw["gamePk"]
-        self.plays = t(
-            lambda: [
-                Play(play, base_metadata.add_key_i(i), {**self._extra_fields})
-                for i, play in enumerate(
-                    self._raw["liveData"]["plays"]["allPlays"]
-                )
-            ]
+        self.init_lazy_fields()
+
+    def _load_plays(self) -> list[Play]:
+        return [
+            self.build_play(i)
+            for i in range(len(self._raw["liveData"]["plays"]["allPlays"]))
+        ]
+
+    def build_play(self, i: int) -> Play:
+        """
+        :return: New Play for the i-th play in the raw json
+        """
+        return Play(
+            self._raw["liveData"]["plays"]["allPlays"][i],
+            self._metadata.add_keys(
+                ["liveData", "plays", "allPlays"]
+            ).add_key_i(i),
+            self._extra_fields,
+            lazy=self.lazy,
+            numeric=self.numeric,
         )
 
     @property
@@ -426,61 +717,181 @@ class Game(Base):
         """
         return [elt for p in self.plays for elt in p.play_ids]
 
+    def cached_index(self, name: str, build: Callable[[], Any]) -> Any:
+        """
+        :return: The index called name, built with build on first use and kept until invalidate_indexes
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            index = self._indexes[name] = build()
+        return index
+
+    def invalidate_indexes(self) -> None:
+        """
+        Drops every cached index, call after changing plays or play events
+        """
+        self._indexes.clear()
+
+    def build_play_id_indexes(self) -> None:
+        """
+        Builds the play event, pitch and swing indexes in one pass over the plays
+        """
+        play_events, pitches, swings = {}, {}, {}
+        for play in self.plays:
+            for play_event in play.play_events:
+                play_id = play_event.play_id
+                if play_id is None:
+                    continue
+                play_events[play_id] = play_event
+                pitches[play_id] = play_event.pitch
+                swings[play_id] = play_event.swing
+        self._indexes["play_event_by_play_id"] = play_events
+        self._indexes["pitches_by_play_id"] = pitches
+        self._indexes["swings_by_play_id"] = swings
+
+    def play_id_index(self, name: str) -> dict[str, Any]:
+        if name not in self._indexes:
+            self.build_play_id_indexes()
+        return self._indexes[name]
+
+    @property
+    def pitch_field_schema(self) -> dict[str, tuple[ut.PathStep, ...] | None]:
+        """
+        :return: Terminal fields of every pitch of the game, see Base.union_field_schema. Cached, do not modify
+        """
+        return self.cached_index(
+            "pitch_field_schema",
+            lambda: Pitch.union_field_schema(
+                pitch for pitch in self.pitches_by_play_id.values() if pitch
+            ),
+        )
+
+    @property
+    def swing_field_schema(self) -> dict[str, tuple[ut.PathStep, ...] | None]:
+        """
+        :return: Terminal fields of every swing of the game, see Base.union_field_schema. Cached, do not modify
+        """
+        return self.cached_index(
+            "swing_field_schema",
+            lambda: Swing.union_field_schema(
+                swing for swing in self.swings_by_play_id.values() if swing
+            ),
+        )
+
+    def plays_by(self, key: Callable[[Play], Any]) -> dict[Any, list[Play]]:
+        index = {}
+        for play in self.plays:
+            index.setdefault(key(play), []).append(play)
+        return index
+
     @property
     def pitches_by_play_id(self) -> dict[str, Pitch]:
         """
-        :return: Map of play id to pitch objects
+        :return: Map of play id to pitch objects. Cached, do not modify
         """
-        return {
-            k: v for p in self.plays for k, v in p.pitches_by_play_id.items()
-        }
+        return self.play_id_index("pitches_by_play_id")
 
     @property
     def swings_by_play_id(self) -> dict[str, Swing]:
         """
-        :return: Map of play id to swing objects
+        :return: Map of play id to swing objects. Cached, do not modify
         """
-        return {
-            k: v for p in self.plays for k, v in p.swings_by_play_id.items()
-        }
+        return self.play_id_index("swings_by_play_id")
 
     @property
     def play_event_by_play_id(self) -> dict[str, PlayEvent]:
         """
-        :return: Map of play id to play event objects
+        :return: Map of play id to play event objects. Cached, do not modify
         """
-        return {
-            k: v for p in self.plays for k, v in p.play_event_by_play_id.items()
-        }
+        return self.play_id_index("play_event_by_play_id")
 
     @property
     def play_video_by_play_id(self) -> dict[str, str]:
         """
-        :return: Map of play id to play video url
+        :return: Map of play id to play video url. Cached, do not modify
         """
-        return {
-            k: v for p in self.plays for k, v in p.play_video_by_play_id.items()
-        }
-    
+        return self.cached_index(
+            "play_video_by_play_id",
+            lambda: {
+                play_id: play_event.play_video
+                for play_id, play_event in self.play_event_by_play_id.items()
+            },
+        )
+
+    @property
+    def plays_by_batter_id(self) -> dict[int, list[Play]]:
+        """
+        :return: Map of batter id to their plays, in game order. Cached, do not modify
+        """
+        return self.cached_index(
+            "plays_by_batter_id", lambda: self.plays_by(Play.batter_id.fget)
+        )
+
+    @property
+    def plays_by_pitcher_id(self) -> dict[int, list[Play]]:
+        """
+        :return: Map of pitcher id to their plays, in game order. Cached, do not modify
+        """
+        return self.cached_index(
+            "plays_by_pitcher_id",
+            lambda: self.plays_by(Play.pitcher_id.fget),
+        )
+
+    @property
+    def plays_by_inning(self) -> dict[int, list[Play]]:
+        """
+        :return: Map of inning to the plays of both halves, in game order. Cached, do not modify
+        """
+        return self.cached_index(
+            "plays_by_inning", lambda: self.plays_by(Play.inning.fget)
+        )
+
+    @property
+    def play_by_at_bat_index(self) -> dict[int, Play]:
+        """
+        :return: Map of at bat index to play. Cached, do not modify
+        """
+        return self.cached_index(
+            "play_by_at_bat_index",
+            lambda: {play.at_bat_index: play for play in self.plays},
+        )
+
+    def iter_play_events(
+        self, where: PitchFilter | None = None
+    ) -> Iterator[tuple[str, PlayEvent]]:
+        """
+        :param where: Optional filter of the play events. Plays that cannot match are skipped without building their play events
+        :return: Iterator of play id and play event, in game order
+        """
+        if where is None:
+            yield from self.play_event_by_play_id.items()
+            return
+        for play in self.plays:
+            if not where.matches_play(play._raw):
+                continue
+            for play_event in play.play_events:
+                play_id = play_event.play_id
+                if play_id is not None and where.matches_play_event(
+                    play_event._raw
+                ):
+                    yield play_id, play_event
+
     def get_match_up_values_by_play_id(
         self,
-        play_ids: Sequence[str] | None = None
+        play_ids: Sequence[str] | None = None,
+        where: PitchFilter | None = None,
         ) -> dict[str, str]:
         """
         :param play_ids: Optional list of play ids to filter down the result
+        :param where: Optional filter of the plays in the result
 
         :result: Nested dictionary for plays and pitcher/batter match up values
         """
-
-        pitches_by_play_id = self.pitches_by_play_id
-        if play_ids:
-            pitches_by_play_id = {
-                k: v for k, v in pitches_by_play_id.items() if k in play_ids
-            }
-
         return {
-                play_id: pitch.get_match_up_values()
-                for play_id, pitch in pitches_by_play_id.items()
+                play_id: play_event.pitch.get_match_up_values()
+                for play_id, play_event in self.iter_play_events(
+                    PitchFilter.combine(play_ids, where)
+                )
             }
 
 
@@ -488,98 +899,286 @@ class Game(Base):
         self,
         metrics: Sequence[str] | None = None,
         play_ids: Sequence[str] | None = None,
+        where: PitchFilter | None = None,
     ) -> dict[str, dict[str, Any]]:
         """
         :param metrics: Optional list of metrics for the result. Omit to get all metrics
         :param play_ids: Optional list of play ids to filter down the result
+        :param where: Optional filter of the plays in the result
 
         :result: Nested dictionary for plays and metrics
         """
-        pitches_by_play_id = self.pitches_by_play_id
-        if play_ids:
-            pitches_by_play_id = {
-                k: v for k, v in pitches_by_play_id.items() if k in play_ids
-            }
+        where = PitchFilter.combine(play_ids, where)
+        play_events = self.iter_play_events(where)
 
         if metrics:
+            compiled_metrics = compile_metrics(metrics)
             return {
                 play_id: {**{
-                    metric: pitch.get_flattened_value(metric)
-                    for metric in metrics
-                }, **pitch.get_match_up_values()}
-                for play_id, pitch in pitches_by_play_id.items()
+                    metric: play_event.pitch.get_flattened_value(metric, steps)
+                    for metric, steps in compiled_metrics.items()
+                }, **play_event.pitch.get_match_up_values()}
+                for play_id, play_event in play_events
             }
         else:
+            # One schema for every row, instead of walking each pitch
+            if where is None:
+                schema = self.pitch_field_schema
+            else:
+                # Only the rows returned, plays filtered out are not built
+                play_events = list(play_events)
+                schema = Pitch.union_field_schema(
+                    play_event.pitch for _, play_event in play_events
+                )
             return {
-                play_id: {**pitch.flattened_values, **pitch.get_match_up_values()}
-                for play_id, pitch in pitches_by_play_id.items()
+                play_id: {
+                    **play_event.pitch.get_flattened_values(schema),
+                    **play_event.pitch.get_match_up_values(),
+                }
+                for play_id, play_event in play_events
             }
 
     def get_filtered_pitch_metrics_by_play_id_as_df(
         self,
         metrics: Sequence[str] | None = None,
         play_ids: Sequence[str] | None = None,
+        where: PitchFilter | None = None,
     ) -> pd.DataFrame:
         """
         :param metrics: Optional list of metrics for the result. Omit to get all metrics
         :param play_ids: Optional list of play ids to filter down the result
+        :param where: Optional filter of the plays in the result
 
         :result: DataFrame with plays and metrics
         """
-        return pd.DataFrame.from_dict(
-            self.get_filtered_pitch_metrics_by_play_id(
-                metrics, play_ids=play_ids
-            ),
-            orient="index",
-        )
+        with instrumentation.timed("dataframe.build", table="pitch_metrics"):
+            return pd.DataFrame.from_dict(
+                self.get_filtered_pitch_metrics_by_play_id(
+                    metrics, play_ids=play_ids, where=where
+                ),
+                orient="index",
+            )
 
     def get_filtered_swing_metrics_by_play_id(
         self,
         metrics: Sequence[str] | None = None,
         play_ids: Sequence[str] | None = None,
+        where: PitchFilter | None = None,
     ) -> dict[str, dict[str, Any]]:
         """
         :param metrics: Optional list of metrics for the result. Omit to get all metrics
         :param play_ids: Optional list of play ids to filter down the result
+        :param where: Optional filter of the plays in the result
 
         :result: Nested dictionary for plays and metrics
         """
-        swings_by_play_id = self.swings_by_play_id
-        if play_ids:
-            swings_by_play_id = {
-                k: v for k, v in swings_by_play_id.items() if k in play_ids
-            }
+        where = PitchFilter.combine(play_ids, where)
+        play_events = self.iter_play_events(where)
 
         if metrics:
+            compiled_metrics = compile_metrics(metrics)
             return {
                 play_id: {**{
                     metric: (
-                        swing.get_flattened_value(metric) if swing else None
+                        play_event.swing.get_flattened_value(metric, steps)
+                        if play_event.swing
+                        else None
                     )
-                    for metric in metrics
-                }, **self.pitches_by_play_id[play_id].get_match_up_values()}
-                for play_id, swing in swings_by_play_id.items()
+                    for metric, steps in compiled_metrics.items()
+                }, **play_event.pitch.get_match_up_values()}
+                for play_id, play_event in play_events
             }
         else:
+            if where is None:
+                schema = self.swing_field_schema
+            else:
+                play_events = list(play_events)
+                schema = Swing.union_field_schema(
+                    play_event.swing
+                    for _, play_event in play_events
+                    if play_event.swing
+                )
             return {
-                play_id: {**swing.flattened_values, **self.pitches_by_play_id[play_id].get_match_up_values()} if swing else {**{"": None}, **self.pitches_by_play_id[play_id].get_match_up_values()}
-                for play_id, swing in swings_by_play_id.items()
+                play_id: {
+                    **(
+                        play_event.swing.get_flattened_values(schema)
+                        if play_event.swing
+                        else {"": None}
+                    ),
+                    **play_event.pitch.get_match_up_values(),
+                }
+                for play_id, play_event in play_events
             }
 
     def get_filtered_swing_metrics_by_play_id_as_df(
         self,
         metrics: Sequence[str] | None = None,
         play_ids: Sequence[str] | None = None,
+        where: PitchFilter | None = None,
     ) -> pd.DataFrame:
         """
         :param metrics: Optional list of metrics for the result. Omit to get all metrics
         :param play_ids: Optional list of play ids to filter down the result
+        :param where: Optional filter of the plays in the result
 
         :result: DataFrame with plays and metrics
         """
-        return pd.DataFrame.from_dict(
-            self.get_filtered_swing_metrics_by_play_id(
-                metrics, play_ids=play_ids
-            ),
-            orient="index",
+        with instrumentation.timed("dataframe.build", table="swing_metrics"):
+            return pd.DataFrame.from_dict(
+                self.get_filtered_swing_metrics_by_play_id(
+                    metrics, play_ids=play_ids, where=where
+                ),
+                orient="index",
+            )
+
+    def get_pitch_metrics_table(
+        self,
+        metrics: Sequence[str] | None = None,
+        play_ids: Sequence[str] | None = None,
+        as_arrays: bool = False,
+        where: PitchFilter | None = None,
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        Columnar equivalent of get_filtered_pitch_metrics_by_play_id_as_df that reads the raw json directly.
+        Numeric metrics are float64 and pitch type and handedness are categorical
+
+        :param metrics: Optional list of metrics for the result. Omit to get all metrics
+        :param play_ids: Optional list of play ids to filter down the result
+        :param as_arrays: Return a dict of NumPy arrays keyed by column, plus play_id, instead of a DataFrame
+        :param where: Optional filter of the plays in the result
+
+        :result: DataFrame with plays and metrics
+        """
+        with instrumentation.timed("dataframe.build", table="pitch_table"):
+            return columnar.pitch_metrics_table(
+                self._raw,
+                metrics,
+                play_ids=play_ids,
+                as_arrays=as_arrays,
+                where=where,
+            )
+
+    def get_swing_metrics_table(
+        self,
+        metrics: Sequence[str] | None = None,
+        play_ids: Sequence[str] | None = None,
+        as_arrays: bool = False,
+        where: PitchFilter | None = None,
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        Columnar equivalent of get_filtered_swing_metrics_by_play_id_as_df that reads the raw json directly.
+        Numeric metrics are float64 and trajectory and handedness are categorical
+
+        :param metrics: Optional list of metrics for the result. Omit to get all metrics
+        :param play_ids: Optional list of play ids to filter down the result
+        :param as_arrays: Return a dict of NumPy arrays keyed by column, plus play_id, instead of a DataFrame
+        :param where: Optional filter of the plays in the result
+
+        :result: DataFrame with plays and metrics
+        """
+        with instrumentation.timed("dataframe.build", table="swing_table"):
+            return columnar.swing_metrics_table(
+                self._raw,
+                metrics,
+                play_ids=play_ids,
+                as_arrays=as_arrays,
+                where=where,
+            )
+
+    def get_play_event_table(
+        self, as_arrays: bool = False
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        Every play event with its count, type and the ids of the match up, read from the raw json
+
+        :param as_arrays: Return a dict of NumPy arrays keyed by column, plus play_id, instead of a DataFrame
+
+        :result: DataFrame with play events, indexed by play id
+        """
+        with instrumentation.timed("dataframe.build", table="play_events"):
+            return columnar.play_event_table(self._raw, as_arrays=as_arrays)
+
+
+@dataclass(slots=True)
+class ScheduledGame(Base):
+    game_pk: int = field(init=False)
+    official_date: str | None = field(default=FAKE_DEFAULT, init=False)
+    game_type: str | None = field(default=FAKE_DEFAULT, init=False)
+    # Preview, Live or Final
+    abstract_state: str | None = field(default=FAKE_DEFAULT, init=False)
+    # e.g. Scheduled, In Progress, Final, Postponed
+    detailed_state: str | None = field(default=FAKE_DEFAULT, init=False)
+
+    def __post_init__(self):
+        self.init_helper()
+        self.game_pk = self._raw["gamePk"]
+        self.official_date = self.trap(
+            "official_date", lambda: self._raw["officialDate"]
+        )
+        self.game_type = self.trap("game_type", lambda: self._raw["gameType"])
+        self.abstract_state = self.trap(
+            "abstract_state", lambda: self._raw["status"]["abstractGameState"]
         )
+        self.detailed_state = self.trap(
+            "detailed_state", lambda: self._raw["status"]["detailedState"]
+        )
+
+    @property
+    def is_final(self) -> bool:
+        """
+        :return: True if the game was played to the end and its feed no longer changes
+        """
+        return (
+            self.abstract_state == GameState.FINAL
+            and self.detailed_state not in NOT_PLAYED_STATES
+        )
+
+
+@dataclass(slots=True)
+class Schedule(Base):
+    # Left out of repr as a season has thousands of games
+    games: list[ScheduledGame] = field(
+        default=FAKE_DEFAULT, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        self.init_helper()
+        self.games = self.trap(
+            "games",
+            lambda: [
+                ScheduledGame(
+                    game,
+                    self._metadata.add_keys(["dates"])
+                    .add_key_i(i)
+                    .add_key("games")
+                    .add_key_i(j),
+                    self._extra_fields,
+                    lazy=self.lazy,
+                    numeric=self.numeric,
+                )
+                for i, date in enumerate(self._raw.get("dates", []))
+                for j, game in enumerate(date["games"])
+            ],
+        )
+
+    def game_pks(
+        self, states: Iterable[str] | None = (GameState.FINAL,)
+    ) -> list[int]:
+        """
+        Game pks in date order, each once. A postponed game is listed on its original date as well as when it is played
+
+        :param states: Only keep games in these abstract states, all if None. Games that were postponed or cancelled are always left out
+        :return: list of game pks
+        """
+        if states is not None:
+            # Hash enum members by their value
+            states = frozenset(
+                getattr(state, "value", state) for state in states
+            )
+        game_pks = {}
+        for game in self.games:
+            if game.detailed_state in NOT_PLAYED_STATES:
+                continue
+            if states is None or game.abstract_state in states:
+                game_pks[game.game_pk] = None
+        return list(game_pks)
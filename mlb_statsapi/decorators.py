@@ -1,22 +1,100 @@
 from __future__ import annotations
 
-from typing import Any
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
 from dotenv import dotenv_values
 
-from .constants import MetaFields
+from . import instrumentation
+from .constants import MetaFields, Strictness
 
+if TYPE_CHECKING:
+    from .datatypes import Metadata
 
-# Requires a zero argument callable that we try to run as normal.
-# If f errors, return a special value
-def t(f) -> Any:
-    config = dotenv_values(".env")
+logger = logging.getLogger(__name__)
+
+TRAPPED_EXCEPTIONS = (AttributeError, KeyError, TypeError, ValueError)
+
+# Resolved once at import so that field parsing never touches the filesystem.
+# A DEBUG entry in .env keeps its old meaning of letting errors propagate.
+_strictness: Strictness = (
+    Strictness.RAISE if "DEBUG" in dotenv_values(".env") else Strictness.TRAP
+)
+
+
+@dataclass
+class FieldError:
+    """
+    Record of a field that could not be extracted from the raw json
+    """
+
+    metadata: Metadata | None
+    field: str | None
+    error: Exception
+
+    @property
+    def path(self) -> str:
+        parts = [str(p) for p in (self.metadata, self.field) if p is not None]
+        return ".".join(parts)
+
+    def __str__(self) -> str:
+        return f"{self.path}: {type(self.error).__name__}: {self.error}"
 
-    if 'DEBUG' in config:
+
+def get_strictness() -> Strictness:
+    return _strictness
+
+
+def configure(strictness: Strictness | str) -> Strictness:
+    """
+    Set how field extraction errors are handled. Returns the previous setting
+    """
+    global _strictness
+    previous = _strictness
+    _strictness = Strictness(strictness)
+    return previous
+
+
+@contextmanager
+def field_strictness(strictness: Strictness | str) -> Iterator[Strictness]:
+    """
+    Temporarily change how field extraction errors are handled.
+    Can also be used as a decorator
+    """
+    previous = configure(strictness)
+    try:
+        yield _strictness
+    finally:
+        configure(previous)
+
+
+# Requires a zero argument callable that we try to run as normal.
+# If f errors, record the error and return a special value
+def t(
+    f: Callable[[], Any],
+    errors: list[FieldError] | None = None,
+    metadata: Metadata | None = None,
+    field: str | None = None,
+) -> Any:
+    if _strictness is Strictness.RAISE:
         return f()
 
     try:
         return f()
-    except (AttributeError, KeyError, TypeError, ValueError) as e:
-        print("MISSING ELEMENT")
-        # TODO Print stack trace and more metadata
+    except TRAPPED_EXCEPTIONS as e:
+        if errors is not None:
+            errors.append(FieldError(metadata, field, e))
+        if instrumentation.sink is not None:
+            instrumentation.sink.count(
+                "field.errors",
+                1,
+                {
+                    "path": metadata.pattern if metadata else "",
+                    "field": field,
+                    "error": type(e).__name__,
+                },
+            )
+        logger.debug("Missing element %s.%s: %r", metadata, field, e)
         return MetaFields.NOT_FOUND
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import pandas as pd
+
+from . import utils as ut
+from .columnar import INDEX_NAME
+from .datatypes import Game
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # Only needed for ColumnarStore
+    pa = None
+    ds = None
+
+PITCH_TABLE = "pitches"
+SWING_TABLE = "swings"
+PLAY_EVENT_TABLE = "play_events"
+TABLES = (PITCH_TABLE, SWING_TABLE, PLAY_EVENT_TABLE)
+# File formats of pyarrow.dataset, "ipc" is Arrow IPC (Feather v2)
+FORMATS = ("parquet", "ipc")
+SEASON_PATH = ("gameData", "game", "season")
+DATE_PATH = ("gameData", "datetime", "officialDate")
+PARTITION_COLUMNS = ("season", "date", "game_pk")
+
+
+def game_tables(game: Game) -> dict[str, pd.DataFrame]:
+    """
+    :return: Pitch, swing and play event tables of game, keyed by table name
+    """
+    return {
+        PITCH_TABLE: game.get_pitch_metrics_table(),
+        SWING_TABLE: game.get_swing_metrics_table(),
+        PLAY_EVENT_TABLE: game.get_play_event_table(),
+    }
+
+
+class ColumnarStore:
+    """
+    Pitch, swing and play event tables of parsed games on disk, one dataset
+    per table partitioned by season, date and game pk. Games are added one at
+    a time, writing a game again replaces its files. Reads only open the
+    partitions and columns they need. Requires the parquet extra (pyarrow)
+    """
+
+    def __init__(self, root: str | Path, format: str = "parquet") -> None:
+        """
+        :param root: Directory of the store, created on first write
+        :param format: parquet or ipc
+        """
+        if pa is None:
+            raise ImportError(
+                "ColumnarStore requires pyarrow, "
+                "install mlb-statsapi[parquet]"
+            )
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}, not {format}")
+        self.root = Path(root)
+        self.format = format
+        self.partitioning = ds.partitioning(
+            pa.schema(
+                [
+                    ("season", pa.int32()),
+                    ("date", pa.string()),
+                    ("game_pk", pa.int64()),
+                ]
+            ),
+            flavor="hive",
+        )
+        # Unified schema of each table, until this store writes to it
+        self._schemas: dict[str, pa.Schema] = {}
+
+    def table_directory(self, table: str) -> Path:
+        if table not in TABLES:
+            raise ValueError(f"table must be one of {TABLES}, not {table}")
+        return self.root / table
+
+    def write_game(self, game: Game) -> None:
+        """
+        Writes the tables of game, replacing any earlier version of it
+        """
+        season = ut.compiled_path_value(game._raw, SEASON_PATH)
+        date = ut.compiled_path_value(game._raw, DATE_PATH)
+        self.write_tables(game.game_pk, int(season), date, game_tables(game))
+
+    def write_games(self, games: Iterable[Game]) -> int:
+        """
+        :return: Number of games written
+        """
+        n = 0
+        for game in games:
+            self.write_game(game)
+            n += 1
+        return n
+
+    def write_tables(
+        self,
+        game_pk: int,
+        season: int,
+        date: str,
+        tables: dict[str, pd.DataFrame],
+    ) -> None:
+        """
+        :param tables: DataFrames indexed by play id, keyed by table name
+        """
+        for name, df in tables.items():
+            # Empty tables write no files, the old ones must still go
+            for partition in self.table_directory(name).glob(
+                f"*/*/game_pk={game_pk}"
+            ):
+                shutil.rmtree(partition)
+            self._schemas.pop(name, None)
+            df = df.rename_axis(INDEX_NAME).reset_index()
+            df["season"] = season
+            df["date"] = date
+            df["game_pk"] = game_pk
+            ds.write_dataset(
+                pa.Table.from_pandas(df, preserve_index=False),
+                self.table_directory(name),
+                format=self.format,
+                partitioning=self.partitioning,
+                basename_template=f"{uuid.uuid4().hex}-{{i}}.{self.format}",
+                existing_data_behavior="delete_matching",
+            )
+
+    def dataset(self, table: str) -> ds.Dataset:
+        """
+        :return: Dataset of every game written to table. Games do not share
+            all columns, so their schemas are merged, once until the next write
+        """
+        directory = self.table_directory(table)
+        if not directory.exists():
+            raise FileNotFoundError(f"No games written to {directory}")
+        schema = self._schemas.get(table)
+        if schema is None:
+            dataset = ds.dataset(
+                directory, format=self.format, partitioning=self.partitioning
+            )
+            schema = pa.unify_schemas(
+                [
+                    fragment.physical_schema
+                    for fragment in dataset.get_fragments()
+                ]
+                + [dataset.partitioning.schema],
+                promote_options="permissive",
+            )
+            self._schemas[table] = schema
+        return ds.dataset(
+            directory,
+            schema=schema,
+            format=self.format,
+            partitioning=self.partitioning,
+        )
+
+    def read(
+        self,
+        table: str,
+        columns: Sequence[str] | None = None,
+        filter: ds.Expression | None = None,
+        game_pks: Sequence[int] | None = None,
+        seasons: Sequence[int] | None = None,
+    ) -> pd.DataFrame:
+        """
+        :param table: pitches, swings or play_events
+        :param columns: Optional list of columns for the result. Omit to get all columns
+        :param filter: Optional pyarrow.dataset expression, e.g. ds.field("start_speed") > 95
+        :param game_pks: Optional list of game pks to filter down the result
+        :param seasons: Optional list of seasons to filter down the result
+
+        :result: DataFrame indexed by play id
+        """
+        for name, values in (("game_pk", game_pks), ("season", seasons)):
+            if values is not None:
+                expression = ds.field(name).isin(list(values))
+                filter = (
+                    expression if filter is None else filter & expression
+                )
+        if columns is not None:
+            columns = [INDEX_NAME, *(c for c in columns if c != INDEX_NAME)]
+
+        df = (
+            self.dataset(table)
+            .to_table(columns=columns, filter=filter)
+            .to_pandas()
+        )
+        return df.set_index(INDEX_NAME)
+
+    def game_pks(self) -> list[int]:
+        """
+        :return: Game pks in the store, from the partition directories
+        """
+        return sorted(
+            int(path.name.split("=", 1)[1])
+            for path in self.table_directory(PLAY_EVENT_TABLE).glob(
+                "*/*/game_pk=*"
+            )
+        )
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import cProfile
+import logging
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Receives every timing and counter, None turns instrumentation off. Hot
+# paths check this before doing any work, so the cost when off is one
+# attribute lookup
+sink: MetricsSink | None = None
+
+PROMETHEUS_PREFIX = "mlb_statsapi_"
+PROMETHEUS_INVALID_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+Tags = tuple[tuple[str, str], ...]
+
+
+class MetricsSink(ABC):
+    """
+    Destination of the timings and counters recorded by the package
+    """
+
+    @abstractmethod
+    def timing(self, name: str, seconds: float, tags: dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def count(self, name: str, value: int, tags: dict[str, Any]) -> None:
+        pass
+
+
+class LoggingSink(MetricsSink):
+    """
+    Logs every timing and counter, for following a run as it happens
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger = logger,
+        level: int = logging.INFO,
+    ) -> None:
+        self.logger = logger
+        self.level = level
+
+    def timing(self, name: str, seconds: float, tags: dict[str, Any]) -> None:
+        self.logger.log(
+            self.level, "%s %.3f ms %s", name, seconds * 1e3, tags
+        )
+
+    def count(self, name: str, value: int, tags: dict[str, Any]) -> None:
+        self.logger.log(self.level, "%s +%d %s", name, value, tags)
+
+
+@dataclass
+class TimingStats:
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class InMemorySink(MetricsSink):
+    """
+    Aggregates timings and counters by name and tags, to inspect after a run
+    or to expose in the Prometheus text format
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[tuple[str, Tags], TimingStats] = {}
+        self.counters: dict[tuple[str, Tags], int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(name: str, tags: dict[str, Any]) -> tuple[str, Tags]:
+        return name, tuple(sorted((k, str(v)) for k, v in tags.items()))
+
+    def timing(self, name: str, seconds: float, tags: dict[str, Any]) -> None:
+        key = self.key(name, tags)
+        with self._lock:
+            stats = self.timings.get(key)
+            if stats is None:
+                stats = self.timings[key] = TimingStats()
+            stats.add(seconds)
+
+    def count(self, name: str, value: int, tags: dict[str, Any]) -> None:
+        key = self.key(name, tags)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def clear(self) -> None:
+        with self._lock:
+            self.timings.clear()
+            self.counters.clear()
+
+    def total_seconds(self, name: str, **tags: Any) -> float:
+        """
+        :return: Seconds recorded for name over every tag set containing tags
+        """
+        return sum(
+            stats.total
+            for key, stats in self.timings.items()
+            if key[0] == name and set(self.key(name, tags)[1]) <= set(key[1])
+        )
+
+    def total_count(self, name: str, **tags: Any) -> int:
+        """
+        :return: Sum of the counter name over every tag set containing tags
+        """
+        return sum(
+            value
+            for key, value in self.counters.items()
+            if key[0] == name and set(self.key(name, tags)[1]) <= set(key[1])
+        )
+
+    def prometheus_text(self) -> str:
+        """
+        :return: Timings as summaries and counters in the Prometheus text format
+        """
+        lines = []
+        with self._lock:
+            timings = sorted(self.timings.items())
+            counters = sorted(self.counters.items())
+
+        typed = set()
+        for (name, tags), stats in timings:
+            metric = prometheus_name(name) + "_seconds"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} summary")
+            labels = prometheus_labels(tags)
+            lines.append(f"{metric}_count{labels} {stats.count}")
+            lines.append(f"{metric}_sum{labels} {stats.total!r}")
+        for (name, tags), value in counters:
+            metric = prometheus_name(name) + "_total"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{prometheus_labels(tags)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def prometheus_name(name: str) -> str:
+    return PROMETHEUS_PREFIX + PROMETHEUS_INVALID_RE.sub("_", name)
+
+
+def prometheus_labels(tags: Tags) -> str:
+    if not tags:
+        return ""
+    labels = ",".join(
+        f'{PROMETHEUS_INVALID_RE.sub("_", k)}="{escape_label(v)}"'
+        for k, v in tags
+    )
+    return f"{{{labels}}}"
+
+
+def escape_label(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+def get_sink() -> MetricsSink | None:
+    return sink
+
+
+def configure_metrics(new_sink: MetricsSink | None) -> MetricsSink | None:
+    """
+    Set where timings and counters go, None to turn them off. Returns the previous sink
+    """
+    global sink
+    previous = sink
+    sink = new_sink
+    return previous
+
+
+@contextmanager
+def metrics_sink(new_sink: MetricsSink | None) -> Iterator[MetricsSink | None]:
+    """
+    Temporarily send timings and counters to new_sink.
+    Can also be used as a decorator
+    """
+    previous = configure_metrics(new_sink)
+    try:
+        yield new_sink
+    finally:
+        configure_metrics(previous)
+
+
+class Timer:
+    """
+    Context manager recording the time spent inside it to a sink
+    """
+
+    __slots__ = ("sink", "name", "tags", "start")
+
+    def __init__(
+        self, sink: MetricsSink, name: str, tags: dict[str, Any]
+    ) -> None:
+        self.sink = sink
+        self.name = name
+        self.tags = tags
+
+    def __enter__(self) -> Timer:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.sink.timing(
+            self.name, time.perf_counter() - self.start, self.tags
+        )
+
+
+_null_timer = nullcontext()
+
+
+def timed(name: str, **tags: Any) -> Timer | nullcontext:
+    """
+    :return: Context manager timing its body if a sink is configured, else one that does nothing
+    """
+    if sink is None:
+        return _null_timer
+    return Timer(sink, name, tags)
+
+
+def count(name: str, value: int = 1, **tags: Any) -> None:
+    if sink is not None:
+        sink.count(name, value, tags)
+
+
+@dataclass
+class Capture:
+    """
+    CPU profile and memory use recorded by capture
+    """
+
+    label: str
+    seconds: float = 0.0
+    profile: cProfile.Profile | None = None
+    # Peak of memory allocated inside the capture
+    peak_bytes: int | None = None
+    # Largest allocations still alive at the end of the capture, by line
+    top_allocations: list[tracemalloc.Statistic] = field(default_factory=list)
+
+    def stats(self, sort: str = "cumulative") -> pstats.Stats:
+        if self.profile is None:
+            raise ValueError(f"{self.label} was captured without cpu=True")
+        return pstats.Stats(self.profile).sort_stats(sort)
+
+
+@contextmanager
+def capture(
+    label: str,
+    cpu: bool = True,
+    memory: bool = False,
+    top: int = 10,
+) -> Iterator[Capture]:
+    """
+    Profiles the body, e.g. fetching and parsing one game. Opt in only, cProfile and tracemalloc slow down the code they watch
+
+    :param label: Name of the capture, added as a tag to the timings sent to the sink
+    :param cpu: Record a cProfile profile
+    :param memory: Record the peak and top allocations with tracemalloc
+    :param top: Number of allocations to keep
+    """
+    result = Capture(label)
+    started_tracemalloc = memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+    if cpu:
+        result.profile = cProfile.Profile()
+        result.profile.enable()
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - start
+        if cpu:
+            result.profile.disable()
+        if memory:
+            result.peak_bytes = tracemalloc.get_traced_memory()[1]
+            result.top_allocations = (
+                tracemalloc.take_snapshot().statistics("lineno")[:top]
+            )
+            if started_tracemalloc:
+                tracemalloc.stop()
+        if sink is not None:
+            sink.timing("capture", result.seconds, {"label": label})
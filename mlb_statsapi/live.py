@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+from . import utils as ut
+from .constants import LiveEventType, PlayEventType
+from .datatypes import Game, Play, PlayEvent
+from .request_datatypes import GameDiffPatchRequest, GameRequest
+from .transport import Transport
+
+ALL_PLAYS_POINTER = ["liveData", "plays", "allPlays"]
+FINAL_STATE = GameRequest.FINAL_STATE
+DEFAULT_WAIT = 10
+
+
+@dataclass
+class LiveEvent:
+    type: LiveEventType
+    play: Play
+    play_event: PlayEvent | None = None
+
+
+@dataclass
+class PlayChanges:
+    """
+    Parts of a play touched by a patch
+    """
+
+    # Rebuild the whole Play, e.g. because it or its matchup was replaced
+    rebuild: bool = False
+    # Indices of play events to rebuild
+    play_events: set[int] | None = None
+
+
+class FullRebuild(Exception):
+    """
+    Raised when a patch changes the plays in a way that shifts indices
+    """
+
+
+class LiveGame:
+    """
+    Tracks an in-progress game. The first update fetches the full feed, later
+    updates only fetch the changes since the last metaData.timeStamp, apply
+    them to the raw json and rebuild just the Play and PlayEvent objects they
+    touch. New plays and pitches are returned and passed to every listener
+
+    :param game_pk: Game to track
+    :param lazy: Parse the game in lazy mode
+    :param transport: Transport used for all requests
+    """
+
+    def __init__(
+        self,
+        game_pk: int | str,
+        lazy: bool = False,
+        transport: Transport | None = None,
+    ) -> None:
+        self.game_pk = game_pk
+        self.lazy = lazy
+        self.transport = transport
+        self.game: Game | None = None
+        self.listeners: list[Callable[[LiveEvent], None]] = []
+        self._seen_play_ids: set[str] = set()
+
+    def subscribe(self, listener: Callable[[LiveEvent], None]) -> None:
+        self.listeners.append(listener)
+
+    @property
+    def timestamp(self) -> str:
+        return self.game._raw["metaData"]["timeStamp"]
+
+    @property
+    def is_final(self) -> bool:
+        status = self.game._raw["gameData"]["status"]
+        return status["abstractGameState"] == FINAL_STATE
+
+    @property
+    def wait(self) -> float:
+        """
+        :return: Seconds the API asks clients to wait between polls
+        """
+        return self.game._raw["metaData"].get("wait", DEFAULT_WAIT)
+
+    def update(self) -> list[LiveEvent]:
+        """
+        Fetches the latest changes to the game
+
+        :return: New plays and pitches since the last update. Nothing is returned for the first update
+        """
+        if self.game is None:
+            self.game = GameRequest(
+                self.game_pk, lazy=self.lazy, transport=self.transport
+            ).make_request()
+            self._seen_play_ids = set(self.game.play_ids)
+            return []
+
+        request = GameDiffPatchRequest(
+            self.game_pk, self.timestamp, transport=self.transport
+        )
+        patches = request.make_request()
+        if isinstance(patches, dict):
+            # The API sends the full feed instead of patches when it is smaller
+            events = self.replace_feed(patches)
+        else:
+            operations = [op for patch in patches for op in patch["diff"]]
+            events = self.apply_operations(operations)
+        self.game.invalidate_indexes()
+
+        for event in events:
+            for listener in self.listeners:
+                listener(event)
+        return events
+
+    def poll(self, interval: float | None = None) -> Iterator[LiveEvent]:
+        """
+        Updates the game until it is final, sleeping between updates
+
+        :param interval: Seconds between updates, defaults to the wait the API asks for
+        """
+        self.update()
+        while not self.is_final:
+            time.sleep(self.wait if interval is None else interval)
+            yield from self.update()
+
+    def replace_feed(self, raw: dict[str, Any]) -> list[LiveEvent]:
+        previous_plays = len(self.game.plays)
+        self.game._raw = raw
+        self.game.plays = self.game._load_plays()
+        return self.new_events(
+            {i: PlayChanges(rebuild=True) for i in range(previous_plays)},
+            previous_plays,
+        )
+
+    def apply_operations(
+        self, operations: list[dict[str, Any]]
+    ) -> list[LiveEvent]:
+        previous_plays = len(self.game.plays)
+        try:
+            changes = self.play_changes(operations)
+        except FullRebuild:
+            changes = None
+
+        raw = ut.apply_json_patch(self.game._raw, operations)
+        if changes is None or raw is not self.game._raw:
+            return self.replace_feed(raw)
+
+        raw_plays = ut.resolve_json_pointer(raw, ALL_PLAYS_POINTER)
+        plays = self.game.plays
+        for i, play_changes in changes.items():
+            if i >= len(plays):
+                continue
+            if play_changes.rebuild:
+                plays[i] = self.game.build_play(i)
+                continue
+
+            play = plays[i]
+            play._raw = raw_plays[i]
+            for j in sorted(play_changes.play_events or ()):
+                if j < len(play.play_events):
+                    play.play_events[j] = play.build_play_event(j)
+            for j in range(
+                len(play.play_events), len(play._raw["playEvents"])
+            ):
+                play.play_events.append(play.build_play_event(j))
+
+        for i in range(len(plays), len(raw_plays)):
+            plays.append(self.game.build_play(i))
+        return self.new_events(changes, previous_plays)
+
+    def play_changes(
+        self, operations: list[dict[str, Any]]
+    ) -> dict[int, PlayChanges]:
+        """
+        :return: Map of play index to what changed in it
+        :raise FullRebuild: If plays could not be updated individually
+        """
+        plays = self.game.plays
+        changes: dict[int, PlayChanges] = {}
+        for operation in operations:
+            if operation["op"] == "move":
+                raise FullRebuild()
+
+            parts = ut.parse_json_pointer(operation["path"])
+            if parts[: len(ALL_PLAYS_POINTER)] != ALL_PLAYS_POINTER:
+                if ALL_PLAYS_POINTER[: len(parts)] == parts:
+                    # Replaces allPlays or one of its parents
+                    raise FullRebuild()
+                continue
+
+            parts = parts[len(ALL_PLAYS_POINTER) :]
+            if not parts:
+                raise FullRebuild()
+            if parts[0] == "-":
+                continue
+            i = int(parts[0])
+            play_changes = changes.setdefault(i, PlayChanges())
+
+            if len(parts) == 1:
+                if operation["op"] != "replace" and i < len(plays):
+                    raise FullRebuild()
+                play_changes.rebuild = True
+            elif parts[1] == "matchup":
+                play_changes.rebuild = True
+            elif parts[1] == "playEvents":
+                if len(parts) == 2:
+                    play_changes.rebuild = True
+                    continue
+                if parts[2] == "-":
+                    # Appended events are picked up after the patch
+                    continue
+                j = int(parts[2])
+                inserted = operation["op"] != "replace" and len(parts) == 3
+                if operation["op"] == "remove" or (
+                    inserted and i < len(plays)
+                    and j < len(plays[i].play_events)
+                ):
+                    play_changes.rebuild = True
+                    continue
+                if play_changes.play_events is None:
+                    play_changes.play_events = set()
+                play_changes.play_events.add(j)
+        return changes
+
+    def new_events(
+        self, changes: dict[int, PlayChanges], previous_plays: int
+    ) -> list[LiveEvent]:
+        """
+        :return: Events for plays added after previous_plays and for pitches with a play id that has not been seen
+        """
+        plays = self.game.plays
+        events = []
+        for i in sorted({*changes, *range(previous_plays, len(plays))}):
+            if i >= len(plays):
+                continue
+            play = plays[i]
+            if i >= previous_plays:
+                events.append(LiveEvent(LiveEventType.NEW_PLAY, play))
+            for play_event in play.play_events:
+                if (
+                    play_event.play_event_type == PlayEventType.PITCH
+                    and play_event.play_id is not None
+                    and play_event.play_id not in self._seen_play_ids
+                ):
+                    self._seen_play_ids.add(play_event.play_id)
+                    events.append(
+                        LiveEvent(LiveEventType.NEW_PITCH, play, play_event)
+                    )
+        return events
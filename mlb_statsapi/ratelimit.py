@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import IO, Mapping
+from urllib.parse import urlsplit
+
+from . import instrumentation
+from .transport import (AsyncTransport, Response, Transport,
+                        get_default_transport)
+
+# Requests per second each host starts at, hosts not listed use DEFAULT_RATE
+DEFAULT_HOST_RATES = {
+    "https://statsapi.mlb.com": 10.0,
+    "https://fastball-gateway.mlb.com": 5.0,
+}
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+MIN_RATE = 0.2
+MAX_RATE = 100.0
+# Multiplies the rate of a host that throttles us
+DECREASE_FACTOR = 0.5
+# Seconds between two decreases, responses throttled together count once
+DECREASE_INTERVAL = 1.0
+# Requests per second added to the rate over each second without throttling
+INCREASE_PER_SECOND = 1.0
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+# Statuses that are retried, and the ones that mean we are going too fast
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def host_of(uri: str) -> str:
+    """
+    :return: Origin of uri, e.g. https://statsapi.mlb.com
+    """
+    url = urlsplit(uri)
+    return f"{url.scheme}://{url.netloc}"
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """
+    :return: Seconds to wait from a Retry-After header in seconds or as an HTTP date, None without one
+    """
+    value = next(
+        (v for k, v in headers.items() if k.lower() == "retry-after"), None
+    )
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+        return max(0.0, retry_at - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff(attempt: int) -> float:
+    """
+    :return: Seconds to wait before retry attempt, with full jitter so that clients throttled together do not retry together
+    """
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    # Requests that had to wait for a token, and the seconds they waited
+    waits: int = 0
+    wait_seconds: float = 0.0
+    rate: float = 0.0
+
+
+class TokenBucket:
+    """
+    Token bucket whose rate adapts to throttling: halved when the host
+    throttles us, then raised again while it does not. Tokens are reserved
+    rather than waited for, so callers sleep outside the lock and threads and
+    async tasks can share a bucket. Not thread safe, see RateLimiter
+
+    :param rate: Tokens added per second
+    :param burst: Maximum tokens saved up
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.tokens = float(burst)
+        # Time the tokens were counted at, in the future while paused
+        self.updated = time.monotonic()
+        self.last_decrease = float("-inf")
+
+    def refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes a token, possibly one that is not there yet
+
+        :return: Seconds to wait before using the token
+        """
+        self.refill(now)
+        self.tokens -= 1
+        # Wait out any pause, then until the missing tokens are refilled
+        missing = max(0.0, -self.tokens)
+        return max(0.0, self.updated - now) + missing / self.rate
+
+    def pause(self, now: float, seconds: float) -> None:
+        """
+        Hands out no token for seconds, e.g. for a Retry-After header
+        """
+        self.refill(now)
+        self.tokens = min(self.tokens, 0.0)
+        self.updated = max(self.updated, now + seconds)
+
+    def throttled(self, now: float) -> None:
+        if now - self.last_decrease >= DECREASE_INTERVAL:
+            self.last_decrease = now
+            self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+
+    def succeeded(self) -> None:
+        # About INCREASE_PER_SECOND more per second when running at the rate
+        self.rate = min(
+            self.max_rate, self.rate + INCREASE_PER_SECOND / self.rate
+        )
+
+
+class RateLimiter:
+    """
+    Request budget of each host, shared by every thread and async task
+    sending through it. Requests wait for a token of their host, throttled
+    responses lower the rate of the host and Retry-After pauses it
+
+    :param host_rates: Starting requests per second of specific origins
+    :param default_rate: Starting requests per second of other origins
+    :param burst: Requests a host may get at once after being idle
+    """
+
+    def __init__(
+        self,
+        host_rates: Mapping[str, float] = DEFAULT_HOST_RATES,
+        default_rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+    ) -> None:
+        self.host_rates = dict(host_rates)
+        self.default_rate = default_rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        # Called with the lock held
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(
+                self.host_rates.get(host, self.default_rate),
+                self.burst,
+                self.min_rate,
+                self.max_rate,
+            )
+            self._stats[host] = HostStats()
+        return bucket
+
+    def reserve(self, uri: str) -> float:
+        """
+        Takes a token of the host of uri
+
+        :return: Seconds to wait before sending the request
+        """
+        host = host_of(uri)
+        with self._lock:
+            wait = self.bucket(host).reserve(time.monotonic())
+            stats = self._stats[host]
+            stats.requests += 1
+            if wait > 0:
+                stats.waits += 1
+                stats.wait_seconds += wait
+        if wait > 0:
+            instrumentation.count("ratelimit.waits", host=host)
+        return wait
+
+    def acquire(self, uri: str) -> None:
+        """
+        Blocks until a request to uri may be sent
+        """
+        wait = self.reserve(uri)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, uri: str) -> None:
+        wait = self.reserve(uri)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update(self, uri: str, response: Response) -> bool:
+        """
+        Adapts the rate of the host of uri to its response
+
+        :return: True if the request should be retried
+        """
+        host = host_of(uri)
+        status = response.status_code
+        retry_after = None
+        if status in RETRY_STATUSES:
+            retry_after = retry_after_seconds(response.headers)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self.bucket(host)
+            if status in THROTTLE_STATUSES:
+                bucket.throttled(now)
+                self._stats[host].throttled += 1
+            elif status < 400:
+                bucket.succeeded()
+            if retry_after is not None:
+                bucket.pause(now, retry_after)
+        if status in THROTTLE_STATUSES:
+            instrumentation.count("ratelimit.throttled", host=host)
+        return status in RETRY_STATUSES
+
+    def retrying(self, uri: str) -> None:
+        host = host_of(uri)
+        with self._lock:
+            self.bucket(host)
+            self._stats[host].retries += 1
+
+    def stats(self) -> dict[str, HostStats]:
+        """
+        :return: Copy of the stats of each host, with its current rate
+        """
+        with self._lock:
+            return {
+                host: replace(stats, rate=self._buckets[host].rate)
+                for host, stats in self._stats.items()
+            }
+
+
+_default_rate_limiter: RateLimiter | None = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_default_rate_limiter() -> RateLimiter:
+    """
+    :return: RateLimiter shared by the rate limited transports that are not given one
+    """
+    global _default_rate_limiter
+    with _default_rate_limiter_lock:
+        if _default_rate_limiter is None:
+            _default_rate_limiter = RateLimiter()
+        return _default_rate_limiter
+
+
+class RateLimitedTransport(Transport):
+    """
+    Sends requests through transport once the rate limiter allows it, and
+    retries throttled and failed responses with jittered backoff. Use as the
+    default transport to share one budget across every request type:
+    set_default_transport(RateLimitedTransport()). Retries are best left to
+    this transport only, e.g. RequestsTransport(retries=Retry(0))
+
+    :param transport: Transport sending the requests, the shared default if None
+    :param limiter: Budget of each host, the shared default if None
+    :param max_retries: Retries of a request before its last response is returned
+    :param owns_transport: Close the transport when this transport is closed
+    """
+
+    def __init__(
+        self,
+        transport: Transport | None = None,
+        limiter: RateLimiter | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        owns_transport: bool = False,
+    ) -> None:
+        self.transport = transport or get_default_transport()
+        self.limiter = limiter or get_default_rate_limiter()
+        self.max_retries = max_retries
+        self.owns_transport = owns_transport
+
+    def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(uri)
+            response = self.transport.request(method, uri, data)
+            if not self.limiter.update(uri, response):
+                break
+            if attempt < self.max_retries:
+                self.limiter.retrying(uri)
+                time.sleep(backoff(attempt))
+        return response
+
+    def stream(
+        self, method: str, uri: str, data: str | None = None
+    ) -> IO[bytes]:
+        self.limiter.acquire(uri)
+        return self.transport.stream(method, uri, data)
+
+    def close(self) -> None:
+        if self.owns_transport:
+            self.transport.close()
+
+
+class RateLimitedAsyncTransport(AsyncTransport):
+    """
+    Async version of RateLimitedTransport, sharing the limiter with it and
+    with other threads
+
+    :param transport: Transport sending the requests
+    :param limiter: Budget of each host, the shared default if None
+    :param max_retries: Retries of a request before its last response is returned
+    :param owns_transport: Close the transport when this transport is closed
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        limiter: RateLimiter | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        owns_transport: bool = False,
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter or get_default_rate_limiter()
+        self.max_retries = max_retries
+        self.owns_transport = owns_transport
+
+    async def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire_async(uri)
+            response = await self.transport.request(method, uri, data)
+            if not self.limiter.update(uri, response):
+                break
+            if attempt < self.max_retries:
+                self.limiter.retrying(uri)
+                await asyncio.sleep(backoff(attempt))
+        return response
+
+    async def close(self) -> None:
+        if self.owns_transport:
+            await self.transport.close()
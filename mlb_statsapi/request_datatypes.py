@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
+import math
+import threading
+from datetime import date
 from abc import ABC, abstractmethod
-from typing import Any, Type
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (Any, AsyncIterator, Awaitable, Callable, Iterable,
+                    Type)
+from urllib.parse import urlencode
 
-import requests
-from requests.adapters import HTTPAdapter, Retry
-
-from .constants import ROOT_KEY
-from .datatypes import Base, Game, Metadata, PlayVideos
+from . import instrumentation
+from .cache import (FEED_SEARCH_BYTES, GameCache, ResponseCache,
+                    estimate_game_bytes, feed_state, feed_timestamp)
+from .coalesce import RequestCoalescer
+from .constants import ROOT_KEY, GameState, Numeric, VideoDecoration
+from .datatypes import (Base, Game, Metadata, PlayVideo, PlayVideos,
+                        Schedule)
+from .streaming import GameStream
+from .transport import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RETRIES,
+    AsyncTransport,
+    Response,
+    Transport,
+    create_async_transport,
+    get_default_transport,
+)
 
 
 class BaseRequest(ABC):
@@ -20,8 +39,22 @@ class BaseRequest(ABC):
     )
     DATA: str = "{{}}"
     DATATYPE: Type[Base]
+    METHOD: str = "GET"
+
+    # Parse the response with lazily materialized fields
+    lazy: bool = False
+    # Type of decimal metrics in the parsed response
+    numeric: Numeric = Numeric.DECIMAL
+    # Transport used to send the request, the shared default if None
+    transport: Transport | None = None
+    # Cache of raw responses, not used if None
+    cache: ResponseCache | None = None
+    # Seconds a cached response stays fresh, None to never expire
+    CACHE_TTL: float | None = 60
+    # Shares concurrent identical requests, not used if None
+    coalescer: RequestCoalescer | None = None
 
-    retries = Retry(total=3, backoff_factor=2, status_forcelist=[502, 503, 504])
+    retries = DEFAULT_RETRIES
 
     @property
     def class_obj(self):
@@ -49,19 +82,158 @@ class BaseRequest(ABC):
     def data_payload(self) -> str:
         return f"{self.DATA}".format(**self.params)
 
+    @property
+    def request_data(self) -> str | None:
+        return self.data_payload if self.METHOD == "POST" else None
+
     def decorators(self) -> dict[str, Any]:
         return {}
 
-    # TODO Cache result
+    async def decorators_async(
+        self, transport: AsyncTransport
+    ) -> dict[str, Any]:
+        return {}
+
+    @property
+    def cache_key(self) -> str:
+        return ResponseCache.key(
+            self.METHOD, self.request_uri, self.data_payload
+        )
+
+    def cache_ttl(self) -> float | None:
+        """
+        :return: Seconds the response stays fresh in the cache, called after the response is parsed
+        """
+        return self.CACHE_TTL
+
+    def cached_response(self) -> Response | None:
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache_key)
+
+    def cache_response(self, response: Response) -> None:
+        if self.cache is None or response.status_code != 200:
+            return
+        self.cache.put(self.cache_key, response, self.cache_ttl())
+
+    def get_transport(self) -> Transport:
+        return self.transport or get_default_transport()
+
+    @property
+    def coalesce_key(self) -> tuple:
+        """
+        :return: Key of the requests that get the same parsed result
+        """
+        return (
+            self.class_obj.__name__,
+            self.cache_key,
+            self.lazy,
+            self.numeric,
+        )
+
     def make_request(self) -> Any:
-        session = requests.Session()
-        session.mount("http://", HTTPAdapter(max_retries=self.retries))
-        session.mount("https://", HTTPAdapter(max_retries=self.retries))
-        self._raw: dict = session.get(self.request_uri).json()
+        """
+        Fetches and parses the response, or waits for an identical request already doing so if there is a coalescer
+        """
+        if self.coalescer is None:
+            return self.fetch_and_parse()
+        self.data = self.coalescer.run(
+            self.coalesce_key, self.fetch_and_parse
+        )
+        return self.data
+
+    def fetch_and_parse(self) -> Any:
+        # Before the request, so decorators made in the background overlap it
+        decorators = self.decorators()
+        response, fetched = self.fetch_response()
+        data = self.parse_response(response, decorators)
+        if fetched:
+            self.cache_response(response)
+        return data
+
+    def fetch_response(self) -> tuple[Response, bool]:
+        """
+        :return: The cached response, or the response from the network and True
+        """
+        response = self.cached_response()
+        if response is not None:
+            instrumentation.count(
+                "request.cache_hits", request=self.class_obj.__name__
+            )
+            return response, False
+        with instrumentation.timed(
+            "request.network", request=self.class_obj.__name__
+        ):
+            response = self.get_transport().request(
+                self.METHOD, self.request_uri, data=self.request_data
+            )
+        return response, True
+
+    async def make_request_async(
+        self, transport: AsyncTransport | None = None
+    ) -> Any:
+        """
+        Async version of make_request, fetching the decorators concurrently with the request itself.
+        Without a transport, a new one from create_async_transport is used for this request only
+        """
+        if transport is None:
+            async with create_async_transport() as transport:
+                return await self.make_request_async(transport)
+        if self.coalescer is None:
+            return await self.fetch_and_parse_async(transport)
+        self.data = await self.coalescer.run_async(
+            self.coalesce_key, lambda: self.fetch_and_parse_async(transport)
+        )
+        return self.data
 
-        self.data = self.class_obj.DATATYPE(
-            self._raw, Metadata(keys=[ROOT_KEY]), self.decorators()
+    async def fetch_and_parse_async(self, transport: AsyncTransport) -> Any:
+        (response, fetched), decorators = await asyncio.gather(
+            self.fetch_response_async(transport),
+            self.decorators_async(transport),
         )
+        # Parse in a worker thread so the event loop keeps serving requests
+        data = await asyncio.to_thread(
+            self.parse_response, response, decorators
+        )
+        if fetched:
+            await asyncio.to_thread(self.cache_response, response)
+        return data
+
+    async def fetch_response_async(
+        self, transport: AsyncTransport
+    ) -> tuple[Response, bool]:
+        response = await asyncio.to_thread(self.cached_response)
+        if response is not None:
+            instrumentation.count(
+                "request.cache_hits", request=self.class_obj.__name__
+            )
+            return response, False
+        with instrumentation.timed(
+            "request.network", request=self.class_obj.__name__
+        ):
+            response = await transport.request(
+                self.METHOD, self.request_uri, data=self.request_data
+            )
+        return response, True
+
+    def parse_response(
+        self, response: Response, decorators: dict[str, Any]
+    ) -> Any:
+        with instrumentation.timed(
+            "request.decode", request=self.class_obj.__name__
+        ):
+            self._raw: dict = response.json()
+
+        with instrumentation.timed(
+            "request.construct", datatype=self.class_obj.DATATYPE.__name__
+        ):
+            self.data = self.class_obj.DATATYPE(
+                self._raw,
+                Metadata(keys=[ROOT_KEY]),
+                decorators,
+                lazy=self.lazy,
+                numeric=self.numeric,
+            )
         return self.data
 
 
@@ -73,14 +245,414 @@ class GameRequest(BaseRequest):
 
     API_PATH: str = "/{VERSION}/game/{game_pk}/feed/live"
     DATATYPE = Game
+    FINAL_STATE = GameState.FINAL.value
+    # Parsed games reused while their feed is unchanged, not used if None
+    game_cache: GameCache | None = None
 
-    def __init__(self, game_pk: int | str) -> None:
+    def __init__(
+        self,
+        game_pk: int | str,
+        lazy: bool = False,
+        transport: Transport | None = None,
+        cache: ResponseCache | None = None,
+        numeric: Numeric = Numeric.DECIMAL,
+        play_videos: PlayVideos | None = None,
+        videos: VideoDecoration = VideoDecoration.EAGER,
+        coalescer: RequestCoalescer | None = None,
+        game_cache: GameCache | None = None,
+    ) -> None:
+        """
+        :param play_videos: Videos of the game, e.g. from a VideoResolver. Requested with the game if None
+        :param videos: When the videos are requested if play_videos is None, see VideoDecoration
+        :param coalescer: Shares the game with concurrent requests for it made with the same coalescer
+        :param game_cache: Returns the parsed game again while its feed timestamp is unchanged, and final games without a request
+        """
         self.game_pk = game_pk
+        self.lazy = lazy
+        self.numeric = numeric
+        self.transport = transport
+        self.play_videos = play_videos
+        self.videos = VideoDecoration(videos)
+        if cache is not None:
+            self.cache = cache
+        if coalescer is not None:
+            self.coalescer = coalescer
+        if game_cache is not None:
+            self.game_cache = game_cache
+
+    @property
+    def coalesce_key(self) -> tuple:
+        # Games decorated with given videos are only shared with requests
+        # given the same videos
+        play_videos = self.play_videos and id(self.play_videos)
+        return (*super().coalesce_key, self.videos, play_videos)
+
+    def game_cache_key(self, timestamp: str | None) -> tuple:
+        """
+        :param timestamp: metaData.timeStamp of the feed, None for the game once final
+        """
+        play_videos = self.play_videos and id(self.play_videos)
+        return (
+            str(self.game_pk),
+            timestamp,
+            self.lazy,
+            self.numeric,
+            self.videos,
+            play_videos,
+        )
+
+    def is_final(self) -> bool:
+        state = self._raw.get("gameData", {}).get("status", {})
+        return state.get("abstractGameState") == self.FINAL_STATE
+
+    def cache_ttl(self) -> float | None:
+        # Final games no longer change
+        if self.is_final():
+            return None
+        return self.CACHE_TTL
+
+    def known_final(self) -> bool:
+        """
+        :return: Whether the game is final in the parsed feed, or before it is parsed in the feed in the response cache
+        """
+        if hasattr(self, "_raw"):
+            return self.is_final()
+        if self.cache is None:
+            return False
+        entry = self.cache.open_entry(self.cache_key)
+        if entry is None:
+            return False
+        try:
+            with entry[1] as f:
+                start = f.read(FEED_SEARCH_BYTES)
+        except (EOFError, OSError):
+            return False
+        return feed_state(start) == self.FINAL_STATE
+
+    def cached_game(self) -> Game | None:
+        """
+        :return: The final game from the game cache, if it is there
+        """
+        game = self.game_cache.get(
+            self.game_cache_key(None), count_miss=False
+        )
+        if game is not None:
+            self._raw = game._raw
+            self.data = game
+        return game
+
+    def reuse_game(self, response: Response) -> tuple[Game | None, tuple]:
+        """
+        :return: The game parsed from an identical feed if it is in the game cache, and the key of the feed
+        """
+        key = self.game_cache_key(feed_timestamp(response.content))
+        # Without a timestamp the feed cannot be matched to a parsed game
+        game = self.game_cache.get(key) if key[1] is not None else None
+        if game is not None:
+            self._raw = game._raw
+            self.data = game
+        return game, key
+
+    def keep_game(self, response: Response, key: tuple) -> None:
+        if response.status_code != 200:
+            return
+        size = estimate_game_bytes(response.content)
+        if self.is_final():
+            self.game_cache.put(
+                self.game_cache_key(None), self.data, size, final=True
+            )
+        elif key[1] is not None:
+            self.game_cache.put(key, self.data, size)
+
+    def fetch_and_parse(self) -> Game:
+        if self.game_cache is None:
+            return super().fetch_and_parse()
+        game = self.cached_game()
+        if game is not None:
+            return game
+        response, fetched = self.fetch_response()
+        game, key = self.reuse_game(response)
+        if game is None:
+            # Only once the feed is new, so that background videos are not
+            # fetched for a game the cache returns. They still overlap parsing
+            game = self.parse_response(response, self.decorators())
+            self.keep_game(response, key)
+        if fetched:
+            self.cache_response(response)
+        return game
+
+    async def fetch_and_parse_async(self, transport: AsyncTransport) -> Game:
+        if self.game_cache is None:
+            return await super().fetch_and_parse_async(transport)
+        game = self.cached_game()
+        if game is not None:
+            return game
+        response, fetched = await self.fetch_response_async(transport)
+        game, key = self.reuse_game(response)
+        if game is None:
+            decorators = await self.decorators_async(transport)
+            game = await asyncio.to_thread(
+                self.parse_response, response, decorators
+            )
+            self.keep_game(response, key)
+        if fetched:
+            await asyncio.to_thread(self.cache_response, response)
+        return game
+
+    def deferred_decorators(
+        self, transport: AsyncTransport | None = None
+    ) -> dict[str, Any] | None:
+        """
+        :param transport: Transport of an async request, deferred and background videos are then fetched on it in the running loop
+        :return: Decorators that do not wait for the video request, None if it must be made now
+        """
+        if self.play_videos is not None:
+            return {"play_videos": self.play_videos}
+        if self.videos == VideoDecoration.OFF:
+            return {}
+
+        self._play_video_request = PlayVideoRequest(
+            game_pk=self.game_pk,
+            transport=self.transport,
+            cache=self.cache,
+            final=self.known_final,
+        )
+        if self.videos == VideoDecoration.EAGER:
+            return None
+        if transport is not None:
+            play_videos = AsyncDeferredPlayVideos(
+                lambda: self._play_video_request.make_request_async(
+                    transport
+                )
+            )
+            if self.videos == VideoDecoration.BACKGROUND:
+                play_videos.start()
+            return {"play_videos": play_videos}
+        fetch = self._play_video_request.make_request
+        if self.videos == VideoDecoration.BACKGROUND:
+            fetch = background_executor().submit(fetch).result
+        return {"play_videos": DeferredPlayVideos(fetch)}
 
     def decorators(self) -> dict[str, Any]:
-        self._play_video_request = PlayVideoRequest(game_pk=self.game_pk)
+        decorators = self.deferred_decorators()
+        if decorators is not None:
+            return decorators
         return {"play_videos": self._play_video_request.make_request()}
 
+    async def make_request_async(
+        self, transport: AsyncTransport | None = None
+    ) -> Game:
+        """
+        See BaseRequest.make_request_async. Deferred and background videos are fetched on transport, look them up while it is open.
+        Without a transport, background videos are fetched before the new transport is closed
+        """
+        if transport is not None:
+            return await super().make_request_async(transport)
+        async with create_async_transport() as transport:
+            game = await super().make_request_async(transport)
+            play_videos = started_videos(game)
+            if play_videos is not None:
+                await play_videos.settle()
+            return game
+
+    def stream(self) -> GameStream:
+        """
+        Streams the game feed instead of loading it whole, see GameStream.
+        A cached response is streamed from the cache, but streamed responses are not added to it
+        """
+        decorators = self.decorators()
+        f = self.cache.open(self.cache_key) if self.cache else None
+        if f is None:
+            f = self.get_transport().stream(
+                self.METHOD, self.request_uri, data=self.request_data
+            )
+        return GameStream(
+            f, decorators, lazy=self.lazy, numeric=self.numeric
+        )
+
+    async def decorators_async(
+        self, transport: AsyncTransport
+    ) -> dict[str, Any]:
+        decorators = self.deferred_decorators(transport)
+        if decorators is not None:
+            return decorators
+        return {
+            "play_videos": await self._play_video_request.make_request_async(
+                transport
+            )
+        }
+
+
+class DeferredPlayVideos:
+    """
+    Stands in for the PlayVideos of a game until a play video is looked up,
+    then gets them once from fetch. Pickled with the PlayVideos fetched
+
+    :param fetch: Returns the PlayVideos, e.g. PlayVideoRequest.make_request
+    """
+
+    def __init__(self, fetch: Callable[[], PlayVideos] | None) -> None:
+        self._fetch = fetch
+        self._play_videos: PlayVideos | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Fetched before pickling, the fetch and the lock cannot be sent
+        return {"_play_videos": self.get()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._fetch = None
+        self._play_videos = state["_play_videos"]
+        self._lock = threading.Lock()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, DeferredPlayVideos):
+            other = other.get()
+        return self.get() == other
+
+    @property
+    def loaded(self) -> bool:
+        return self._play_videos is not None
+
+    def get(self) -> PlayVideos:
+        if self._play_videos is None:
+            with self._lock:
+                if self._play_videos is None:
+                    self._play_videos = self._fetch()
+        return self._play_videos
+
+    @property
+    def play_videos(self) -> list[PlayVideo]:
+        return self.get().play_videos
+
+    @property
+    def video_url_by_play_id(self) -> dict[str, str]:
+        return self.get().video_url_by_play_id
+
+
+class AsyncDeferredPlayVideos(DeferredPlayVideos):
+    """
+    DeferredPlayVideos fetched in the event loop of an async request, on its
+    transport. Look them up while the loop runs: await get_async() in the
+    loop, or look them up from another thread. Looking them up in the loop
+    before they are fetched raises, as waiting would block the loop
+
+    :param fetch: Returns the PlayVideos, e.g. PlayVideoRequest.make_request_async on the transport. Called in the loop
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[PlayVideos]]) -> None:
+        super().__init__(self.wait)
+        self._fetch_async = fetch
+        self._loop = asyncio.get_running_loop()
+        self._future: Future | None = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> Future:
+        """
+        Starts the fetch in the loop, once
+
+        :return: Future of the PlayVideos
+        """
+        with self._start_lock:
+            if self._future is None:
+                if not self._loop.is_running():
+                    raise RuntimeError(
+                        "Videos of a game fetched with an async transport"
+                        " are fetched on it, look them up before its event"
+                        " loop stops"
+                    )
+                self._future = asyncio.run_coroutine_threadsafe(
+                    self._fetch_async(), self._loop
+                )
+            return self._future
+
+    def in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def wait(self) -> PlayVideos:
+        future = self._future
+        if (future is None or not future.done()) and self.in_loop():
+            raise RuntimeError(
+                "Videos are not fetched yet, await get_async() in the event"
+                " loop before looking them up"
+            )
+        return self.start().result()
+
+    async def get_async(self) -> PlayVideos:
+        if self._play_videos is None:
+            self._play_videos = await asyncio.wrap_future(self.start())
+        return self._play_videos
+
+    async def settle(self) -> None:
+        """
+        Waits for a fetch already started, e.g. before closing its transport
+        """
+        if self._future is not None:
+            await asyncio.wait([asyncio.wrap_future(self._future)])
+
+
+def started_videos(game: Any) -> AsyncDeferredPlayVideos | None:
+    """
+    :return: Videos of game being fetched on an async transport, if any
+    """
+    play_videos = getattr(game, "_extra_fields", {}).get("play_videos")
+    if isinstance(play_videos, AsyncDeferredPlayVideos):
+        return play_videos
+    return None
+
+
+_background_executor: ThreadPoolExecutor | None = None
+_background_executor_lock = threading.Lock()
+
+
+def background_executor() -> ThreadPoolExecutor:
+    """
+    :return: Executor shared by the requests made in the background
+    """
+    global _background_executor
+    with _background_executor_lock:
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(
+                DEFAULT_CONCURRENCY, thread_name_prefix="mlb-statsapi"
+            )
+        return _background_executor
+
+
+class GameDiffPatchRequest(BaseRequest):
+    """
+    Request the changes to a game feed since a metaData.timeStamp.
+    The response is a list of {"diff": [JSON patch operations]}, or the full feed if the API decides that is smaller
+    """
+
+    API_PATH: str = "/{VERSION}/game/{game_pk}/feed/live/diffPatch?startTimecode={start_timecode}"
+
+    def __init__(
+        self,
+        game_pk: int | str,
+        start_timecode: str,
+        transport: Transport | None = None,
+    ) -> None:
+        self.game_pk = game_pk
+        self.start_timecode = start_timecode
+        self.transport = transport
+
+    # Live changes are never cached
+    def make_request(self) -> list[dict[str, Any]] | dict[str, Any]:
+        with instrumentation.timed(
+            "request.network", request=self.class_obj.__name__
+        ):
+            response = self.get_transport().request(
+                self.METHOD, self.request_uri, data=self.request_data
+            )
+        with instrumentation.timed(
+            "request.decode", request=self.class_obj.__name__
+        ):
+            self._raw = self.data = response.json()
+        return self.data
+
 
 class PlayVideoRequest(BaseRequest):
     """
@@ -88,22 +660,274 @@ class PlayVideoRequest(BaseRequest):
     """
 
     BASE_URI = "https://fastball-gateway.mlb.com/graphql"
-    DATA = '{{"query":"query Search($query: String!, $page: Int, $limit: Int, $feedPreference: FeedPreference, $languagePreference: LanguagePreference, $contentPreference: ContentPreference, $queryType: QueryType = STRUCTURED, $withPlaybacksSegments: Boolean = false) {{\\r\\n  search(query: $query, limit: $limit, page: $page, feedPreference: $feedPreference, languagePreference: $languagePreference, contentPreference: $contentPreference, queryType: $queryType) {{\\r\\n    plays {{\\r\\n      mediaPlayback {{\\r\\n        ...MediaPlaybackFields\\r\\n        __typename\\r\\n      }}\\r\\n      __typename\\r\\n    }}\\r\\n    total\\r\\n    __typename\\r\\n  }}\\r\\n}}\\r\\n\\r\\nfragment MediaPlaybackFields on MediaPlayback {{\\r\\n  id\\r\\n  slug\\r\\n  feeds {{\\r\\n    playbacks {{\\r\\n      segments @include(if: $withPlaybacksSegments)\\r\\n    }}\\r\\n  }}\\r\\n}}","variables":{{"withPlaybacksSegments":false,"query":"gamePk = {game_pk} Order By Timestamp ASC","limit":{max_videos},"page":0,"languagePreference":"EN","contentPreference":"MIXED"}}}}'
+    DATA = '{{"query":"query Search($query: String!, $page: Int, $limit: Int, $feedPreference: FeedPreference, $languagePreference: LanguagePreference, $contentPreference: ContentPreference, $queryType: QueryType = STRUCTURED, $withPlaybacksSegments: Boolean = false) {{\\r\\n  search(query: $query, limit: $limit, page: $page, feedPreference: $feedPreference, languagePreference: $languagePreference, contentPreference: $contentPreference, queryType: $queryType) {{\\r\\n    plays {{\\r\\n      mediaPlayback {{\\r\\n        ...MediaPlaybackFields\\r\\n        __typename\\r\\n      }}\\r\\n      __typename\\r\\n    }}\\r\\n    total\\r\\n    __typename\\r\\n  }}\\r\\n}}\\r\\n\\r\\nfragment MediaPlaybackFields on MediaPlayback {{\\r\\n  id\\r\\n  slug\\r\\n  feeds {{\\r\\n    playbacks {{\\r\\n      segments @include(if: $withPlaybacksSegments)\\r\\n    }}\\r\\n  }}\\r\\n}}","variables":{{"withPlaybacksSegments":false,"query":"gamePk = {game_pk} Order By Timestamp ASC","limit":{max_videos},"page":{page},"languagePreference":"EN","contentPreference":"MIXED"}}}}'
     DATATYPE = PlayVideos
+    METHOD = "POST"
+    # Videos keep being added for a while after a game is final
+    CACHE_TTL = 6 * 60 * 60
+    # and with every play while it is live
+    LIVE_CACHE_TTL = GameRequest.CACHE_TTL
 
-    def __init__(self, game_pk: int | str, max_videos: int = 1000) -> None:
+    def __init__(
+        self,
+        game_pk: int | str,
+        max_videos: int = 1000,
+        transport: Transport | None = None,
+        cache: ResponseCache | None = None,
+        page: int = 0,
+        final: bool | Callable[[], bool] = False,
+    ) -> None:
+        """
+        :param max_videos: Videos per page. Games with more videos are fetched in several pages
+        :param page: Only fetch this page, all pages are fetched from page 0
+        :param final: Whether the game is final, or returns it when the videos are cached, e.g. GameRequest.known_final. Videos of live games expire sooner
+        """
         self.game_pk = game_pk
         self.max_videos = max_videos
+        self.transport = transport
+        self.page = page
+        self.final = final
+        if cache is not None:
+            self.cache = cache
 
-    # TODO Abstract away HTTP method type
-    def make_request(self) -> Any:
-        session = requests.Session()
-        session.mount("http://", HTTPAdapter(max_retries=self.retries))
-        session.mount("https://", HTTPAdapter(max_retries=self.retries))
-        self._raw: dict = session.post(
-            self.request_uri, data=self.data_payload
-        ).json()
-        self.data = self.class_obj.DATATYPE(
-            self._raw, Metadata(keys=[ROOT_KEY])
+    def cache_ttl(self) -> float | None:
+        final = self.final() if callable(self.final) else self.final
+        return self.CACHE_TTL if final else self.LIVE_CACHE_TTL
+
+    def page_request(self, page: int) -> PlayVideoRequest:
+        return PlayVideoRequest(
+            self.game_pk,
+            self.max_videos,
+            transport=self.transport,
+            cache=self.cache,
+            page=page,
+            final=self.final,
+        )
+
+    def remaining_pages(self, play_videos: PlayVideos) -> range:
+        """
+        :return: Pages holding the videos past the first page, none if this request is for a single page
+        """
+        search = (play_videos._raw.get("data") or {}).get("search") or {}
+        total = search.get("total") or 0
+        if self.page:
+            return range(0)
+        return range(1, math.ceil(total / self.max_videos))
+
+    def merge_pages(
+        self, play_videos: PlayVideos, pages: list[PlayVideos]
+    ) -> PlayVideos:
+        if not pages:
+            return play_videos
+        search = play_videos._raw["data"]["search"]
+        plays = [
+            *search["plays"],
+            *(
+                play
+                for page in pages
+                for play in page._raw["data"]["search"]["plays"]
+            ),
+        ]
+        self._raw = {"data": {"search": {**search, "plays": plays}}}
+        self.data = PlayVideos(
+            self._raw, Metadata(keys=[ROOT_KEY]), play_videos._extra_fields
         )
         return self.data
+
+    def make_request(self) -> PlayVideos:
+        play_videos = super().make_request()
+        pages = [
+            self.page_request(page).make_request()
+            for page in self.remaining_pages(play_videos)
+        ]
+        return self.merge_pages(play_videos, pages)
+
+    async def make_request_async(
+        self, transport: AsyncTransport | None = None
+    ) -> PlayVideos:
+        if transport is None:
+            async with create_async_transport() as transport:
+                return await self.make_request_async(transport)
+
+        play_videos = await super().make_request_async(transport)
+        pages = await asyncio.gather(
+            *(
+                self.page_request(page).make_request_async(transport)
+                for page in self.remaining_pages(play_videos)
+            )
+        )
+        return self.merge_pages(play_videos, list(pages))
+
+
+class ScheduleRequest(BaseRequest):
+    """
+    Request the games scheduled in a date range or a whole season
+    """
+
+    VERSION: str = "v1"
+    API_PATH: str = "/{VERSION}/schedule?{query}"
+    DATATYPE = Schedule
+    SPORT_ID = 1
+
+    def __init__(
+        self,
+        start_date: date | str | None = None,
+        end_date: date | str | None = None,
+        season: int | str | None = None,
+        game_types: Iterable[str] = ("R",),
+        transport: Transport | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """
+        :param start_date: First date of the range, as a date or YYYY-MM-DD
+        :param end_date: Last date of the range, the same as start_date if None
+        :param season: Season to request when there is no date range
+        :param game_types: Game types to keep, e.g. R for the regular season and P for the postseason
+        """
+        if start_date is None and season is None:
+            raise ValueError("A start_date or a season is required")
+        query = {"sportId": self.SPORT_ID}
+        if start_date is not None:
+            query["startDate"] = str(start_date)
+            query["endDate"] = str(end_date or start_date)
+        if season is not None:
+            query["season"] = season
+        query["gameType"] = ",".join(game_types)
+        self.query = urlencode(query, safe=",")
+        self.transport = transport
+        if cache is not None:
+            self.cache = cache
+
+
+async def iter_games(
+    game_pks: Iterable[int | str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: AsyncTransport | None = None,
+    lazy: bool = False,
+    videos: VideoDecoration = VideoDecoration.EAGER,
+) -> AsyncIterator[tuple[int | str, Game | Exception]]:
+    """
+    Fetches games concurrently, yielding each one as soon as it is parsed.
+    At most concurrency games are in flight, and new ones are only started as results are consumed
+
+    :param game_pks: Games to fetch
+    :param concurrency: Maximum number of games fetched at once
+    :param transport: Transport shared by all requests. Defaults to a new one from create_async_transport
+    :param lazy: Parse the games in lazy mode
+    :param videos: When the videos of each game are requested, see VideoDecoration. Deferred and background videos are fetched on transport, look them up while it is open
+
+    :return: Async iterator of game pk and the Game, or the exception raised fetching it, in completion order
+    """
+    if transport is None:
+        async with create_async_transport() as transport:
+            started = []
+            async for result in iter_games(
+                game_pks, concurrency, transport, lazy, videos
+            ):
+                play_videos = started_videos(result[1])
+                if play_videos is not None:
+                    started.append(play_videos)
+                yield result
+            # Background videos complete before the transport is closed
+            for play_videos in started:
+                await play_videos.settle()
+        return
+
+    async def fetch(game_pk: int | str) -> tuple[int | str, Game | Exception]:
+        try:
+            request = GameRequest(game_pk, lazy=lazy, videos=videos)
+            return game_pk, await request.make_request_async(transport)
+        except Exception as e:
+            return game_pk, e
+
+    pending: set[asyncio.Task] = set()
+    try:
+        for game_pk in game_pks:
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.create_task(fetch(game_pk)))
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def fetch_games(
+    game_pks: Iterable[int | str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: AsyncTransport | None = None,
+    lazy: bool = False,
+    return_exceptions: bool = False,
+    videos: VideoDecoration = VideoDecoration.EAGER,
+) -> dict[int | str, Game | Exception]:
+    """
+    Fetches many games concurrently. See iter_games
+
+    :param return_exceptions: Put the exception of games that failed in the result instead of raising the first one
+
+    :return: Map of game pk to Game, in the order of game_pks
+    """
+    game_pks = list(game_pks)
+    results = {}
+    async for game_pk, result in iter_games(
+        game_pks, concurrency, transport, lazy, videos
+    ):
+        if isinstance(result, Exception) and not return_exceptions:
+            raise result
+        results[game_pk] = result
+    return {game_pk: results[game_pk] for game_pk in game_pks}
+
+
+async def iter_scheduled_games(
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+    season: int | str | None = None,
+    game_types: Iterable[str] = ("R",),
+    states: Iterable[str] | None = (GameState.FINAL,),
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: AsyncTransport | None = None,
+    lazy: bool = False,
+    videos: VideoDecoration = VideoDecoration.EAGER,
+) -> AsyncIterator[tuple[int, Game | Exception]]:
+    """
+    Finds the games of a date range or season in the schedule and fetches them concurrently, see iter_games.
+    By default only final games are fetched, postponed and cancelled games never are
+
+    :param states: Abstract states of the games to fetch, all if None
+    :param concurrency: Maximum number of games fetched at once
+
+    :return: Async iterator of game pk and the Game, or the exception raised fetching it, in completion order
+    """
+    if transport is None:
+        async with create_async_transport() as transport:
+            async for result in iter_scheduled_games(
+                start_date,
+                end_date,
+                season,
+                game_types,
+                states,
+                concurrency,
+                transport,
+                lazy,
+                videos,
+            ):
+                yield result
+        return
+
+    schedule = await ScheduleRequest(
+        start_date, end_date, season, game_types
+    ).make_request_async(transport)
+    async for result in iter_games(
+        schedule.game_pks(states), concurrency, transport, lazy, videos
+    ):
+        yield result
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+from . import utils as ut
+from .columnar import (MATCH_UP_COLUMNS, PITCH_FIELD_PATHS, PITCH_TYPE_PATH,
+                       SWING_FIELD_PATHS)
+from .constants import ROOT_KEY, Numeric, PlayEventType
+from .datatypes import Game, Metadata, Play
+from .transport import loads
+
+MAGIC = b"MLBSNAP1"
+# Magic followed by the length of the json header
+PREAMBLE = struct.Struct(f"<{len(MAGIC)}sQ")
+# Sections start at multiples of this so NumPy views are aligned
+ALIGNMENT = 8
+
+# Event columns mapped to the parent of their location in the play event,
+# None for the play event itself, and the location in the parent
+EVENT_COLUMN_PATHS: dict[str, tuple[str | None, tuple[str, ...]]] = {
+    **{name: ("pitchData", keys) for name, keys in PITCH_FIELD_PATHS.items()},
+    "pitch_type": (None, PITCH_TYPE_PATH),
+    **{name: ("hitData", keys) for name, keys in SWING_FIELD_PATHS.items()},
+}
+# Event columns stored as int32 codes into a string table, -1 where missing.
+# The others are stored as float64, NaN where missing
+CATEGORICAL_COLUMNS = ("pitch_type", "trajectory", *MATCH_UP_COLUMNS)
+NUMERIC_COLUMNS = tuple(
+    name for name in EVENT_COLUMN_PATHS if name not in CATEGORICAL_COLUMNS
+)
+PITCH_COLUMNS = (*PITCH_FIELD_PATHS, "pitch_type")
+SWING_COLUMNS = tuple(SWING_FIELD_PATHS)
+# Bits of the flags column, set for the rows of the swing and pitch tables
+SWING_ROW = 1
+PITCH_ROW = 2
+
+
+def align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def event_values(
+    play: dict[str, Any], play_event: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    :return: Values of the snapshot columns for one play event
+    """
+    values = {}
+    for name, (parent, keys) in EVENT_COLUMN_PATHS.items():
+        data = play_event if parent is None else play_event.get(parent)
+        values[name] = ut.compiled_path_value(data, keys) if data else None
+    values["pitchHand"] = play["matchup"]["pitchHand"]["code"]
+    values["batSide"] = play["matchup"]["batSide"]["code"]
+    return values
+
+
+def event_flags(play_event: dict[str, Any]) -> int:
+    """
+    :return: Rows the play event belongs to, like columnar.iter_pitch_events
+    """
+    if (
+        play_event.get("playId") is None
+        or play_event.get("type") != PlayEventType.PITCH.value
+    ):
+        return 0
+    return SWING_ROW | (PITCH_ROW if play_event.get("isPitch") else 0)
+
+
+def encode_json(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def write_snapshot(game: Game, path: str | Path) -> Path:
+    """
+    Writes game to a snapshot file that GameSnapshot opens without parsing
+    json. Every play event gets a row of fixed width columns for the pitch
+    and swing metrics, and every play keeps its raw json to build Play
+    objects on demand
+
+    :param game: Game to write
+    :param path: File to write, replaced atomically
+    :return: path
+    """
+    path = Path(path)
+    raw_plays = game._raw["liveData"]["plays"]["allPlays"]
+
+    play_event_offsets = [0]
+    play_ids = []
+    flags = []
+    rows = []
+    for play in raw_plays:
+        for play_event in play["playEvents"]:
+            play_ids.append((play_event.get("playId") or "").encode())
+            flags.append(event_flags(play_event))
+            rows.append(event_values(play, play_event))
+        play_event_offsets.append(len(rows))
+
+    plays_json = [encode_json(play) for play in raw_plays]
+    game_json = encode_json(
+        {
+            **game._raw,
+            "liveData": {
+                **game._raw["liveData"],
+                "plays": {
+                    **game._raw["liveData"]["plays"],
+                    "allPlays": [],
+                },
+            },
+        }
+    )
+
+    play_id_width = max(map(len, play_ids), default=0) or 1
+    categories = {}
+    sections: dict[str, np.ndarray] = {
+        "play_event_offsets": np.array(play_event_offsets, dtype=np.int64),
+        "play_json_offsets": np.cumsum(
+            [0, *map(len, plays_json)], dtype=np.int64
+        ),
+        "plays_json": np.frombuffer(b"".join(plays_json), dtype=np.uint8),
+        "game_json": np.frombuffer(game_json, dtype=np.uint8),
+        "play_id": np.array(play_ids, dtype=f"S{play_id_width}"),
+        "flags": np.array(flags, dtype=np.uint8),
+    }
+    for name in NUMERIC_COLUMNS:
+        sections[name] = np.array(
+            [np.nan if row[name] is None else row[name] for row in rows],
+            dtype=np.float64,
+        )
+    for name in CATEGORICAL_COLUMNS:
+        values = pd.Categorical([row[name] for row in rows])
+        categories[name] = list(values.categories)
+        sections[name] = values.codes.astype(np.int32)
+
+    header = {
+        "game_pk": game.game_pk,
+        "plays": len(raw_plays),
+        "events": len(rows),
+        "categories": categories,
+        "sections": {},
+    }
+    offset = 0
+    for name, array in sections.items():
+        header["sections"][name] = [offset, array.dtype.str, len(array)]
+        offset = align(offset + array.nbytes)
+    header_json = encode_json(header)
+
+    # Write to a temporary file first so readers never see partial snapshots
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(PREAMBLE.pack(MAGIC, len(header_json)))
+            f.write(header_json)
+            for array in sections.values():
+                f.write(b"\0" * (align(f.tell()) - f.tell()))
+                f.write(array.tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+class SnapshotPlays(Sequence):
+    """
+    Raw json of the plays of a snapshot, decoded on first access and then
+    kept. Stands in for the allPlays list of a raw game
+    """
+
+    def __init__(self, snapshot: GameSnapshot) -> None:
+        self.snapshot = snapshot
+        self.plays: list[dict[str, Any] | None] = [None] * len(snapshot)
+
+    def __len__(self) -> int:
+        return len(self.plays)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        play = self.plays[i]
+        if play is None:
+            play = self.plays[i] = self.snapshot.raw_play(i)
+        return play
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, SnapshotPlays)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __reduce__(self) -> tuple:
+        # Pickle as a plain list, the memory map cannot be sent
+        return list, (list(self),)
+
+    @property
+    def decoded(self) -> int:
+        """
+        :return: Number of plays decoded so far
+        """
+        return sum(play is not None for play in self.plays)
+
+
+class GameSnapshot:
+    """
+    A game snapshot written by write_snapshot, opened with mmap. Columns are
+    NumPy views of the file, so opening costs the same for any game size and
+    nothing is parsed until a Play or Game is requested
+
+    :param path: Snapshot file
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_length = PREAMBLE.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a game snapshot")
+        start = PREAMBLE.size
+        self.header = json.loads(self._mmap[start : start + header_length])
+        data_offset = align(start + header_length)
+        self.columns: dict[str, np.ndarray] = {
+            name: np.frombuffer(
+                self._mmap,
+                dtype=np.dtype(dtype),
+                count=count,
+                offset=data_offset + offset,
+            )
+            for name, (offset, dtype, count) in self.header[
+                "sections"
+            ].items()
+        }
+
+    def __enter__(self) -> GameSnapshot:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.columns = {}
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out still point into the map, it is closed once
+            # they are garbage collected
+            pass
+
+    def __len__(self) -> int:
+        return self.header["plays"]
+
+    @property
+    def game_pk(self) -> int:
+        return self.header["game_pk"]
+
+    @property
+    def play_ids(self) -> list[str]:
+        """
+        :return: list of play ids for this game, like Game.play_ids, None for events that are not pitches
+        """
+        return [
+            play_id.decode() if flags & SWING_ROW else None
+            for play_id, flags in zip(
+                self.columns["play_id"], self.columns["flags"]
+            )
+        ]
+
+    def play_events(self, i: int) -> slice:
+        """
+        :return: Rows of the play events of the i-th play
+        """
+        offsets = self.columns["play_event_offsets"]
+        return slice(int(offsets[i]), int(offsets[i + 1]))
+
+    def raw_play(self, i: int) -> dict[str, Any]:
+        """
+        :return: Raw json of the i-th play
+        """
+        offsets = self.columns["play_json_offsets"]
+        return loads(
+            self.columns["plays_json"][offsets[i] : offsets[i + 1]].tobytes()
+        )
+
+    def play(
+        self,
+        i: int,
+        lazy: bool = True,
+        numeric: Numeric = Numeric.DECIMAL,
+    ) -> Play:
+        """
+        :return: New Play for the i-th play, without building the rest of the game
+        """
+        return Play(
+            self.raw_play(i),
+            Metadata(keys=[ROOT_KEY])
+            .add_keys(["liveData", "plays", "allPlays"])
+            .add_key_i(i),
+            lazy=lazy,
+            numeric=numeric,
+        )
+
+    def iter_plays(self, **kwargs: Any) -> Iterator[Play]:
+        for i in range(len(self)):
+            yield self.play(i, **kwargs)
+
+    def raw_game(self) -> dict[str, Any]:
+        """
+        :return: Raw game json whose plays are decoded on first access
+        """
+        raw = loads(self.columns["game_json"].tobytes())
+        raw["liveData"]["plays"]["allPlays"] = SnapshotPlays(self)
+        return raw
+
+    def game(
+        self, lazy: bool = True, numeric: Numeric = Numeric.DECIMAL
+    ) -> Game:
+        """
+        :param lazy: Only decode and build plays when they are accessed
+        :param numeric: Type of decimal metrics
+        :return: The Game the snapshot was written from
+        """
+        return Game(
+            self.raw_game(),
+            Metadata(keys=[ROOT_KEY]),
+            lazy=lazy,
+            numeric=numeric,
+        )
+
+    def column(self, name: str) -> np.ndarray | pd.Categorical:
+        """
+        :return: Column of every play event, categorical for string columns
+        """
+        if name in CATEGORICAL_COLUMNS:
+            return pd.Categorical.from_codes(
+                self.columns[name], self.header["categories"][name]
+            )
+        return self.columns[name]
+
+    def table(self, names: tuple[str, ...], flag: int) -> pd.DataFrame:
+        rows = (self.columns["flags"] & flag).astype(bool)
+        index = pd.Index(
+            [play_id.decode() for play_id in self.columns["play_id"][rows]]
+        )
+        return pd.DataFrame(
+            {
+                name: self.column(name)[rows]
+                for name in (*names, *MATCH_UP_COLUMNS)
+            },
+            index=index,
+        )
+
+    def pitch_table(self) -> pd.DataFrame:
+        """
+        The named pitch metrics of Game.get_pitch_metrics_table, read from the columns without decoding any json
+
+        :result: DataFrame with plays and metrics
+        """
+        return self.table(PITCH_COLUMNS, PITCH_ROW)
+
+    def swing_table(self) -> pd.DataFrame:
+        """
+        The named swing metrics of Game.get_swing_metrics_table, read from the columns without decoding any json
+
+        :result: DataFrame with plays and metrics
+        """
+        return self.table(SWING_COLUMNS, SWING_ROW)
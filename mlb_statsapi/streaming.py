@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from pathlib import Path
+from typing import IO, Any, Generator, Iterator
+
+from . import utils as ut
+from .constants import ROOT_KEY, Numeric
+from .datatypes import Metadata, Play
+
+CHUNK_SIZE = 64 * 1024
+ALL_PLAYS_KEY = ".liveData.plays.allPlays"
+ALL_PLAYS_KEYS = ["liveData", "plays", "allPlays"]
+# currentPlay repeats the last play of allPlays
+STREAM_SKIPPED_KEYS = frozenset(
+    {*ut.BLACKLISTED_KEYS, ".liveData.plays.currentPlay"}
+)
+
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+# Matches the rest of a string after its opening quote
+STRING_REST_RE = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+# Strings and brackets, or the opening quote of an unterminated string
+TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]|"', re.DOTALL)
+
+
+class JsonStream:
+    """
+    Incremental reader of a JSON document from a binary file object. Values
+    are either decoded whole with read_value, skipped without decoding with
+    skip_value, or walked one key or element at a time
+    """
+
+    def __init__(self, f: IO[bytes], chunk_size: int = CHUNK_SIZE) -> None:
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+
+    def fill(self, size: int | None = None) -> bool:
+        """
+        Reads the next chunk, dropping everything before pos
+
+        :return: False if the document has been read completely
+        """
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        self.eof = not chunk
+        self.buffer = self.buffer[self.pos :] + self._decoder.decode(
+            chunk, final=self.eof
+        )
+        self.pos = 0
+        return not self.eof
+
+    def peek(self) -> str:
+        """
+        :return: Next character that is not whitespace, "" at the end
+        """
+        while True:
+            self.pos = WHITESPACE_RE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(
+                f"Expected {char!r} in JSON stream, got {self.peek()!r}"
+            )
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(
+                    self.buffer, self.pos
+                )
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # Numbers and literals could continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            # Read at least as much again so large values are decoded a
+            # logarithmic number of times
+            self.fill(max(self.chunk_size, len(self.buffer) - self.pos))
+
+    def skip_string(self) -> None:
+        self.expect('"')
+        while True:
+            match = STRING_REST_RE.match(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.end()
+                return
+            if not self.fill():
+                raise ValueError("Unterminated string in JSON stream")
+
+    def skip_value(self) -> None:
+        """
+        Moves past the next value, only looking at brackets and strings
+        """
+        if self.peek() not in "{[":
+            if self.peek() == '"':
+                self.skip_string()
+            else:
+                self.read_value()
+            return
+
+        depth = 0
+        while True:
+            for match in TOKEN_RE.finditer(self.buffer, self.pos):
+                token = match.group()
+                if token == '"':
+                    # String continues in the next chunk
+                    self.pos = match.start()
+                    break
+                if token in "{[":
+                    depth += 1
+                elif token in "]}":
+                    depth -= 1
+                    if depth == 0:
+                        self.pos = match.end()
+                        return
+            else:
+                self.pos = len(self.buffer)
+            if not self.fill():
+                raise ValueError("Unterminated value in JSON stream")
+
+    def next_separator(self, closing: str) -> bool:
+        """
+        :return: True if the container ended, False if another item follows
+        """
+        char = self.peek()
+        if char not in (closing, ","):
+            raise ValueError(
+                f"Expected {closing!r} or ',' in JSON stream, got {char!r}"
+            )
+        self.pos += 1
+        return char == closing
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yields the keys of the next object. Each value must be read or skipped
+        before the next key is requested
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise ValueError("Expected a key in JSON stream")
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.next_separator("}"):
+                return
+
+    def iter_array(self) -> Iterator[int]:
+        """
+        Yields the indices of the next array. Each element must be read or
+        skipped before the next index is requested
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        i = 0
+        while True:
+            yield i
+            i += 1
+            if self.next_separator("]"):
+                return
+
+
+class GameStream:
+    """
+    Parses a game feed incrementally, yielding each Play as soon as it has
+    been read. Only one raw play is in memory at a time, the subtrees in
+    skip_keys are never decoded and the rest of the feed is kept in raw.
+    Keys of skip_keys use the same format as utils.BLACKLISTED_KEYS
+
+    :param f: Binary file object with the game feed json, closed once read
+    :param extra_fields: Extra fields given to every Play, like GameRequest.decorators
+    :param lazy: Create lazy plays
+    :param numeric: Type of decimal metrics
+    :param skip_keys: Subtrees that are left out of raw
+    """
+
+    def __init__(
+        self,
+        f: IO[bytes],
+        extra_fields: dict[str, Any] | None = None,
+        lazy: bool = False,
+        skip_keys: frozenset[str] = STREAM_SKIPPED_KEYS,
+        numeric: Numeric = Numeric.DECIMAL,
+    ) -> None:
+        self.f = f
+        self.extra_fields = extra_fields or {}
+        self.lazy = lazy
+        self.numeric = numeric
+        self.skip_keys = skip_keys
+        # Objects that contain a skipped key or allPlays
+        self.walked_keys = {
+            key[: i]
+            for key in {*skip_keys, ALL_PLAYS_KEY}
+            for i in range(len(key))
+            if key[i] == "."
+        }
+        # Feed without its plays, set once all plays have been read
+        self.raw: dict[str, Any] | None = None
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs: Any) -> "GameStream":
+        return cls(open(path, "rb"), **kwargs)
+
+    @property
+    def game_pk(self) -> int | None:
+        return None if self.raw is None else self.raw.get("gamePk")
+
+    def __iter__(self) -> Iterator[Play]:
+        try:
+            self.raw = yield from self.walk(JsonStream(self.f), ROOT_KEY)
+        finally:
+            self.close()
+
+    def walk(self, stream: JsonStream, key: str) -> Generator[Play, None, Any]:
+        if key == ALL_PLAYS_KEY:
+            for i in stream.iter_array():
+                yield self.build_play(stream.read_value(), i)
+            return []
+
+        if key not in self.walked_keys or stream.peek() != "{":
+            return stream.read_value()
+
+        value = {}
+        for k in stream.iter_object():
+            next_key = f"{key}.{k}"
+            if next_key in self.skip_keys:
+                stream.skip_value()
+                continue
+            value[k] = yield from self.walk(stream, next_key)
+        return value
+
+    def build_play(self, raw_play: dict[str, Any], i: int) -> Play:
+        """
+        :return: Same Play as Game.build_play
+        """
+        return Play(
+            raw_play,
+            Metadata(keys=[ROOT_KEY]).add_keys(ALL_PLAYS_KEYS).add_key_i(i),
+            self.extra_fields,
+            lazy=self.lazy,
+            numeric=self.numeric,
+        )
+
+    def close(self) -> None:
+        self.f.close()
+
+    def __enter__(self) -> "GameStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
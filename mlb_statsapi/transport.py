@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import IO, Any, Mapping
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import aiohttp
+except ImportError:  # Only needed for AiohttpTransport
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # Only needed for faster decoding
+    orjson = None
+
+DEFAULT_RETRIES = Retry(
+    total=3, backoff_factor=2, status_forcelist=[502, 503, 504]
+)
+# Seconds to wait for a connection and then for the response
+DEFAULT_TIMEOUT = (10.0, 60.0)
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONCURRENCY = 10
+
+
+def loads(content: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Decodes json with orjson if it is installed, else with the json module.
+    orjson builds the same dicts and lists in one pass in C, several times faster on game feeds
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    return json.loads(content)
+
+
+@dataclass
+class Response:
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        return loads(self.content)
+
+
+def rewrite_uri(uri: str, host_overrides: Mapping[str, str]) -> str:
+    """
+    Replaces the origin of uri if it is in host_overrides
+    """
+    for origin, replacement in host_overrides.items():
+        if uri.startswith(origin):
+            return f"{replacement}{uri[len(origin):]}"
+    return uri
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests made by BaseRequest. Subclass to change where and how responses are fetched
+    """
+
+    @abstractmethod
+    def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        pass
+
+    def stream(
+        self, method: str, uri: str, data: str | None = None
+    ) -> IO[bytes]:
+        """
+        Sends a request and returns its body as a binary file object, to read incrementally.
+        This default reads the whole body first, subclasses can stream it from the connection
+
+        :raise requests.HTTPError: If the response is not successful
+        """
+        response = self.request(method, uri, data)
+        if response.status_code >= 400:
+            raise requests.HTTPError(
+                f"{response.status_code} response for {uri}"
+            )
+        return io.BytesIO(response.content)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by one pooled requests.Session, so connections to each host are reused across requests
+
+    :param pool_size: Connections kept open per host
+    :param pool_hosts: Number of hosts to keep connection pools for
+    :param timeout: Connect and read timeout in seconds
+    :param retries: Retry policy for failed requests
+    :param host_limits: Maximum concurrent connections for specific origins, e.g. {"https://statsapi.mlb.com": 4}
+    :param host_overrides: Replace the origin of request URIs, e.g. to point at a local server
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_hosts: int = DEFAULT_POOL_SIZE,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: Retry = DEFAULT_RETRIES,
+        host_limits: Mapping[str, int] | None = None,
+        host_overrides: Mapping[str, str] | None = None,
+    ) -> None:
+        self.pool_size = pool_size
+        self.pool_hosts = pool_hosts
+        self.timeout = timeout
+        self.retries = retries
+        self.host_limits = dict(host_limits or {})
+        self.host_overrides = dict(host_overrides or {})
+        self._session = self.create_session()
+
+    def create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_hosts,
+            pool_maxsize=self.pool_size,
+            max_retries=self.retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # Blocking pools never open more than their size at once
+        for origin, limit in self.host_limits.items():
+            session.mount(
+                self.rewrite_uri(origin),
+                HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=limit,
+                    max_retries=self.retries,
+                    pool_block=True,
+                ),
+            )
+        return session
+
+    def rewrite_uri(self, uri: str) -> str:
+        return rewrite_uri(uri, self.host_overrides)
+
+    def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        response = self._session.request(
+            method, self.rewrite_uri(uri), data=data, timeout=self.timeout
+        )
+        return Response(
+            response.status_code, response.content, response.headers
+        )
+
+    def stream(
+        self, method: str, uri: str, data: str | None = None
+    ) -> IO[bytes]:
+        response = self._session.request(
+            method,
+            self.rewrite_uri(uri),
+            data=data,
+            timeout=self.timeout,
+            stream=True,
+        )
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        # Undo any gzip encoding while reading, the connection goes back to
+        # the pool once the body has been read
+        response.raw.decode_content = True
+        return response.raw
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_default_transport: Transport | None = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    :return: Transport shared by every request that is not given one
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = RequestsTransport()
+        return _default_transport
+
+
+def set_default_transport(transport: Transport | None) -> Transport | None:
+    """
+    Replace the shared transport. Pass None to go back to a new RequestsTransport. Returns the previous transport
+    """
+    global _default_transport
+    with _default_transport_lock:
+        previous = _default_transport
+        _default_transport = transport
+        return previous
+
+
+class AsyncTransport(ABC):
+    """
+    Sends the HTTP requests made by BaseRequest.make_request_async
+    """
+
+    @abstractmethod
+    async def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+class ThreadedAsyncTransport(AsyncTransport):
+    """
+    Runs a blocking Transport in worker threads, for when aiohttp is not installed
+
+    :param transport: Transport run in threads, the shared default if None
+    :param owns_transport: Close the transport when this transport is closed
+    """
+
+    def __init__(
+        self, transport: Transport | None = None, owns_transport: bool = False
+    ) -> None:
+        self.transport = transport or get_default_transport()
+        self.owns_transport = owns_transport
+
+    async def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        return await asyncio.to_thread(
+            self.transport.request, method, uri, data
+        )
+
+    async def close(self) -> None:
+        if self.owns_transport:
+            await asyncio.to_thread(self.transport.close)
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Transport backed by one aiohttp session. Requires the async extra (aiohttp)
+
+    :param concurrency: Maximum open connections across all hosts
+    :param limit_per_host: Maximum open connections to a single host
+    :param timeout: Total timeout of a request in seconds
+    :param retries: Retry policy, only total, backoff_factor and status_forcelist are used
+    :param host_overrides: Replace the origin of request URIs, e.g. to point at a local server
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        limit_per_host: int = 0,
+        timeout: float = sum(DEFAULT_TIMEOUT),
+        retries: Retry = DEFAULT_RETRIES,
+        host_overrides: Mapping[str, str] | None = None,
+    ) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "AiohttpTransport requires aiohttp, "
+                "install mlb-statsapi[async]"
+            )
+        self.concurrency = concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.host_overrides = dict(host_overrides or {})
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Created on first use so that it belongs to the running event loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.concurrency, limit_per_host=self.limit_per_host
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def backoff(self, attempt: int) -> float:
+        backoff_max = getattr(
+            self.retries, "backoff_max", Retry.DEFAULT_BACKOFF_MAX
+        )
+        return min(self.retries.backoff_factor * 2**attempt, backoff_max)
+
+    async def request(
+        self, method: str, uri: str, data: str | None = None
+    ) -> Response:
+        uri = rewrite_uri(uri, self.host_overrides)
+        total = self.retries.total or 0
+        for attempt in range(total + 1):
+            try:
+                async with self.session.request(
+                    method, uri, data=data
+                ) as response:
+                    content = await response.read()
+                if (
+                    response.status
+                    not in (self.retries.status_forcelist or ())
+                    or attempt == total
+                ):
+                    return Response(
+                        response.status, content, dict(response.headers)
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == total:
+                    raise
+            await asyncio.sleep(self.backoff(attempt))
+        raise RuntimeError("Unreachable")
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def create_async_transport(
+    host_overrides: Mapping[str, str] | None = None,
+) -> AsyncTransport:
+    """
+    :return: AiohttpTransport if aiohttp is installed, otherwise the default transport run in threads, or a new RequestsTransport with host_overrides
+    """
+    if aiohttp is not None:
+        return AiohttpTransport(host_overrides=host_overrides)
+    if host_overrides:
+        return ThreadedAsyncTransport(
+            RequestsTransport(host_overrides=host_overrides),
+            owns_transport=True,
+        )
+    return ThreadedAsyncTransport()
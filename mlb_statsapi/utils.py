@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import copy
 import re
-from typing import Any
+from functools import lru_cache
+from types import EllipsisType
+from typing import Any, Union
 
 
 def explore_object(data: Any, path: str, print_val: bool = False) -> set[Any]:
@@ -45,6 +48,116 @@ def explore_object(data: Any, path: str, print_val: bool = False) -> set[Any]:
         raise RuntimeError(f"Unable to parse path {path}")
 
 
+# A compiled path step is a dict key, a list index or ... for all elements
+PathStep = Union[str, int, EllipsisType]
+COMPILED_PATH_CACHE_SIZE = 4096
+INDEX_STEP_RE = re.compile(r"\[([0-9]*)\]")
+
+
+@lru_cache(maxsize=COMPILED_PATH_CACHE_SIZE)
+def compile_path(path: str) -> tuple[PathStep, ...]:
+    """
+    Parses a path in the format used by explore_object, e.g. .a.[].b.[0].c,
+    into a tuple of steps
+    """
+    if path == "":
+        return ()
+    if path[0] != ".":
+        raise RuntimeError(f"Unable to parse path {path}")
+
+    steps: list[PathStep] = []
+    for part in path[1:].split("."):
+        match = INDEX_STEP_RE.fullmatch(part)
+        if match is None:
+            steps.append(part)
+        elif match.group(1):
+            steps.append(int(match.group(1)))
+        else:
+            steps.append(...)
+    return tuple(steps)
+
+
+def terminal_values(data: Any) -> set[Any]:
+    if type(data) == list:
+        return {"LIST"}
+    elif type(data) == dict:
+        return set(data.keys())
+    else:
+        return {data}
+
+
+def evaluate_path(data: Any, steps: tuple[PathStep, ...]) -> set[Any]:
+    """
+    Same result as explore_object for a path compiled with compile_path
+    """
+    res: set[Any] = set()
+    values = [data]
+    for step in steps:
+        next_values = []
+        for value in values:
+            if step is ...:
+                assert (
+                    type(value) == list
+                ), f"Unexpected type on path {steps} of {type(value)}"
+                next_values.extend(value)
+            elif type(step) == int:
+                assert (
+                    type(value) == list
+                ), f"Unexpected type on path {steps} of {type(value)}"
+                next_values.append(value[step])
+            else:
+                assert (
+                    type(value) == dict
+                ), f"Unexpected type on path {steps} of {type(value)}"
+                if step in value:
+                    next_values.append(value[step])
+                else:
+                    res.add(None)
+        values = next_values
+
+    for value in values:
+        res |= terminal_values(value)
+    return res
+
+
+def compiled_path_value(data: Any, steps: tuple[PathStep, ...]) -> Any:
+    """
+    Returns the single value at a compiled path, None if a key is missing
+    """
+    if ... in steps:
+        v = evaluate_path(data, steps)
+        assert len(v) == 1
+        return [*v][0]
+
+    for step in steps:
+        if type(step) == int:
+            assert (
+                type(data) == list
+            ), f"Unexpected type on path {steps} of {type(data)}"
+        else:
+            assert (
+                type(data) == dict
+            ), f"Unexpected type on path {steps} of {type(data)}"
+            if step not in data:
+                return None
+        data = data[step]
+
+    if type(data) == list:
+        return "LIST"
+    elif type(data) == dict:
+        assert len(data) == 1
+        return [*data][0]
+    return data
+
+
+def get_path_value(data: Any, path: str) -> Any:
+    """
+    Returns the single value at a path, equivalent to the only element of
+    explore_object(data, path)
+    """
+    return compiled_path_value(data, compile_path(path))
+
+
 BLACKLISTED_KEYS = {
     ".gameData.players",
     ".liveData.boxscore.teams.away.players",
@@ -111,3 +224,114 @@ def all_attributes(attributes: Any) -> set[str]:
                 res.add(k)
             res |= all_attributes(v)
         return res
+
+
+def terminal_paths(data: Any, key: str = "") -> set[str]:
+    """
+    Same paths as all_attributes(list_attributes(data)), except that every
+    element of a list is looked at instead of only the first one
+    """
+    res: set[str] = set()
+    add_terminal_paths(data, key, res)
+    return res
+
+
+def add_terminal_paths(data: Any, key: str, res: set[str]) -> None:
+    """
+    Adds the terminal_paths of data to res, without building a set per level
+    """
+    if type(data) == dict:
+        for k, v in data.items():
+            next_key = f"{key}.{k}"
+            if next_key in BLACKLISTED_KEYS:
+                res.add(next_key)
+                continue
+            if type(v) == dict:
+                add_terminal_paths(v, next_key, res)
+                continue
+            res.add(next_key)
+            if type(v) == list:
+                add_terminal_paths(v, next_key, res)
+    elif type(data) == list:
+        next_key = f"{key}.[]"
+        for elt in data:
+            add_terminal_paths(elt, next_key, res)
+
+
+def parse_json_pointer(pointer: str) -> list[str]:
+    """
+    Splits an RFC 6901 JSON pointer, e.g. /liveData/plays, into its keys
+    """
+    if pointer == "":
+        return []
+    if pointer[0] != "/":
+        raise ValueError(f"Invalid JSON pointer {pointer}")
+    return [
+        part.replace("~1", "/").replace("~0", "~")
+        for part in pointer[1:].split("/")
+    ]
+
+
+def resolve_json_pointer(data: Any, parts: list[str]) -> Any:
+    for part in parts:
+        data = data[int(part)] if type(data) == list else data[part]
+    return data
+
+
+def apply_json_patch(data: Any, operations: list[dict[str, Any]]) -> Any:
+    """
+    Applies RFC 6902 JSON patch operations to data in place
+
+    :return: The patched document, which is a new object if the root was replaced
+    """
+    for operation in operations:
+        op = operation["op"]
+        parts = parse_json_pointer(operation["path"])
+
+        if op == "test":
+            if resolve_json_pointer(data, parts) != operation["value"]:
+                raise ValueError(f"JSON patch test failed: {operation}")
+            continue
+
+        if op in ("move", "copy"):
+            from_parts = parse_json_pointer(operation["from"])
+            value = resolve_json_pointer(data, from_parts)
+            if op == "move":
+                data = apply_json_patch(
+                    data, [{"op": "remove", "path": operation["from"]}]
+                )
+            else:
+                value = copy.deepcopy(value)
+            op = "add"
+        else:
+            value = operation.get("value")
+
+        if not parts:
+            if op == "remove":
+                raise ValueError("Cannot remove the document root")
+            data = value
+            continue
+
+        parent = resolve_json_pointer(data, parts[:-1])
+        key = parts[-1]
+        if type(parent) == list:
+            if op == "add" and key == "-":
+                parent.append(value)
+            elif op == "add":
+                parent.insert(int(key), value)
+            elif op == "replace":
+                parent[int(key)] = value
+            elif op == "remove":
+                del parent[int(key)]
+            else:
+                raise ValueError(f"Unknown JSON patch operation {op}")
+        else:
+            if op in ("add", "replace"):
+                if op == "replace" and key not in parent:
+                    raise KeyError(key)
+                parent[key] = value
+            elif op == "remove":
+                del parent[key]
+            else:
+                raise ValueError(f"Unknown JSON patch operation {op}")
+    return data
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable
+
+import requests
+
+from . import instrumentation
+from .cache import ResponseCache
+from .constants import ROOT_KEY
+from .datatypes import Metadata, PlayVideos
+from .request_datatypes import PlayVideoRequest
+from .transport import (DEFAULT_CONCURRENCY, Response, Transport,
+                        get_default_transport)
+
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_PAGE_SIZE = 1000
+# Only the fields PlayVideo reads
+SEARCH_FIELDS = "plays { mediaPlayback { id slug } } total"
+SEARCH_QUERY = "gamePk = {game_pk} Order By Timestamp ASC"
+
+
+def play_videos_from_slugs(slugs: dict[str, str]) -> PlayVideos:
+    """
+    :param slugs: Map of play id to video slug
+    :return: PlayVideos as parsed from a search response with these videos
+    """
+    plays = [
+        {"mediaPlayback": [{"id": play_id, "slug": slug}]}
+        for play_id, slug in slugs.items()
+    ]
+    raw = {"data": {"search": {"plays": plays, "total": len(plays)}}}
+    return PlayVideos(raw, Metadata(keys=[ROOT_KEY]))
+
+
+def plays_slugs(plays: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    :return: Map of play id to slug of the first playback of each play, like PlayVideo
+    """
+    return {
+        play["mediaPlayback"][0]["id"]: play["mediaPlayback"][0]["slug"]
+        for play in plays
+        if play.get("mediaPlayback")
+    }
+
+
+class VideoResolver:
+    """
+    Resolves the videos of many games at once. Searches of several games are
+    sent as one GraphQL query with an aliased search for each game, batches
+    are sent concurrently and games with more videos than page_size are
+    fetched page by page. The play id to slug map of every game is kept in
+    cache, if given, so later runs do not need the network
+
+    :param transport: Transport used to send the queries, the shared default if None
+    :param cache: Cache of the play id to slug map of each game, not used if None
+    :param batch_size: Searches per query
+    :param concurrency: Queries sent at the same time
+    :param page_size: Videos per search
+    :param ttl: Seconds a cached game stays fresh, None to never expire
+    """
+
+    URI = PlayVideoRequest.BASE_URI
+
+    def __init__(
+        self,
+        transport: Transport | None = None,
+        cache: ResponseCache | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        ttl: float | None = PlayVideoRequest.CACHE_TTL,
+    ) -> None:
+        self.transport = transport
+        self.cache = cache
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.ttl = ttl
+
+    def get_transport(self) -> Transport:
+        return self.transport or get_default_transport()
+
+    def cache_key(self, game_pk: int | str) -> str:
+        return ResponseCache.key("SLUGS", self.URI, str(game_pk))
+
+    def cached_slugs(self, game_pk: int | str) -> dict[str, str] | None:
+        if self.cache is None:
+            return None
+        response = self.cache.get(self.cache_key(game_pk))
+        if response is None:
+            return None
+        instrumentation.count(
+            "request.cache_hits", request=type(self).__name__
+        )
+        return response.json()
+
+    def cache_slugs(self, game_pk: int | str, slugs: dict[str, str]) -> None:
+        if self.cache is None:
+            return
+        self.cache.put(
+            self.cache_key(game_pk),
+            Response(200, json.dumps(slugs).encode()),
+            self.ttl,
+        )
+
+    def query(self, searches: list[tuple[int | str, int]]) -> str:
+        """
+        :param searches: Game pk and page of each search
+        :return: GraphQL query with the search of index i aliased as s{i}
+        """
+        aliased = " ".join(
+            f's{i}: search(query: "{SEARCH_QUERY.format(game_pk=game_pk)}", '
+            f"limit: {self.page_size}, page: {page}) {{ {SEARCH_FIELDS} }}"
+            for i, (game_pk, page) in enumerate(searches)
+        )
+        return f"query {{ {aliased} }}"
+
+    def fetch(
+        self, searches: list[tuple[int | str, int]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Sends one query for searches
+
+        :return: Result of each search, None if the game is unknown
+        :raise requests.HTTPError: If the response is not successful
+        """
+        with instrumentation.timed(
+            "request.network", request=type(self).__name__
+        ):
+            response = self.get_transport().request(
+                "POST",
+                self.URI,
+                data=json.dumps({"query": self.query(searches)}),
+            )
+        if response.status_code >= 400:
+            raise requests.HTTPError(
+                f"{response.status_code} response for {self.URI}"
+            )
+        data = response.json().get("data") or {}
+        return [data.get(f"s{i}") for i in range(len(searches))]
+
+    def search(
+        self, searches: list[tuple[int | str, int]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Sends searches in batches of batch_size, concurrency at a time
+
+        :return: Result of each search, in order
+        """
+        batches = [
+            searches[i : i + self.batch_size]
+            for i in range(0, len(searches), self.batch_size)
+        ]
+        if len(batches) <= 1:
+            return [r for batch in batches for r in self.fetch(batch)]
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            return [
+                result
+                for results in executor.map(self.fetch, batches)
+                for result in results
+            ]
+
+    def fetch_slugs(
+        self, game_pks: list[int | str]
+    ) -> dict[int | str, dict[str, str] | None]:
+        """
+        :return: Map of game pk to its play id to slug map, None for unknown games
+        """
+        first_pages = self.search([(game_pk, 0) for game_pk in game_pks])
+        plays = {
+            game_pk: None if result is None else list(result["plays"])
+            for game_pk, result in zip(game_pks, first_pages)
+        }
+        remaining = [
+            (game_pk, page)
+            for game_pk, result in zip(game_pks, first_pages)
+            if result is not None
+            for page in range(
+                1, math.ceil((result.get("total") or 0) / self.page_size)
+            )
+        ]
+        for (game_pk, _), result in zip(remaining, self.search(remaining)):
+            if result is not None:
+                plays[game_pk].extend(result["plays"])
+        return {
+            game_pk: None if game_plays is None else plays_slugs(game_plays)
+            for game_pk, game_plays in plays.items()
+        }
+
+    def resolve_slugs(
+        self, game_pks: Iterable[int | str]
+    ) -> dict[int | str, dict[str, str]]:
+        """
+        :return: Map of game pk to its play id to slug map, from the cache where fresh
+        """
+        game_pks = list(dict.fromkeys(game_pks))
+        slugs = {}
+        missing = []
+        for game_pk in game_pks:
+            cached = self.cached_slugs(game_pk)
+            if cached is None:
+                missing.append(game_pk)
+            else:
+                slugs[game_pk] = cached
+        if missing:
+            for game_pk, fetched in self.fetch_slugs(missing).items():
+                if fetched is None:
+                    # Not cached, the game may not have started yet
+                    slugs[game_pk] = {}
+                    continue
+                slugs[game_pk] = fetched
+                self.cache_slugs(game_pk, fetched)
+        return {game_pk: slugs[game_pk] for game_pk in game_pks}
+
+    def resolve(
+        self, game_pks: Iterable[int | str]
+    ) -> dict[int | str, PlayVideos]:
+        """
+        Videos of every game, to decorate games with through GameRequest(game_pk, play_videos=...)
+
+        :param game_pks: Games to resolve
+        :return: Map of game pk to its PlayVideos
+        """
+        return {
+            game_pk: play_videos_from_slugs(slugs)
+            for game_pk, slugs in self.resolve_slugs(game_pks).items()
+        }
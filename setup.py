@@ -17,6 +17,12 @@ setup(
     author_email='',
     description="Wrapper to access stats API data from MLB",
     classifiers=[],
+    python_requires='>=3.10',
     install_requires=get_requirements(),
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+        "parquet": ["pyarrow"],
+    },
     entry_points={}
 )
\ No newline at end of file
@@ -0,0 +1,18 @@
+import pytest
+
+from mlb_statsapi.transport import RequestsTransport
+from stub_server import StubServer
+
+
+@pytest.fixture
+def stub_server():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def stub_transport(stub_server):
+    with RequestsTransport(
+        host_overrides=stub_server.host_overrides
+    ) as transport:
+        yield transport
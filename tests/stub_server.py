@@ -0,0 +1,417 @@
+"""
+Local stand-in for statsapi.mlb.com and fastball-gateway.mlb.com that serves
+the fixture games, for tests and benchmarks
+"""
+from __future__ import annotations
+
+import copy
+import json
+import math
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+GAME_DATA = Path(__file__).parent / "game_data"
+GAME_FEED_RE = re.compile(r"^/api/v1\.1/game/(\d+)/feed/live$")
+DIFF_PATCH_RE = re.compile(
+    r"^/api/v1\.1/game/(\d+)/feed/live/diffPatch\?startTimecode=(\w+)$"
+)
+SCHEDULE_PATH = "/api/v1/schedule"
+VIDEO_QUERY_RE = re.compile(r"gamePk = (\d+)")
+# A search of a batched query, aliased for each game and page
+VIDEO_ALIAS_RE = re.compile(
+    r'(\w+): search\(query: "gamePk = (\d+)[^"]*", limit: (\d+), '
+    r"page: (\d+)"
+)
+
+STATS_API_ORIGIN = "https://statsapi.mlb.com"
+GRAPHQL_ORIGIN = "https://fastball-gateway.mlb.com"
+
+
+def video_plays(feed: dict) -> list[dict]:
+    """
+    GraphQL search results of the feed, one video per pitch
+    """
+    return [
+        {"mediaPlayback": [{"id": play_id, "slug": f"slug-{play_id}"}]}
+        for play in feed["liveData"]["plays"]["allPlays"]
+        for play_event in play["playEvents"]
+        if (play_id := play_event.get("playId"))
+    ]
+
+
+def schedule_entry(
+    game_pk: int,
+    official_date: str,
+    abstract_state: str = "Final",
+    detailed_state: str = "Final",
+    game_type: str = "R",
+) -> dict:
+    """
+    Game of a schedule response, with the fields the client reads
+    """
+    return {
+        "gamePk": game_pk,
+        "gameType": game_type,
+        "season": official_date[:4],
+        "officialDate": official_date,
+        "status": {
+            "abstractGameState": abstract_state,
+            "detailedState": detailed_state,
+        },
+    }
+
+
+def feed_schedule_entry(feed: dict) -> dict:
+    game_data = feed["gameData"]
+    return schedule_entry(
+        feed["gamePk"],
+        game_data["datetime"]["officialDate"],
+        game_data["status"]["abstractGameState"],
+        game_data["status"]["detailedState"],
+        game_data["game"]["type"],
+    )
+
+
+def escape_pointer(key: str | int) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """
+    JSON patch operations that turn old into new. Lists are diffed element by
+    element, with trailing elements added or removed
+    """
+    if type(old) != type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if type(old) == dict:
+        operations = []
+        for k in old.keys() - new.keys():
+            operations.append(
+                {"op": "remove", "path": f"{path}/{escape_pointer(k)}"}
+            )
+        for k, v in new.items():
+            key_path = f"{path}/{escape_pointer(k)}"
+            if k not in old:
+                operations.append({"op": "add", "path": key_path, "value": v})
+            else:
+                operations.extend(json_diff(old[k], v, key_path))
+        return operations
+
+    if type(old) == list:
+        operations = []
+        for i in range(min(len(old), len(new))):
+            operations.extend(json_diff(old[i], new[i], f"{path}/{i}"))
+        for i in range(len(old), len(new)):
+            operations.append(
+                {"op": "add", "path": f"{path}/{i}", "value": new[i]}
+            )
+        for i in reversed(range(len(new), len(old))):
+            operations.append({"op": "remove", "path": f"{path}/{i}"})
+        return operations
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def live_snapshots(feed: dict, steps: int) -> list[dict]:
+    """
+    Splits a final game feed into steps feeds of the game in progress, cut
+    part way through plays, followed by the final feed itself. The last event
+    of an unfinished play has no endTime or hitData yet, as happens while the
+    ball is in play
+    """
+    all_plays = feed["liveData"]["plays"]["allPlays"]
+    events = [
+        (i, j)
+        for i, play in enumerate(all_plays)
+        for j in range(len(play["playEvents"]))
+    ]
+    timestamp = int(feed["metaData"]["timeStamp"].replace("_", ""))
+
+    snapshots = []
+    for step in range(steps):
+        i, j = events[len(events) * (step + 1) // (steps + 1)]
+        snapshot = copy.deepcopy(feed)
+        snapshot["metaData"]["timeStamp"] = str(timestamp - steps + step)
+        snapshot["gameData"]["status"]["abstractGameState"] = "Live"
+        plays = snapshot["liveData"]["plays"]["allPlays"][: i + 1]
+        plays[i]["playEvents"] = plays[i]["playEvents"][: j + 1]
+        for key in ("endTime", "hitData"):
+            plays[i]["playEvents"][j].pop(key, None)
+        snapshot["liveData"]["plays"]["allPlays"] = plays
+        snapshots.append(snapshot)
+    snapshots.append(feed)
+    return snapshots
+
+
+class LiveReplay:
+    """
+    Replays a game through its snapshots, advancing one snapshot per diffPatch
+    request
+    """
+
+    def __init__(self, feed: dict, steps: int) -> None:
+        self.snapshots = live_snapshots(feed, steps)
+        self.step = 0
+
+    @property
+    def feed(self) -> dict:
+        return self.snapshots[self.step]
+
+    def diff_patch(self, start_timecode: str) -> Any:
+        for step, snapshot in enumerate(self.snapshots):
+            if snapshot["metaData"]["timeStamp"] == start_timecode:
+                break
+        else:
+            # Unknown timecodes get the full feed, as the API does
+            return self.feed
+
+        self.step = min(step + 1, len(self.snapshots) - 1)
+        if self.step == step:
+            return []
+        return [{"diff": json_diff(snapshot, self.feed)}]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "StubServer"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def send_body(
+        self, status: int, body: bytes, headers: dict[str, str] | None = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def admit(self) -> bool:
+        """
+        :return: False if the request was answered with a failure instead
+        """
+        if not self.server.record(self):
+            self.send_body(503, b'{"message": "Unavailable"}')
+            return False
+        retry_after = self.server.throttle()
+        if retry_after is not None:
+            self.send_body(
+                429,
+                b'{"message": "Too many requests"}',
+                {"Retry-After": str(math.ceil(retry_after))},
+            )
+            return False
+        return True
+
+    def do_GET(self) -> None:
+        if not self.admit():
+            return
+        match = DIFF_PATCH_RE.match(self.path)
+        if match is not None and match.group(1) in self.server.live:
+            replay = self.server.live[match.group(1)]
+            body = replay.diff_patch(match.group(2))
+            self.send_body(200, json.dumps(body).encode())
+            return
+        url = urlsplit(self.path)
+        if url.path == SCHEDULE_PATH:
+            body = self.server.schedule_response(parse_qs(url.query))
+            self.send_body(200, json.dumps(body).encode())
+            return
+        match = GAME_FEED_RE.match(self.path)
+        if match is not None and match.group(1) in self.server.live:
+            replay = self.server.live[match.group(1)]
+            self.send_body(200, json.dumps(replay.feed).encode())
+            return
+        if match is None or match.group(1) not in self.server.feeds:
+            self.send_body(404, b'{"message": "Not found"}')
+            return
+        self.send_body(200, self.server.feeds[match.group(1)])
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.admit():
+            return
+        if self.path != "/graphql":
+            self.send_body(404, b'{"message": "Not found"}')
+            return
+        payload = json.loads(body)
+        aliases = VIDEO_ALIAS_RE.findall(payload["query"])
+        if aliases:
+            data = {
+                alias: self.server.search(game_pk, int(limit), int(page))
+                for alias, game_pk, limit, page in aliases
+            }
+        else:
+            variables = payload["variables"]
+            match = VIDEO_QUERY_RE.search(variables["query"])
+            if match is None or match.group(1) not in self.server.videos:
+                self.send_body(200, b'{"data": null}')
+                return
+            data = {
+                "search": self.server.search(
+                    match.group(1), variables["limit"], variables["page"]
+                )
+            }
+        self.send_body(200, json.dumps({"data": data}).encode())
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Serves GET /api/v1.1/game/{game_pk}/feed/live and POST /graphql on a free
+    local port. Use host_overrides with RequestsTransport to point requests at
+    it. Games passed to replay_live are served in progress, with diffPatch
+
+    :param latency: Seconds to sleep before answering each request
+    :param failures: Number of requests to answer with a 503 before serving normally
+    :param rate_limit: Requests per second answered before sending 429 with Retry-After
+    :param burst: Requests answered at once before the rate limit applies
+    """
+
+    # Accept many clients connecting at once
+    request_queue_size = 128
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        game_data: Path = GAME_DATA,
+        latency: float = 0.0,
+        failures: int = 0,
+        rate_limit: float | None = None,
+        burst: int = 1,
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.latency = latency
+        self.failures = failures
+        # Requests per second answered before sending 429, None for no limit
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._tokens_at = time.monotonic()
+        self.hits: Counter[str] = Counter()
+        self.connections: set[tuple[str, int]] = set()
+        self.feeds = {
+            path.stem: path.read_bytes()
+            for path in sorted(Path(game_data).glob("*.json"))
+        }
+        self.live: dict[str, LiveReplay] = {}
+        self.videos = {
+            game_pk: video_plays(json.loads(feed))
+            for game_pk, feed in self.feeds.items()
+        }
+        # Games served by the schedule endpoint, add entries to test filters
+        self.schedule = [
+            feed_schedule_entry(json.loads(feed))
+            for feed in self.feeds.values()
+        ]
+        # Game and page searches answered, more than one per batched request
+        self.video_queries = 0
+        self._thread = threading.Thread(
+            target=self.serve_forever, args=(0.05,), daemon=True
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def host_overrides(self) -> dict[str, str]:
+        return {STATS_API_ORIGIN: self.url, GRAPHQL_ORIGIN: self.url}
+
+    @property
+    def game_pks(self) -> list[int]:
+        return [int(game_pk) for game_pk in self.feeds]
+
+    def schedule_response(self, query: dict[str, list[str]]) -> dict:
+        """
+        Schedule games matching the season, date range and game types of query, grouped by date
+        """
+        games = self.schedule
+        if "season" in query:
+            games = [g for g in games if g["season"] == query["season"][0]]
+        if "startDate" in query:
+            start, end = query["startDate"][0], query["endDate"][0]
+            games = [g for g in games if start <= g["officialDate"] <= end]
+        if "gameType" in query:
+            game_types = query["gameType"][0].split(",")
+            games = [g for g in games if g["gameType"] in game_types]
+        dates: dict[str, list[dict]] = {}
+        for game in sorted(games, key=lambda g: g["officialDate"]):
+            dates.setdefault(game["officialDate"], []).append(game)
+        return {
+            "totalGames": len(games),
+            "dates": [
+                {"date": date, "games": date_games}
+                for date, date_games in dates.items()
+            ],
+        }
+
+    def search(self, game_pk: str, limit: int, page: int) -> dict:
+        with self._lock:
+            self.video_queries += 1
+        plays = self.videos.get(game_pk, [])
+        return {
+            "plays": plays[page * limit : (page + 1) * limit],
+            "total": len(plays),
+        }
+
+    def replay_live(self, game_pk: int, steps: int) -> LiveReplay:
+        replay = LiveReplay(json.loads(self.feeds[str(game_pk)]), steps)
+        self.live[str(game_pk)] = replay
+        return replay
+
+    def record(self, handler: StubHandler) -> bool:
+        """
+        :return: False if the request should fail
+        """
+        with self._lock:
+            self.hits[f"{handler.command} {handler.path}"] += 1
+            self.connections.add(handler.client_address)
+            fail = self.failures > 0
+            self.failures -= fail
+        if self.latency:
+            time.sleep(self.latency)
+        return not fail
+
+    def throttle(self) -> float | None:
+        """
+        :return: Seconds to wait if the request is over the rate limit, else None
+        """
+        if self.rate_limit is None:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._tokens_at) * self.rate_limit,
+            )
+            self._tokens_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            self.throttled += 1
+            return (1 - self._tokens) / self.rate_limit
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
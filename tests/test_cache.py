@@ -0,0 +1,139 @@
+from mlb_statsapi import (GameRequest, PlayVideoRequest, ResponseCache,
+                          VideoDecoration)
+from mlb_statsapi.transport import Response
+import gzip
+import json
+import multiprocessing
+import os
+import pytest
+import time
+
+
+def test_game_request_cache(tmp_path, stub_server, stub_transport):
+    cache = ResponseCache(tmp_path)
+    first = GameRequest(718096, transport=stub_transport, cache=cache)
+    first.make_request()
+    second = GameRequest(718096, transport=stub_transport, cache=cache)
+    game = second.make_request()
+
+    assert game.game_pk == 718096
+    assert game.play_video_by_play_id
+    assert sum(stub_server.hits.values()) == 2
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 2
+    assert cache.stats.bytes_saved > len(json.dumps(second._raw)) / 2
+
+    # Final games never expire, videos do
+    with gzip.open(cache.path(first.cache_key)) as f:
+        assert json.loads(f.readline())["expires_at"] is None
+    video_key = first._play_video_request.cache_key
+    with gzip.open(cache.path(video_key)) as f:
+        assert json.loads(f.readline())["expires_at"] is not None
+
+
+def video_ttl(cache, request):
+    video_key = request._play_video_request.cache_key
+    with gzip.open(cache.path(video_key)) as f:
+        return json.loads(f.readline())["expires_at"] - time.time()
+
+
+def test_live_game_videos_expire_sooner(tmp_path, stub_server, stub_transport):
+    cache = ResponseCache(tmp_path)
+    game_pk = stub_server.game_pks[0]
+    stub_server.replay_live(game_pk, steps=2)
+    live = GameRequest(game_pk, transport=stub_transport, cache=cache)
+    live.make_request()
+    assert not live.is_final()
+    assert video_ttl(cache, live) <= PlayVideoRequest.LIVE_CACHE_TTL
+
+    # Deferred videos are cached once the feed is parsed as final
+    final_pk = stub_server.game_pks[1]
+    final = GameRequest(
+        final_pk,
+        transport=stub_transport,
+        cache=cache,
+        videos=VideoDecoration.DEFERRED,
+    )
+    final.make_request().play_video_by_play_id
+    assert video_ttl(cache, final) == pytest.approx(
+        PlayVideoRequest.CACHE_TTL, abs=60
+    )
+
+
+def test_videos_of_cached_final_feed_kept(
+    tmp_path, stub_server, stub_transport
+):
+    cache = ResponseCache(tmp_path)
+    game_pk = stub_server.game_pks[0]
+    GameRequest(
+        game_pk,
+        transport=stub_transport,
+        cache=cache,
+        videos=VideoDecoration.OFF,
+    ).make_request()
+    # Eager videos are fetched before the feed, known final from the cache
+    request = GameRequest(game_pk, transport=stub_transport, cache=cache)
+    request.make_request()
+    assert video_ttl(cache, request) == pytest.approx(
+        PlayVideoRequest.CACHE_TTL, abs=60
+    )
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put("live", Response(200, b"{}"), ttl=-1)
+    cache.put("final", Response(200, b"{}"), ttl=None)
+    assert cache.get("live") is None
+    assert cache.get("final").json() == {}
+
+
+def set_mtimes(cache, mtime_ns_by_key):
+    for key, mtime_ns in mtime_ns_by_key.items():
+        os.utime(cache.path(key), ns=(mtime_ns, mtime_ns))
+
+
+def test_eviction_keeps_recently_used(tmp_path):
+    content = os.urandom(16384)
+    cache = ResponseCache(tmp_path, max_bytes=int(len(content) * 3.5))
+    for key in ["a", "b", "c"]:
+        cache.put(key, Response(200, content), ttl=None)
+    cache.get("a")
+    # As on a filesystem with coarse times, where all of them are equal
+    set_mtimes(cache, dict.fromkeys(["a", "b", "c"], 10**18))
+    cache.put("d", Response(200, content), ttl=None)
+    set_mtimes(cache, {"d": 10**18})
+
+    assert cache.stats.evictions == 1
+    assert cache.get("b") is None
+    assert all(cache.get(key) for key in ["a", "c", "d"])
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_eviction_orders_entries_of_other_processes(tmp_path):
+    content = os.urandom(16384)
+    writer = ResponseCache(tmp_path)
+    for key in ["a", "b", "c"]:
+        writer.put(key, Response(200, content), ttl=None)
+    set_mtimes(writer, {"a": 3 * 10**9, "b": 10**9, "c": 2 * 10**9})
+
+    # Only modification times tell which entries were used last
+    cache = ResponseCache(tmp_path, max_bytes=int(len(content) * 2.5))
+    cache.evict()
+    assert cache.stats.evictions == 1
+    assert not cache.path("b").exists()
+    assert cache.path("a").exists() and cache.path("c").exists()
+
+
+def put_entries(directory, worker):
+    cache = ResponseCache(directory)
+    for i in range(20):
+        cache.put(f"{i}", Response(200, f"{worker} {i}".encode()), ttl=None)
+
+
+def test_cache_shared_by_processes(tmp_path):
+    with multiprocessing.Pool(4) as pool:
+        pool.starmap(put_entries, [(tmp_path, worker) for worker in range(4)])
+    cache = ResponseCache(tmp_path)
+    for i in range(20):
+        assert cache.get(f"{i}").content.endswith(f" {i}".encode())
+    assert not list(tmp_path.glob("*/*.tmp"))
@@ -0,0 +1,146 @@
+from concurrent.futures import ThreadPoolExecutor
+from mlb_statsapi import AiohttpTransport, GameRequest, RequestCoalescer
+from mlb_statsapi.transport import RequestsTransport
+from stub_server import StubServer
+import asyncio
+import pytest
+import threading
+import time
+
+FEED = "GET /api/v1.1/game/718096/feed/live"
+CLIENTS = 16
+
+
+@pytest.fixture
+def slow_server():
+    with StubServer(latency=0.1) as server:
+        yield server
+
+
+def test_concurrent_requests_share_one_fetch(slow_server):
+    coalescer = RequestCoalescer()
+    barrier = threading.Barrier(CLIENTS)
+    with RequestsTransport(
+        host_overrides=slow_server.host_overrides
+    ) as transport:
+
+        def request(_):
+            barrier.wait()
+            return GameRequest(
+                718096, transport=transport, coalescer=coalescer
+            ).make_request()
+
+        with ThreadPoolExecutor(CLIENTS) as executor:
+            games = list(executor.map(request, range(CLIENTS)))
+
+    assert all(game is games[0] for game in games)
+    assert slow_server.hits[FEED] == 1
+    assert slow_server.hits["POST /graphql"] == 1
+    assert coalescer.stats.fetches == 1
+    assert coalescer.stats.shared == CLIENTS - 1
+
+
+def test_concurrent_async_requests_share_one_fetch(slow_server):
+    coalescer = RequestCoalescer()
+
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=slow_server.host_overrides
+        ) as transport:
+            return await asyncio.gather(
+                *(
+                    GameRequest(718096, coalescer=coalescer)
+                    .make_request_async(transport)
+                    for _ in range(CLIENTS)
+                ),
+                GameRequest(718096, lazy=True, coalescer=coalescer)
+                .make_request_async(transport),
+            )
+
+    *games, lazy_game = asyncio.run(fetch())
+    assert all(game is games[0] for game in games)
+    assert lazy_game is not games[0]
+    assert slow_server.hits[FEED] == 2
+
+
+def test_result_window(stub_server, stub_transport):
+    for window, fetches in [(0, 2), (60, 1)]:
+        stub_server.hits.clear()
+        coalescer = RequestCoalescer(window=window)
+        for _ in range(2):
+            GameRequest(
+                718096, transport=stub_transport, coalescer=coalescer
+            ).make_request()
+        assert stub_server.hits[FEED] == fetches
+
+    # Errors are not kept for the window
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            GameRequest(
+                1, transport=stub_transport, coalescer=coalescer
+            ).make_request()
+    assert stub_server.hits["GET /api/v1.1/game/1/feed/live"] == 2
+
+
+def test_cancelled_leader_hands_over(slow_server):
+    coalescer = RequestCoalescer()
+
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=slow_server.host_overrides
+        ) as transport:
+
+            def request():
+                return asyncio.create_task(
+                    GameRequest(718096, coalescer=coalescer)
+                    .make_request_async(transport)
+                )
+
+            leader = request()
+            await asyncio.sleep(0.02)
+            followers = [request() for _ in range(CLIENTS)]
+            await asyncio.sleep(0.02)
+            leader.cancel()
+            # A cancelled follower does not fail the others either
+            followers[0].cancel()
+            results = await asyncio.gather(
+                leader, *followers, return_exceptions=True
+            )
+            return results[0], results[1], results[2:]
+
+    leader, follower, games = asyncio.run(fetch())
+    assert isinstance(leader, asyncio.CancelledError)
+    assert isinstance(follower, asyncio.CancelledError)
+    assert all(game is games[0] for game in games)
+    assert games[0].game_pk == 718096
+    assert slow_server.hits[FEED] == 2
+
+
+class Interrupted(BaseException):
+    pass
+
+
+def test_interrupted_leader_hands_over():
+    coalescer = RequestCoalescer()
+    joined = threading.Event()
+
+    def interrupted():
+        joined.wait()
+        raise Interrupted()
+
+    def leader():
+        with pytest.raises(Interrupted):
+            coalescer.run("key", interrupted)
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    while coalescer.stats.fetches == 0:
+        time.sleep(0.001)
+    with ThreadPoolExecutor(1) as executor:
+        follower = executor.submit(coalescer.run, "key", lambda: "result")
+        while coalescer.stats.shared == 0:
+            time.sleep(0.001)
+        joined.set()
+        assert follower.result() == "result"
+    thread.join()
+    assert coalescer.stats.fetches == 2
@@ -0,0 +1,106 @@
+from mlb_statsapi import ROOT_KEY, Game, GameCollection, Metadata
+from mlb_statsapi.cache import ResponseCache
+from mlb_statsapi import collection as collection_module
+from mlb_statsapi.transport import set_default_transport
+import json
+import shutil
+from pathlib import Path
+import pandas as pd
+
+
+def test_collection_from_directory(tmp_path):
+    for path in sorted(Path("tests/game_data").glob("*.json")):
+        shutil.copy(path, tmp_path)
+    (tmp_path / "broken.json").write_text('{"gamePk": 1, "liveData"')
+
+    collection = GameCollection.from_directory(tmp_path, processes=2)
+
+    assert collection.game_pks == [718096, 718263, 718322, 718594]
+    [failure] = collection.failures
+    assert failure.source == tmp_path / "broken.json"
+    assert failure.error.startswith("JSONDecodeError")
+
+    with open("tests/game_data/718263.json") as f:
+        game = Game(json.load(f), Metadata(keys=[ROOT_KEY]))
+    pd.testing.assert_frame_equal(
+        collection.pitch_table.loc[718263],
+        game.get_pitch_metrics_table(),
+        check_names=False,
+        check_categorical=False,
+    )
+    assert len(collection.swing_table) == sum(
+        len(result.swing_table) for result in collection.results.values()
+    )
+
+    play_id = game.play_ids[-1]
+    assert collection.game_pk_by_play_id[play_id] == 718263
+    assert collection.play_event(play_id) == game.play_event_by_play_id[play_id]
+
+
+def test_collection_of_raw_feeds_and_requests(stub_server, stub_transport):
+    with open("tests/game_data/718096.json") as f:
+        raw = json.load(f)
+    previous = set_default_transport(stub_transport)
+    try:
+        collection = GameCollection.parse(
+            [raw, 718322, {}], processes=1, keep_games=True
+        )
+    finally:
+        set_default_transport(previous)
+
+    assert collection.game_pks == [718096, 718322]
+    assert collection.game(718096) == Game(raw, Metadata(keys=[ROOT_KEY]))
+    assert collection.results[718322].source == 718322
+    [failure] = collection.failures
+    assert str(failure) == "feed 2: KeyError: 'gamePk'"
+
+
+def test_collection_reloads_games_from_cache(
+    stub_server, stub_transport, tmp_path
+):
+    previous = set_default_transport(stub_transport)
+    try:
+        collection = GameCollection.parse(
+            [718322], processes=1, cache=ResponseCache(tmp_path)
+        )
+        stub_server.hits.clear()
+        game = collection.game(718322)
+        play_id = game.play_ids[-1]
+        assert collection.play_event(play_id) == (
+            game.play_event_by_play_id[play_id]
+        )
+    finally:
+        set_default_transport(previous)
+
+    assert not stub_server.hits
+
+
+def test_collection_keeps_recently_parsed_games(monkeypatch):
+    monkeypatch.setattr(collection_module, "RECENT_GAMES", 2)
+    paths = sorted(Path("tests/game_data").glob("*.json"))
+    collection = GameCollection.parse(paths, processes=1)
+    game_pk = collection.game_pks[0]
+    game = collection.game(game_pk)
+    play_id = game.play_ids[-1]
+    assert collection.play_event(play_id) is game.play_event_by_play_id[
+        play_id
+    ]
+    assert collection.game(game_pk) is game
+
+    collection.game(collection.game_pks[1])
+    assert collection.game(game_pk) is game
+    collection.game(collection.game_pks[2])
+    collection.game(collection.game_pks[3])
+    assert collection.game(game_pk) is not game
+
+
+def test_collection_reports_duplicate_games():
+    paths = sorted(Path("tests/game_data").glob("*.json"))
+    collection = GameCollection.parse([*paths, paths[0]], processes=1)
+
+    assert len(collection) == len(paths)
+    assert collection.results[718096].source == paths[0]
+    [failure] = collection.failures
+    assert failure.source == paths[0]
+    assert failure.index == len(paths)
+    assert failure.error == "Duplicate of game 718096 parsed from source 0"
@@ -0,0 +1,88 @@
+from mlb_statsapi import ColumnarStore, Game
+import json
+from pathlib import Path
+import pandas as pd
+import pytest
+
+ds = pytest.importorskip("pyarrow.dataset")
+
+
+@pytest.mark.parametrize("format", ["parquet", "ipc"])
+def test_store_round_trip(tmp_path, format):
+    games = []
+    for path in sorted(Path("tests/game_data").glob("*.json")):
+        with open(path) as f:
+            games.append(Game(json.load(f)))
+    store = ColumnarStore(tmp_path, format=format)
+    store.write_games(games[:2])
+    store.write_games(games[1:])
+
+    # Writing a game again replaces it
+    assert store.game_pks() == [game.game_pk for game in games]
+    game = games[1]
+    expected = game.get_pitch_metrics_table()
+    pitches = store.read("pitches")
+    assert len(pitches) == sum(
+        len(g.get_pitch_metrics_table()) for g in games
+    )
+
+    df = store.read("pitches", game_pks=[game.game_pk])
+    assert (df["season"] == 2023).all()
+    pd.testing.assert_frame_equal(
+        df[expected.columns],
+        expected,
+        check_dtype=False,
+        check_names=False,
+        check_categorical=False,
+    )
+    play_events = store.read("play_events", game_pks=[game.game_pk])
+    pd.testing.assert_frame_equal(
+        play_events[game.get_play_event_table().columns],
+        game.get_play_event_table(),
+        check_dtype=False,
+        check_names=False,
+        check_categorical=False,
+    )
+
+    fast = store.read(
+        "pitches",
+        columns=["start_speed"],
+        filter=ds.field("start_speed") > 95,
+    )
+    assert list(fast.columns) == ["start_speed"]
+    assert list(fast.index) == list(
+        pitches.index[pitches["start_speed"] > 95]
+    )
+
+
+def test_store_rewrites_game_without_rows(tmp_path):
+    games = []
+    for path in sorted(Path("tests/game_data").glob("*.json"))[:2]:
+        with open(path) as f:
+            games.append(Game(json.load(f)))
+    store = ColumnarStore(tmp_path)
+    store.write_game(games[0])
+    store.dataset("pitches")
+    schema = store._schemas["pitches"]
+    store.dataset("pitches")
+    assert store._schemas["pitches"] is schema
+
+    # The merged schema is read again after a write
+    store.write_game(games[1])
+    assert "pitches" not in store._schemas
+    game = games[0]
+    store.write_tables(
+        game.game_pk,
+        2023,
+        game._raw["gameData"]["datetime"]["officialDate"],
+        {
+            name: df.iloc[:0]
+            for name, df in {
+                "pitches": game.get_pitch_metrics_table(),
+                "swings": game.get_swing_metrics_table(),
+            }.items()
+        },
+    )
+    pitches = store.read("pitches")
+    assert set(pitches["game_pk"]) == {games[1].game_pk}
+    assert len(store.read("swings", game_pks=[game.game_pk])) == 0
@@ -1,12 +1,20 @@
-from mlb_statsapi import Game
+from mlb_statsapi import (Game, Numeric, PitchFilter, Strictness,
+                          field_strictness)
+from mlb_statsapi import utils as ut
+from mlb_statsapi.constants import MetaFields, PitchTypes
+from mlb_statsapi import transport
+from mlb_statsapi.transport import loads
 import pytest
 import json
-from unittest.mock import patch
+import pickle
+from decimal import Decimal
+
+import pandas as pd
 
 
 @pytest.mark.parametrize("game_pk", [718096, 718263, 718322, 718594])
 # @pytest.mark.parametrize("game_pk", [718096])
-@patch("mlb_statsapi.datatypes.t", lambda f: f())
+@field_strictness(Strictness.RAISE)
 def test_game_parsing(game_pk):
     with open(f"tests/game_data/{game_pk}.json", 'r') as f:
         data = json.load(f)
@@ -22,3 +30,271 @@ def test_game_parsing(game_pk):
     assert game.get_filtered_pitch_metrics_by_play_id_as_df() is not None
     assert game.get_filtered_swing_metrics_by_play_id()
     assert game.get_filtered_swing_metrics_by_play_id_as_df() is not None
+
+
+def test_trapped_field_errors_are_recorded():
+    with open("tests/game_data/718096.json", 'r') as f:
+        data = json.load(f)
+    play_event = data["liveData"]["plays"]["allPlays"][0]["playEvents"][3]
+    del play_event["pitchData"]["startSpeed"]
+
+    with field_strictness(Strictness.TRAP):
+        game = Game(data)
+    pitch = game.plays[0].play_events[3].pitch
+    assert pitch.start_speed == MetaFields.NOT_FOUND
+    [error] = pitch.field_errors
+    assert isinstance(error.error, KeyError)
+    assert error.path == "NULL.liveData.plays.allPlays.[0].playEvents.[3].pitchData.start_speed"
+
+    with field_strictness(Strictness.RAISE), pytest.raises(KeyError):
+        Game(data)
+
+
+@pytest.mark.parametrize("game_pk", [718096, 718263, 718322, 718594])
+@field_strictness(Strictness.RAISE)
+def test_lazy_game_matches_eager(game_pk):
+    with open(f"tests/game_data/{game_pk}.json", 'r') as f:
+        data = json.load(f)
+    eager = Game(data)
+    lazy = Game(data, lazy=True)
+    assert not lazy.is_loaded("plays")
+
+    play = lazy.plays[0]
+    assert lazy.is_loaded("plays")
+    assert not play.is_loaded("play_events")
+    assert not lazy.plays[1].is_loaded("play_events")
+    assert not play.play_events[-1].pitch.is_loaded("start_speed")
+
+    assert lazy.game_pk == eager.game_pk
+    assert lazy.play_ids == eager.play_ids
+    assert (
+        lazy.get_filtered_pitch_metrics_by_play_id()
+        == eager.get_filtered_pitch_metrics_by_play_id()
+    )
+    assert (
+        lazy.get_filtered_swing_metrics_by_play_id()
+        == eager.get_filtered_swing_metrics_by_play_id()
+    )
+    assert lazy == eager
+
+
+def assert_same_table(columnar_df, df):
+    # The dict based tables hold Decimals and enums, so compare as plain values
+    columnar_df = columnar_df.astype(object).where(columnar_df.notna(), None)
+    df = df.map(lambda v: float(v) if isinstance(v, Decimal) else v)
+    df = df.astype(object).where(df.notna(), None)
+    pd.testing.assert_frame_equal(
+        columnar_df, df, check_like=True, check_dtype=False
+    )
+
+
+@pytest.mark.parametrize("game_pk", [718096, 718263, 718322, 718594])
+@pytest.mark.parametrize(
+    "pitch_metrics,swing_metrics",
+    [
+        (None, None),
+        (
+            ["start_speed", ".breaks.spinRate", "pitch_type", ".missing"],
+            ["launch_speed", "trajectory", ".coordinates.coordX"],
+        ),
+    ],
+)
+@field_strictness(Strictness.RAISE)
+def test_columnar_tables_match_dict_tables(
+    game_pk, pitch_metrics, swing_metrics
+):
+    with open(f"tests/game_data/{game_pk}.json", 'r') as f:
+        data = json.load(f)
+    game = Game(data)
+
+    assert_same_table(
+        game.get_pitch_metrics_table(pitch_metrics),
+        game.get_filtered_pitch_metrics_by_play_id_as_df(pitch_metrics),
+    )
+    assert_same_table(
+        game.get_swing_metrics_table(swing_metrics),
+        game.get_filtered_swing_metrics_by_play_id_as_df(swing_metrics),
+    )
+
+    arrays = game.get_pitch_metrics_table(pitch_metrics, as_arrays=True)
+    assert list(arrays["play_id"]) == list(game.pitches_by_play_id)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        ".gamePk",
+        ".metaData.timeStamp",
+        ".metaData.gameEvents",
+        ".metaData.missing.key",
+        ".liveData.plays.allPlays.[0].about.inning",
+        ".liveData.plays.allPlays.[].about.isTopInning",
+        ".liveData.plays.allPlays.[].playEvents.[].pitchData.zone",
+        ".liveData.plays.allPlays.[1].result",
+    ],
+)
+def test_compiled_paths_match_explore_object(path):
+    with open("tests/game_data/718096.json", 'r') as f:
+        data = json.load(f)
+    assert ut.evaluate_path(data, ut.compile_path(path)) == ut.explore_object(
+        data, path
+    )
+
+
+def test_terminal_paths_cover_list_attributes():
+    with open("tests/game_data/718096.json", 'r') as f:
+        data = json.load(f)
+    paths = ut.terminal_paths(data)
+    assert paths > ut.all_attributes(ut.list_attributes(data))
+
+    pitch_data = data["liveData"]["plays"]["allPlays"][0]["playEvents"][3]
+    assert ut.terminal_paths(pitch_data) >= ut.all_attributes(
+        ut.list_attributes(pitch_data)
+    )
+
+
+def test_union_field_schema_covers_every_pitch():
+    with open("tests/game_data/718096.json", 'r') as f:
+        game = Game(json.load(f))
+    schema = game.pitch_field_schema
+    assert game.pitch_field_schema is schema
+
+    pitches = game.get_filtered_pitch_metrics_by_play_id()
+    for play_id, pitch in game.pitches_by_play_id.items():
+        own = pitch.flattened_values
+        assert set(own) <= set(schema)
+        # Fields only other pitches have are None
+        assert pitches[play_id] == {
+            **dict.fromkeys(schema),
+            **own,
+            **pitch.get_match_up_values(),
+        }
+
+
+@field_strictness(Strictness.RAISE)
+def test_float_numeric_mode():
+    with open("tests/game_data/718263.json", 'r') as f:
+        data = json.load(f)
+    game = Game(data)
+    float_game = Game(data, numeric=Numeric.FLOAT)
+
+    play_event = float_game.plays[0].play_events[-1]
+    assert type(play_event.pitch.start_speed) == float
+    assert not hasattr(play_event.pitch, "__dict__")
+    assert play_event.pitch._metadata.parent is play_event._metadata
+    assert play_event.pitch._extra_fields is play_event._extra_fields
+    assert play_event.pitch.pitch_type == play_event.pitch_description
+    assert {
+        play_id: {
+            k: float(v) if isinstance(v, Decimal) else v
+            for k, v in metrics.items()
+        }
+        for play_id, metrics in game.get_filtered_swing_metrics_by_play_id(
+            ["launch_speed", "total_distance"]
+        ).items()
+    } == float_game.get_filtered_swing_metrics_by_play_id(
+        ["launch_speed", "total_distance"]
+    )
+
+    unpickled = pickle.loads(pickle.dumps(float_game))
+    assert unpickled == float_game
+    assert unpickled.numeric == Numeric.FLOAT
+
+
+def test_cached_indexes():
+    with open("tests/game_data/718096.json", 'r') as f:
+        data = json.load(f)
+    game = Game(data)
+
+    pitches = game.pitches_by_play_id
+    assert game.pitches_by_play_id is pitches
+    assert pitches == {
+        k: v for p in game.plays for k, v in p.pitches_by_play_id.items()
+    }
+    assert game.swings_by_play_id.keys() == pitches.keys()
+
+    play = game.plays[10]
+    assert play in game.plays_by_batter_id[play.batter_id]
+    assert play in game.plays_by_pitcher_id[play.pitcher_id]
+    assert play in game.plays_by_inning[play.inning]
+    assert game.play_by_at_bat_index[play.at_bat_index] is play
+    assert sum(map(len, game.plays_by_inning.values())) == len(game.plays)
+
+    game.plays = game.plays[:10]
+    game.invalidate_indexes()
+    assert game.pitches_by_play_id is not pitches
+    assert play not in game.plays_by_batter_id.get(play.batter_id, [])
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_filters_match_post_filtering(lazy):
+    with open("tests/game_data/718096.json", 'r') as f:
+        data = json.load(f)
+    game = Game(data, lazy=lazy)
+    play = game.plays[10]
+    where = PitchFilter(
+        pitcher_ids=[play.pitcher_id],
+        innings=range(1, 6),
+        pitch_types=[PitchTypes.FOUR_SEAM_FASTBALL, PitchTypes.SLIDER],
+        predicate=lambda e: e["details"]["isInPlay"] is False,
+    )
+    expected = [
+        play_event.play_id
+        for p in Game(data).plays
+        if p.pitcher_id == play.pitcher_id and p.inning <= 5
+        for play_event in p.play_events
+        if play_event._raw.get("details", {}).get("type", {}).get(
+            "description"
+        ) in ("Four-Seam Fastball", "Slider")
+        and not play_event._raw["details"]["isInPlay"]
+    ]
+    assert expected
+
+    pitches = game.get_filtered_pitch_metrics_by_play_id(where=where)
+    assert list(pitches) == expected
+    swings = game.get_filtered_swing_metrics_by_play_id_as_df(where=where)
+    assert list(swings.index) == expected
+    assert list(game.get_match_up_values_by_play_id(where=where)) == expected
+    if lazy:
+        # Plays of other pitchers never build their play events
+        other = next(p for p in game.plays if p.pitcher_id != play.pitcher_id)
+        assert not other.is_loaded("play_events")
+
+    assert_same_table(
+        game.get_pitch_metrics_table(where=where),
+        game.get_filtered_pitch_metrics_by_play_id_as_df(where=where),
+    )
+    assert_same_table(
+        game.get_swing_metrics_table(where=where),
+        swings,
+    )
+
+    play_ids = expected[::2] + ["missing"]
+    assert list(
+        game.get_filtered_pitch_metrics_by_play_id(
+            play_ids=play_ids, where=where
+        )
+    ) == expected[::2]
+    assert list(
+        game.get_pitch_metrics_table(play_ids=play_ids, where=where).index
+    ) == expected[::2]
+
+
+@pytest.mark.parametrize("fast", [True, False])
+@pytest.mark.parametrize("game_pk", [718096, 718263, 718322, 718594])
+def test_fast_decoding_matches_json(game_pk, fast, monkeypatch):
+    if fast:
+        pytest.importorskip("orjson")
+    else:
+        # The json module fallback, used when orjson is not installed
+        monkeypatch.setattr(transport, "orjson", None)
+    with open(f"tests/game_data/{game_pk}.json", "rb") as f:
+        content = f.read()
+    data = json.loads(content)
+    assert loads(content) == data
+    assert loads(memoryview(content)) == data
+    assert loads(bytearray(content)) == data
+    assert loads(content.decode()) == data
+    assert Game(loads(content), numeric=Numeric.FLOAT) == Game(
+        data, numeric=Numeric.FLOAT
+    )
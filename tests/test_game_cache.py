@@ -0,0 +1,222 @@
+from concurrent.futures import ThreadPoolExecutor
+from mlb_statsapi import (AiohttpTransport, GameCache, GameRequest,
+                          VideoDecoration)
+from mlb_statsapi.cache import estimate_game_bytes, feed_timestamp
+import asyncio
+import pytest
+import threading
+
+FEED = "GET /api/v1.1/game/{}/feed/live"
+
+
+def test_final_game_reused_without_request(stub_server, stub_transport):
+    game_cache = GameCache()
+    game_pk = stub_server.game_pks[0]
+    first = GameRequest(
+        game_pk, transport=stub_transport, game_cache=game_cache
+    ).make_request()
+    second = GameRequest(
+        game_pk, transport=stub_transport, game_cache=game_cache
+    ).make_request()
+    assert second is first
+    assert stub_server.hits[FEED.format(game_pk)] == 1
+    assert stub_server.hits["POST /graphql"] == 1
+    assert game_cache.stats.hits == 1
+    assert game_cache.stats.misses == 1
+    assert game_cache.stats.hit_rate == 0.5
+
+    uncached = GameRequest(game_pk, transport=stub_transport).make_request()
+    assert uncached is not first
+    assert uncached.plays == first.plays
+
+
+def test_game_key_includes_parse_options(stub_server, stub_transport):
+    game_cache = GameCache()
+    game_pk = stub_server.game_pks[0]
+    game = GameRequest(
+        game_pk, transport=stub_transport, game_cache=game_cache
+    ).make_request()
+    lazy_game = GameRequest(
+        game_pk, lazy=True, transport=stub_transport, game_cache=game_cache
+    ).make_request()
+    assert lazy_game is not game
+    assert len(game_cache) == 2
+    assert stub_server.hits[FEED.format(game_pk)] == 2
+
+
+def test_live_game_reused_while_feed_unchanged(stub_server, stub_transport):
+    game_cache = GameCache()
+    game_pk = stub_server.game_pks[0]
+    replay = stub_server.replay_live(game_pk, steps=2)
+
+    def request():
+        return GameRequest(
+            game_pk, transport=stub_transport, game_cache=game_cache
+        ).make_request()
+
+    first = request()
+    assert request() is first
+    # Live feeds are fetched every time to see whether they changed
+    assert stub_server.hits[FEED.format(game_pk)] == 2
+    assert stub_server.hits["POST /graphql"] == 1
+
+    replay.step = 1
+    changed = request()
+    assert changed is not first
+    assert changed.plays != first.plays
+
+    replay.step = 2
+    final = request()
+    assert request() is final
+    assert stub_server.hits[FEED.format(game_pk)] == 4
+
+
+@pytest.mark.parametrize(
+    "videos", [VideoDecoration.EAGER, VideoDecoration.BACKGROUND]
+)
+def test_videos_only_fetched_for_parsed_games(
+    stub_server, stub_transport, videos
+):
+    game_cache = GameCache()
+    game_pk = stub_server.game_pks[0]
+    stub_server.replay_live(game_pk, steps=1)
+    games = [
+        GameRequest(
+            game_pk,
+            transport=stub_transport,
+            videos=videos,
+            game_cache=game_cache,
+        ).make_request()
+        for _ in range(5)
+    ]
+    assert all(game is games[0] for game in games)
+    assert games[0].play_video_by_play_id
+    assert stub_server.hits[FEED.format(game_pk)] == 5
+    assert stub_server.hits["POST /graphql"] == 1
+    assert game_cache.stats.hits == 4
+
+
+def test_async_videos_only_fetched_for_parsed_games(stub_server):
+    game_cache = GameCache()
+    game_pk = stub_server.game_pks[0]
+    stub_server.replay_live(game_pk, steps=1)
+
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=stub_server.host_overrides
+        ) as transport:
+            games = [
+                await GameRequest(
+                    game_pk,
+                    videos=VideoDecoration.BACKGROUND,
+                    game_cache=game_cache,
+                ).make_request_async(transport)
+                for _ in range(5)
+            ]
+            await games[0]._extra_fields["play_videos"].get_async()
+            return games
+
+    games = asyncio.run(fetch())
+    assert all(game is games[0] for game in games)
+    assert stub_server.hits["POST /graphql"] == 1
+
+
+def test_live_games_expire(stub_server, stub_transport):
+    game_cache = GameCache(live_ttl=0)
+    game_pk = stub_server.game_pks[0]
+    stub_server.replay_live(game_pk, steps=1)
+    first = GameRequest(
+        game_pk, transport=stub_transport, game_cache=game_cache
+    ).make_request()
+    second = GameRequest(
+        game_pk, transport=stub_transport, game_cache=game_cache
+    ).make_request()
+    assert second is not first
+    assert game_cache.stats.hits == 0
+
+
+def test_eviction_by_size():
+    game_cache = GameCache(max_bytes=100)
+    for key in "abc":
+        game_cache.put(key, key, 40)
+    assert game_cache.get("a") is None
+    assert game_cache.get("b") == "b"
+    game_cache.put("d", "d", 40)
+    # c is the least recently used
+    assert game_cache.get("c") is None
+    assert game_cache.get("b") == "b"
+    assert game_cache.stats.evictions == 2
+    assert game_cache.stats.size_bytes == 80
+
+    game_cache.put("e", "e", 101)
+    assert game_cache.get("e") is None
+    game_cache.clear()
+    assert len(game_cache) == 0
+    assert game_cache.stats.size_bytes == 0
+
+
+def test_final_games_pinned_over_live_games():
+    game_cache = GameCache(max_bytes=100)
+    game_cache.put("final", "final", 40, final=True)
+    game_cache.put("live", "live", 40)
+    game_cache.get("final")
+    game_cache.get("live")
+    # The live game is evicted although it was used more recently
+    game_cache.put("other", "other", 40)
+    assert game_cache.get("live") is None
+    assert game_cache.get("final") == "final"
+
+    # Replacing a key does not count its old size twice
+    game_cache.put("other", "other", 50, final=True)
+    assert game_cache.stats.size_bytes == 90
+    game_cache.put("last", "last", 40, final=True)
+    assert game_cache.get("final") is None
+    assert len(game_cache) == 2
+
+
+def test_concurrent_gets_and_puts():
+    game_cache = GameCache(max_bytes=1000)
+    barrier = threading.Barrier(8)
+
+    def work(worker):
+        barrier.wait()
+        for i in range(500):
+            key = (worker + i) % 50
+            if game_cache.get(key) is None:
+                game_cache.put(key, key, 30, final=key % 2 == 0)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(work, range(8)))
+
+    stats = game_cache.stats
+    assert stats.hits + stats.misses == 8 * 500
+    assert stats.size_bytes == 30 * len(game_cache)
+    assert stats.size_bytes <= 1000
+
+
+def test_async_requests_use_game_cache(stub_server):
+    game_cache = GameCache()
+    game_pk = stub_server.game_pks[0]
+
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=stub_server.host_overrides
+        ) as transport:
+            first = await GameRequest(
+                game_pk, game_cache=game_cache
+            ).make_request_async(transport)
+            second = await GameRequest(
+                game_pk, game_cache=game_cache
+            ).make_request_async(transport)
+            return first, second
+
+    first, second = asyncio.run(fetch())
+    assert second is first
+    assert stub_server.hits[FEED.format(game_pk)] == 1
+
+
+def test_feed_timestamp_and_size(stub_server):
+    for feed in stub_server.feeds.values():
+        assert feed_timestamp(feed) is not None
+        assert estimate_game_bytes(feed) > len(feed.replace(b" ", b""))
+    assert feed_timestamp(b'{"gamePk": 1}') is None
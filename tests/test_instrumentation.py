@@ -0,0 +1,78 @@
+from mlb_statsapi import (ROOT_KEY, Game, GameRequest, InMemorySink, Metadata,
+                          capture, metrics_sink)
+from mlb_statsapi import instrumentation
+import json
+
+
+def test_request_stages_are_recorded(stub_server, stub_transport):
+    sink = InMemorySink()
+    with metrics_sink(sink):
+        game = GameRequest(718096, transport=stub_transport).make_request()
+        game.get_pitch_metrics_table()
+        game.get_filtered_swing_metrics_by_play_id_as_df()
+
+    assert sink.total_count("request.cache_hits") == 0
+    for request in ["GameRequest", "PlayVideoRequest"]:
+        assert sink.total_seconds("request.network", request=request) > 0
+        assert sink.total_seconds("request.decode", request=request) > 0
+    assert sink.total_seconds("request.construct", datatype="Game") > 0
+    assert sink.total_count("datatype.constructed", type="Play") == len(
+        game.plays
+    )
+    assert sink.total_seconds("dataframe.build", table="pitch_table") > 0
+    assert sink.total_seconds("dataframe.build", table="swing_metrics") > 0
+    assert sink.total_seconds("flattened_value", type="Swing") > 0
+
+    text = sink.prometheus_text()
+    assert "# TYPE mlb_statsapi_request_network_seconds summary" in text
+    assert (
+        'mlb_statsapi_request_network_seconds_count{request="GameRequest"} 1'
+        in text
+    )
+
+    # Nothing is recorded once the sink is removed
+    assert instrumentation.sink is None
+    recorded = sink.total_seconds("dataframe.build")
+    game.get_pitch_metrics_table()
+    assert sink.total_seconds("dataframe.build") == recorded
+
+
+def test_field_errors_are_counted_by_path():
+    with open("tests/game_data/718096.json") as f:
+        data = json.load(f)
+    for play in data["liveData"]["plays"]["allPlays"][:3]:
+        del play["playEvents"][0]["type"]
+
+    sink = InMemorySink()
+    with metrics_sink(sink):
+        Game(data, Metadata(keys=[ROOT_KEY]))
+
+    assert sink.counters == {
+        **sink.counters,
+        sink.key(
+            "field.errors",
+            {
+                "path": f"{ROOT_KEY}.liveData.plays.allPlays.[].playEvents.[]",
+                "field": "play_event_type",
+                "error": "KeyError",
+            },
+        ): 3,
+    }
+
+
+def test_capture():
+    with open("tests/game_data/718096.json") as f:
+        data = json.load(f)
+
+    sink = InMemorySink()
+    with metrics_sink(sink), capture("718096", memory=True) as result:
+        Game(data)
+
+    assert result.seconds > 0
+    assert result.peak_bytes > 0
+    assert result.top_allocations
+    assert any(
+        "datatypes.py" in filename
+        for filename, *_ in result.stats().stats
+    )
+    assert sink.total_seconds("capture", label="718096") == result.seconds
@@ -0,0 +1,61 @@
+from mlb_statsapi import Game, LiveEventType, LiveGame
+import json
+import pandas as pd
+import pytest
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_live_game_matches_final_game(stub_server, stub_transport, lazy):
+    game_pk = 718096
+    replay = stub_server.replay_live(game_pk, steps=5)
+    with open(f"tests/game_data/{game_pk}.json") as f:
+        final_game = Game(json.load(f))
+
+    live_game = LiveGame(game_pk, lazy=lazy, transport=stub_transport)
+    received = []
+    live_game.subscribe(received.append)
+    events = list(live_game.poll(interval=0))
+
+    assert live_game.is_final
+    assert events == received
+    assert live_game.game.play_ids == final_game.play_ids
+    pd.testing.assert_frame_equal(
+        live_game.game.get_filtered_swing_metrics_by_play_id_as_df(),
+        final_game.get_filtered_swing_metrics_by_play_id_as_df(),
+    )
+
+    first_game = Game(replay.snapshots[0])
+    new_plays = [e for e in events if e.type == LiveEventType.NEW_PLAY]
+    new_pitches = [e for e in events if e.type == LiveEventType.NEW_PITCH]
+    assert len(new_plays) == len(final_game.plays) - len(first_game.plays)
+    assert [e.play_event.play_id for e in new_pitches] == [
+        play_id
+        for play_id, pitch in final_game.pitches_by_play_id.items()
+        if pitch is not None and play_id not in first_game.play_ids
+    ]
+
+
+def test_live_game_only_rebuilds_changed_plays(stub_server, stub_transport):
+    game_pk = 718263
+    stub_server.replay_live(game_pk, steps=3)
+    live_game = LiveGame(game_pk, transport=stub_transport)
+    live_game.update()
+    plays = list(live_game.game.plays)
+    last_play_events = list(plays[-1].play_events)
+    play_events = live_game.game.play_event_by_play_id
+
+    live_game.update()
+
+    # Cached indexes are rebuilt after an update
+    assert live_game.game.play_event_by_play_id.keys() > play_events.keys()
+
+    assert all(a is b for a, b in zip(plays[:-1], live_game.game.plays))
+    # The unfinished play is updated in place, only its last event changed
+    assert live_game.game.plays[len(plays) - 1] is plays[-1]
+    assert all(
+        a is b
+        for a, b in zip(last_play_events[:-1], plays[-1].play_events)
+    )
+    assert plays[-1].play_events[len(last_play_events) - 1] is not (
+        last_play_events[-1]
+    )
@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from mlb_statsapi import (AiohttpTransport, RateLimitedAsyncTransport,
+                          RateLimitedTransport, RateLimiter)
+from mlb_statsapi.ratelimit import TokenBucket, retry_after_seconds
+from mlb_statsapi.transport import RequestsTransport
+from requests.adapters import Retry
+from stub_server import StubServer
+import asyncio
+import pytest
+import time
+
+URI = "https://statsapi.mlb.com/api/v1/schedule?sportId=1&season=2023"
+REQUESTS = 40
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+    now = bucket.updated
+    assert [bucket.reserve(now) for _ in range(4)] == pytest.approx(
+        [0, 0, 0.1, 0.2]
+    )
+    bucket.pause(now, 1.0)
+    assert bucket.reserve(now) == pytest.approx(1.3)
+
+    bucket.throttled(now)
+    bucket.throttled(now + 0.5)
+    assert bucket.rate == 5
+    bucket.succeeded()
+    assert bucket.rate == pytest.approx(5.2)
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds({"Retry-After": "2"}) == 2
+    assert retry_after_seconds({"retry-after": "0.5"}) == 0.5
+    date = formatdate(time.time() + 30, usegmt=True)
+    assert 28 < retry_after_seconds({"Retry-After": date}) <= 30
+    assert retry_after_seconds({"Retry-After": "soon"}) is None
+    assert retry_after_seconds({}) is None
+
+
+@pytest.fixture
+def limited_server():
+    with StubServer(rate_limit=50, burst=5) as server:
+        yield server
+
+
+def send_all(transport, uri=URI):
+    with ThreadPoolExecutor(8) as executor:
+        return list(
+            executor.map(
+                lambda _: transport.request("GET", uri).status_code,
+                range(REQUESTS),
+            )
+        )
+
+
+def test_rate_limited_transport(limited_server):
+    with RequestsTransport(
+        retries=Retry(0), host_overrides=limited_server.host_overrides
+    ) as transport:
+        assert 429 in send_all(transport)
+
+        limiter = RateLimiter(host_rates={}, default_rate=200)
+        statuses = send_all(RateLimitedTransport(transport, limiter))
+    assert statuses == [200] * REQUESTS
+
+    stats = limiter.stats()["https://statsapi.mlb.com"]
+    assert stats.requests == REQUESTS + stats.retries
+    assert stats.throttled > 0
+    assert stats.retries >= stats.throttled
+    assert stats.waits > 0 and stats.wait_seconds > 0
+    assert stats.rate < 200
+
+
+def test_closes_only_owned_transport():
+    transport = RequestsTransport()
+    closed = []
+    transport.close = lambda: closed.append(transport)
+    # e.g. the shared default transport
+    RateLimitedTransport(transport).close()
+    assert not closed
+    RateLimitedTransport(transport, owns_transport=True).close()
+    assert closed == [transport]
+
+
+def test_rate_limited_async_transport(limited_server):
+    limiter = RateLimiter(host_rates={}, default_rate=200)
+
+    async def send():
+        async with RateLimitedAsyncTransport(
+            AiohttpTransport(
+                retries=Retry(0),
+                host_overrides=limited_server.host_overrides,
+            ),
+            limiter,
+            owns_transport=True,
+        ) as transport:
+            responses = await asyncio.gather(
+                *(transport.request("GET", URI) for _ in range(REQUESTS))
+            )
+        return [response.status_code for response in responses]
+
+    assert asyncio.run(send()) == [200] * REQUESTS
+    assert limiter.stats()["https://statsapi.mlb.com"].throttled > 0
@@ -0,0 +1,192 @@
+from mlb_statsapi import (AiohttpTransport, GameRequest, PlayVideoRequest,
+                          VideoDecoration, fetch_games)
+from mlb_statsapi import transport as transport_module
+from mlb_statsapi.transport import (ThreadedAsyncTransport,
+                                    create_async_transport,
+                                    set_default_transport)
+from requests.adapters import Retry
+from stub_server import StubServer
+import asyncio
+import pickle
+import pytest
+
+
+@pytest.mark.parametrize("game_pk", [718096, 718263])
+def test_game_request(stub_server, stub_transport, game_pk):
+    game = GameRequest(game_pk, transport=stub_transport).make_request()
+    assert game.game_pk == game_pk
+    play_id, video_url = next(iter(game.play_video_by_play_id.items()))
+    assert video_url == f"https://www.mlb.com/video/slug-{play_id}"
+    assert stub_server.hits[f"GET /api/v1.1/game/{game_pk}/feed/live"] == 1
+    assert stub_server.hits["POST /graphql"] == 1
+
+
+def test_requests_share_pooled_connections(stub_server, stub_transport):
+    for game_pk in stub_server.game_pks:
+        GameRequest(game_pk, transport=stub_transport).make_request()
+    assert sum(stub_server.hits.values()) == 2 * len(stub_server.game_pks)
+    assert len(stub_server.connections) == 1
+
+
+def test_default_transport(stub_server, stub_transport):
+    previous = set_default_transport(stub_transport)
+    try:
+        play_videos = PlayVideoRequest(718096).make_request()
+    finally:
+        set_default_transport(previous)
+    assert play_videos.video_url_by_play_id
+
+
+def test_fetch_games_async(stub_server):
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=stub_server.host_overrides
+        ) as transport:
+            return await fetch_games(
+                stub_server.game_pks, concurrency=2, transport=transport
+            )
+
+    games = asyncio.run(fetch())
+    assert list(games) == stub_server.game_pks
+    for game_pk, game in games.items():
+        assert game.game_pk == game_pk
+        play_event = game.play_event_by_play_id[game.play_ids[-1]]
+        assert play_event.play_video.endswith(play_event.play_id)
+    assert stub_server.hits["POST /graphql"] == len(stub_server.game_pks)
+
+
+def test_async_request_retries():
+    retries = Retry(total=3, backoff_factor=0, status_forcelist=[503])
+    with StubServer(failures=2) as server:
+
+        async def fetch():
+            async with AiohttpTransport(
+                retries=retries, host_overrides=server.host_overrides
+            ) as transport:
+                return await GameRequest(718096).make_request_async(transport)
+
+        game = asyncio.run(fetch())
+    assert game.game_pk == 718096
+    assert sum(server.hits.values()) == 4
+
+
+def test_async_request_without_status_forcelist():
+    retries = Retry(total=1, backoff_factor=0, status_forcelist=None)
+    with StubServer(failures=1) as server:
+
+        async def fetch():
+            async with AiohttpTransport(
+                retries=retries, host_overrides=server.host_overrides
+            ) as transport:
+                return await transport.request(
+                    "GET", GameRequest(718096).request_uri
+                )
+
+        response = asyncio.run(fetch())
+    # Only connection errors are retried
+    assert response.status_code == 503
+    assert sum(server.hits.values()) == 1
+
+
+def test_threaded_async_transport_keeps_host_overrides(
+    stub_server, monkeypatch
+):
+    monkeypatch.setattr(transport_module, "aiohttp", None)
+
+    async def fetch():
+        async with create_async_transport(
+            stub_server.host_overrides
+        ) as transport:
+            assert isinstance(transport, ThreadedAsyncTransport)
+            return await GameRequest(718096).make_request_async(transport)
+
+    game = asyncio.run(fetch())
+    assert game.game_pk == 718096
+    assert stub_server.hits["GET /api/v1.1/game/718096/feed/live"] == 1
+
+
+def test_fetch_games_reports_failures(stub_server):
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=stub_server.host_overrides
+        ) as transport:
+            return await fetch_games(
+                [718096, 1], transport=transport, return_exceptions=True
+            )
+
+    games = asyncio.run(fetch())
+    assert games[718096].game_pk == 718096
+    assert isinstance(games[1], KeyError)
+
+
+def test_videos_off(stub_server, stub_transport):
+    game = GameRequest(
+        718096, transport=stub_transport, videos=VideoDecoration.OFF
+    ).make_request()
+    assert "POST /graphql" not in stub_server.hits
+    assert "play_videos" not in game._extra_fields
+
+
+@pytest.mark.parametrize(
+    "videos", [VideoDecoration.DEFERRED, VideoDecoration.BACKGROUND]
+)
+def test_videos_deferred(stub_server, stub_transport, videos):
+    eager = GameRequest(718096, transport=stub_transport).make_request()
+    stub_server.hits.clear()
+
+    game = GameRequest(
+        718096, transport=stub_transport, videos=videos
+    ).make_request()
+    if videos == VideoDecoration.DEFERRED:
+        assert "POST /graphql" not in stub_server.hits
+    assert game.play_video_by_play_id == eager.play_video_by_play_id
+    assert stub_server.hits["POST /graphql"] == 1
+    restored = pickle.loads(pickle.dumps(game))
+    assert restored._extra_fields["play_videos"] == eager.play_videos
+
+
+@pytest.mark.parametrize(
+    "videos", [VideoDecoration.DEFERRED, VideoDecoration.BACKGROUND]
+)
+def test_fetch_games_deferred_videos_use_transport(stub_server, videos):
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=stub_server.host_overrides
+        ) as transport:
+            games = await fetch_games(
+                [718096], transport=transport, videos=videos
+            )
+            # Looked up from a thread, as sync code using the game would
+            return await asyncio.to_thread(
+                lambda: games[718096].play_video_by_play_id
+            )
+
+    play_video_by_play_id = asyncio.run(fetch())
+    assert play_video_by_play_id
+    assert stub_server.hits["POST /graphql"] == 1
+
+
+def test_deferred_videos_looked_up_in_loop(stub_server):
+    async def fetch(get_videos):
+        async with AiohttpTransport(
+            host_overrides=stub_server.host_overrides
+        ) as transport:
+            game = await GameRequest(
+                718096, videos=VideoDecoration.DEFERRED
+            ).make_request_async(transport)
+            play_videos = game._extra_fields["play_videos"]
+            with pytest.raises(RuntimeError):
+                play_videos.get()
+            if get_videos:
+                await play_videos.get_async()
+            return game
+
+    game = asyncio.run(fetch(True))
+    assert game.play_video_by_play_id
+    assert stub_server.hits["POST /graphql"] == 1
+
+    unfetched = asyncio.run(fetch(False))
+    # Not sent to another host once the loop of the transport is gone
+    with pytest.raises(RuntimeError):
+        unfetched.play_video_by_play_id
+    assert stub_server.hits["POST /graphql"] == 1
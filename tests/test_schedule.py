@@ -0,0 +1,62 @@
+from mlb_statsapi import (AiohttpTransport, GameState, ScheduleRequest,
+                          iter_scheduled_games)
+from stub_server import schedule_entry
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def schedule_server(stub_server):
+    stub_server.schedule += [
+        schedule_entry(1, "2023-05-03", "Final", "Postponed"),
+        schedule_entry(2, "2023-05-04", "Preview", "Scheduled"),
+        schedule_entry(3, "2023-05-05", "Final", "Final", game_type="S"),
+        schedule_entry(4, "2022-05-05"),
+    ]
+    return stub_server
+
+
+def test_schedule_request(schedule_server, stub_transport):
+    schedule = ScheduleRequest(
+        "2023-05-01", "2023-05-31", transport=stub_transport
+    ).make_request()
+    assert schedule.game_pks() == [718322, 718263, 718096]
+    assert schedule.game_pks(None) == [718322, 2, 718263, 718096]
+    assert schedule.game_pks([GameState.PREVIEW]) == [2]
+    assert {game.game_pk: game.is_final for game in schedule.games} == {
+        718322: True,
+        1: False,
+        2: False,
+        718263: True,
+        718096: True,
+    }
+    assert not any(game.field_errors for game in schedule.games)
+
+    season = ScheduleRequest(
+        season=2023, game_types=["R", "S"], transport=stub_transport
+    ).make_request()
+    assert sorted(season.game_pks()) == [3, *schedule_server.game_pks]
+
+    with pytest.raises(ValueError):
+        ScheduleRequest()
+
+
+def test_iter_scheduled_games(schedule_server):
+    async def fetch():
+        async with AiohttpTransport(
+            host_overrides=schedule_server.host_overrides
+        ) as transport:
+            return [
+                result
+                async for result in iter_scheduled_games(
+                    season=2023, concurrency=2, transport=transport
+                )
+            ]
+
+    results = asyncio.run(fetch())
+    assert sorted(game_pk for game_pk, _ in results) == (
+        schedule_server.game_pks
+    )
+    for game_pk, game in results:
+        assert game.game_pk == game_pk
+    assert schedule_server.hits["POST /graphql"] == len(results)
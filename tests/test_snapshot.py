@@ -0,0 +1,52 @@
+from mlb_statsapi import ROOT_KEY, Game, GameSnapshot, Metadata, Numeric
+from mlb_statsapi.snapshot import PITCH_COLUMNS, SWING_COLUMNS, write_snapshot
+import json
+import pickle
+import pandas as pd
+import pytest
+
+
+@pytest.mark.parametrize("game_pk", [718096, 718263, 718322, 718594])
+def test_snapshot_matches_game(tmp_path, game_pk):
+    with open(f"tests/game_data/{game_pk}.json") as f:
+        game = Game(json.load(f), Metadata(keys=[ROOT_KEY]))
+    path = write_snapshot(game, tmp_path / f"{game_pk}.snap")
+
+    with GameSnapshot(path) as snapshot:
+        assert snapshot.game_pk == game_pk
+        assert len(snapshot) == len(game.plays)
+        assert snapshot.play_ids == game.play_ids
+        pd.testing.assert_frame_equal(
+            snapshot.pitch_table(),
+            game.get_pitch_metrics_table(list(PITCH_COLUMNS)),
+        )
+        pd.testing.assert_frame_equal(
+            snapshot.swing_table(),
+            game.get_swing_metrics_table(list(SWING_COLUMNS)),
+        )
+
+        # Plays are only decoded when they are used
+        lazy_game = snapshot.game()
+        all_plays = lazy_game._raw["liveData"]["plays"]["allPlays"]
+        assert all_plays.decoded == 0
+        assert snapshot.play(3) == game.plays[3]
+        assert lazy_game.build_play(3) == game.plays[3]
+        assert all_plays.decoded == 1
+        play_events = snapshot.play_events(3)
+        assert play_events.stop - play_events.start == len(
+            game.plays[3].play_events
+        )
+
+        assert lazy_game == game
+        assert pickle.loads(pickle.dumps(lazy_game)) == game
+        float_game = snapshot.game(lazy=False, numeric=Numeric.FLOAT)
+        assert float_game.plays == Game(
+            game._raw, Metadata(keys=[ROOT_KEY]), numeric=Numeric.FLOAT
+        ).plays
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "game.json"
+    path.write_text('{"gamePk": 1}' + " " * 32)
+    with pytest.raises(ValueError, match="not a game snapshot"):
+        GameSnapshot(path)
@@ -0,0 +1,47 @@
+from mlb_statsapi import Game, GameRequest, GameStream
+from mlb_statsapi.streaming import JsonStream
+import io
+import json
+import pytest
+
+
+@pytest.mark.parametrize("game_pk", [718096, 718263])
+def test_streamed_plays_match_game(stub_server, stub_transport, game_pk):
+    game = GameRequest(game_pk, transport=stub_transport).make_request()
+    stream = GameRequest(game_pk, transport=stub_transport).stream()
+
+    assert list(stream) == game.plays
+    assert stream.game_pk == game_pk
+    assert "players" not in stream.raw["gameData"]
+    assert "currentPlay" not in stream.raw["liveData"]["plays"]
+    assert stream.raw["liveData"]["linescore"] == (
+        game._raw["liveData"]["linescore"]
+    )
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"a": [1, -2.5e3, "x\\"]{y", {"b": [true, null]}], "c": {}}',
+        '[[], {}, "\\u00e9", "ü中", 0]',
+    ],
+)
+def test_json_stream_across_chunks(document):
+    stream = JsonStream(io.BytesIO(document.encode()), chunk_size=1)
+    assert stream.read_value() == json.loads(document)
+
+    stream = JsonStream(io.BytesIO(document.encode()), chunk_size=1)
+    stream.skip_value()
+    assert stream.peek() == ""
+
+
+def test_game_stream_from_file():
+    path = "tests/game_data/718322.json"
+    with open(path) as f:
+        raw = json.load(f)
+
+    stream = GameStream.from_file(path, lazy=True)
+    play_ids = [play_id for play in stream for play_id in play.play_ids]
+
+    assert play_ids == Game(raw).play_ids
+    assert stream.f.closed
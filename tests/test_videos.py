@@ -0,0 +1,76 @@
+from mlb_statsapi import GameRequest, PlayVideoRequest, VideoResolver
+from mlb_statsapi.cache import ResponseCache
+import pytest
+
+
+def test_resolver_matches_play_video_requests(stub_server, stub_transport):
+    resolved = VideoResolver(transport=stub_transport).resolve(
+        stub_server.game_pks
+    )
+    assert list(resolved) == stub_server.game_pks
+    for game_pk, play_videos in resolved.items():
+        expected = PlayVideoRequest(
+            game_pk, transport=stub_transport
+        ).make_request()
+        assert play_videos.video_url_by_play_id == (
+            expected.video_url_by_play_id
+        )
+
+
+def test_resolver_batches_games(stub_server, stub_transport):
+    VideoResolver(transport=stub_transport).resolve(stub_server.game_pks)
+    assert stub_server.hits["POST /graphql"] == 1
+    assert stub_server.video_queries == len(stub_server.game_pks)
+
+    stub_server.hits.clear()
+    VideoResolver(transport=stub_transport, batch_size=1).resolve(
+        stub_server.game_pks
+    )
+    assert stub_server.hits["POST /graphql"] == len(stub_server.game_pks)
+
+
+@pytest.mark.parametrize("page_size", [7, 50])
+def test_resolver_pages(stub_server, stub_transport, page_size):
+    game_pk = stub_server.game_pks[0]
+    play_videos = VideoResolver(
+        transport=stub_transport, page_size=page_size
+    ).resolve([game_pk])[game_pk]
+    expected = PlayVideoRequest(
+        game_pk, max_videos=page_size, transport=stub_transport
+    ).make_request()
+    total = len(stub_server.videos[str(game_pk)])
+    assert len(play_videos.video_url_by_play_id) == total
+    assert len(expected.play_videos) == total
+    assert play_videos.video_url_by_play_id == expected.video_url_by_play_id
+
+
+def test_resolver_cache(stub_server, stub_transport, tmp_path):
+    cache = ResponseCache(tmp_path)
+    first = VideoResolver(transport=stub_transport, cache=cache).resolve(
+        stub_server.game_pks
+    )
+    stub_server.hits.clear()
+    second = VideoResolver(transport=stub_transport, cache=cache).resolve(
+        stub_server.game_pks
+    )
+    assert not stub_server.hits
+    for game_pk in stub_server.game_pks:
+        assert second[game_pk].video_url_by_play_id == (
+            first[game_pk].video_url_by_play_id
+        )
+
+
+def test_game_request_with_resolved_videos(stub_server, stub_transport):
+    game_pk = stub_server.game_pks[0]
+    play_videos = VideoResolver(transport=stub_transport).resolve(
+        [game_pk]
+    )[game_pk]
+    stub_server.hits.clear()
+    game = GameRequest(
+        game_pk, transport=stub_transport, play_videos=play_videos
+    ).make_request()
+    assert "POST /graphql" not in stub_server.hits
+    assert game.play_video_by_play_id
+    assert play_videos.video_url_by_play_id is (
+        play_videos.video_url_by_play_id
+    )